@@ -4,6 +4,13 @@ import Hackathon from "../models/Hackathon.js";
 import Team from "../models/Team.js";
 import Post from "../models/Post.js";
 import Resource from "../models/Resource.js";
+import { invalidateAgentCache, TEAM_AGENT_RESOURCES } from "../services/agentService.js";
+
+// Ids of everyone on a team matching the query (agent-tools data is derived per team member)
+const teamMemberIds = async (query) => {
+  const teams = await Team.find(query).select("leader members");
+  return teams.flatMap((team) => [team.leader, ...team.members]);
+};
 
 /**
  * @desc    Get dashboard statistics
@@ -133,6 +140,12 @@ export const deleteUser = asyncHandler(async (req, res) => {
   }
 
   await User.findByIdAndDelete(req.params.id);
+  // Drop the user's own entries and their teammates' connections to them
+  invalidateAgentCache([req.params.id]);
+  invalidateAgentCache(
+    await teamMemberIds({ $or: [{ leader: req.params.id }, { members: req.params.id }] }),
+    ["connections"]
+  );
 
   res.json({ message: "User deleted successfully" });
 });
@@ -218,6 +231,7 @@ export const updateHackathon = asyncHandler(async (req, res) => {
     req.body,
     { new: true, runValidators: true }
   );
+  invalidateAgentCache(await teamMemberIds({ hackathon: req.params.id }), ["projects", "hackathons"]);
 
   res.json(updatedHackathon);
 });
@@ -236,6 +250,7 @@ export const deleteHackathon = asyncHandler(async (req, res) => {
   }
 
   await Hackathon.findByIdAndDelete(req.params.id);
+  invalidateAgentCache(await teamMemberIds({ hackathon: req.params.id }), TEAM_AGENT_RESOURCES);
 
   res.json({ message: "Hackathon deleted successfully" });
 });
@@ -1,8 +1,46 @@
 import asyncHandler from "express-async-handler";
+import mongoose from "mongoose";
 import User from "../models/User.js";
 import Hackathon from "../models/Hackathon.js";
 import Team from "../models/Team.js";
 
+const formatUserProfile = (user) => ({
+  id: user._id.toString(),
+  name: user.name,
+  email: user.email,
+  skills: user.skills || [],
+  bio: user.bio || "",
+  experience: user.experience || "",
+  interests: user.interests || [],
+  github: user.github || "",
+  resume: user.resume || "",
+  targetRole: user.targetRole || "Software Engineer",
+  createdAt: user.createdAt,
+  updatedAt: user.updatedAt
+});
+
+const formatProject = (team, userId) => ({
+  id: team._id.toString(),
+  name: team.name,
+  hackathon: {
+    id: team.hackathon._id.toString(),
+    name: team.hackathon.name,
+    theme: team.hackathon.theme,
+    description: team.hackathon.description,
+    prize: team.hackathon.prize,
+    difficulty: team.hackathon.difficulty,
+    location: team.hackathon.location,
+    date: team.hackathon.date,
+    endDate: team.hackathon.endDate
+  },
+  role: team.leader.toString() === userId ? "leader" : "member",
+  teamSize: team.members.length,
+  maxMembers: team.maxMembers,
+  inviteCode: team.inviteCode,
+  createdAt: team.createdAt,
+  updatedAt: team.updatedAt
+});
+
 /**
  * @desc    Get user profile for AI agents
  * @route   GET /api/agent-tools/user/:userId
@@ -20,20 +58,7 @@ export const getUserProfile = asyncHandler(async (req, res) => {
 
     res.json({
       success: true,
-      user: {
-        id: user._id.toString(),
-        name: user.name,
-        email: user.email,
-        skills: user.skills || [],
-        bio: user.bio || "",
-        experience: user.experience || "",
-        interests: user.interests || [],
-        github: user.github || "",
-        resume: user.resume || "",
-        targetRole: user.targetRole || "Software Engineer",
-        createdAt: user.createdAt,
-        updatedAt: user.updatedAt
-      }
+      user: formatUserProfile(user)
     });
   } catch (error) {
     console.error("Error getting user profile:", error);
@@ -58,27 +83,7 @@ export const getUserProjects = asyncHandler(async (req, res) => {
       ]
     }).populate('hackathon', 'name theme description prize difficulty location date endDate');
 
-    const projects = teams.map(team => ({
-      id: team._id.toString(),
-      name: team.name,
-      hackathon: {
-        id: team.hackathon._id.toString(),
-        name: team.hackathon.name,
-        theme: team.hackathon.theme,
-        description: team.hackathon.description,
-        prize: team.hackathon.prize,
-        difficulty: team.hackathon.difficulty,
-        location: team.hackathon.location,
-        date: team.hackathon.date,
-        endDate: team.hackathon.endDate
-      },
-      role: team.leader.toString() === userId ? "leader" : "member",
-      teamSize: team.members.length,
-      maxMembers: team.maxMembers,
-      inviteCode: team.inviteCode,
-      createdAt: team.createdAt,
-      updatedAt: team.updatedAt
-    }));
+    const projects = teams.map(team => formatProject(team, userId));
 
     res.json({
       success: true,
@@ -287,7 +292,7 @@ export const getAllUsers = asyncHandler(async (req, res) => {
  * @access  Public (used by Python AI service)
  */
 export const searchUsers = asyncHandler(async (req, res) => {
-  const { skills, interests, excludeId, limit = 20 } = req.body;
+  const { skills, interests, excludeId, limit = 20, offset = 0 } = req.body;
 
   try {
     let query = {};
@@ -304,8 +309,11 @@ export const searchUsers = asyncHandler(async (req, res) => {
       query.interests = { $in: interests };
     }
 
+    // Sorted by _id so callers can page through large result sets with offset
     const users = await User.find(query)
       .select("-password")
+      .sort({ _id: 1 })
+      .skip(parseInt(offset) || 0)
       .limit(parseInt(limit));
 
     const formattedUsers = users.map(user => ({
@@ -327,4 +335,117 @@ export const searchUsers = asyncHandler(async (req, res) => {
     console.error("Error searching users:", error);
     res.status(500).json({ error: "Failed to search users" });
   }
-});
\ No newline at end of file
+});
+
+// Largest number of ids accepted by one batch request
+const MAX_BATCH_IDS = 200;
+
+// Unique, valid ObjectId strings from req.body.userIds (null when the body is malformed)
+const parseBatchIds = (req) => {
+  const { userIds } = req.body;
+  if (!Array.isArray(userIds) || userIds.length > MAX_BATCH_IDS) {
+    return null;
+  }
+  return [...new Set(userIds.map(String))].filter(id => mongoose.Types.ObjectId.isValid(id));
+};
+
+/**
+ * @desc    Get many user profiles for AI agents (unknown ids are omitted)
+ * @route   POST /api/agent-tools/users/batch
+ * @access  Public (used by Python AI service)
+ */
+export const getUserProfilesBatch = asyncHandler(async (req, res) => {
+  const userIds = parseBatchIds(req);
+  if (!userIds) {
+    return res.status(400).json({ error: `userIds must be an array of at most ${MAX_BATCH_IDS} ids` });
+  }
+
+  try {
+    const users = await User.find({ _id: { $in: userIds } }).select("-password");
+    const profiles = {};
+    users.forEach(user => {
+      profiles[user._id.toString()] = formatUserProfile(user);
+    });
+
+    res.json({
+      success: true,
+      users: profiles,
+      count: users.length
+    });
+  } catch (error) {
+    console.error("Error getting user profiles batch:", error);
+    res.status(500).json({ error: "Failed to get user profiles" });
+  }
+});
+
+/**
+ * @desc    Get many users' skills for AI agents (unknown ids are omitted)
+ * @route   POST /api/agent-tools/skills/batch
+ * @access  Public (used by Python AI service)
+ */
+export const getUserSkillsBatch = asyncHandler(async (req, res) => {
+  const userIds = parseBatchIds(req);
+  if (!userIds) {
+    return res.status(400).json({ error: `userIds must be an array of at most ${MAX_BATCH_IDS} ids` });
+  }
+
+  try {
+    const users = await User.find({ _id: { $in: userIds } }).select("skills");
+    const skills = {};
+    users.forEach(user => {
+      skills[user._id.toString()] = user.skills || [];
+    });
+
+    res.json({
+      success: true,
+      skills,
+      count: users.length
+    });
+  } catch (error) {
+    console.error("Error getting user skills batch:", error);
+    res.status(500).json({ error: "Failed to get user skills" });
+  }
+});
+
+/**
+ * @desc    Get many users' projects for AI agents (every requested id gets a list)
+ * @route   POST /api/agent-tools/projects/batch
+ * @access  Public (used by Python AI service)
+ */
+export const getUserProjectsBatch = asyncHandler(async (req, res) => {
+  const userIds = parseBatchIds(req);
+  if (!userIds) {
+    return res.status(400).json({ error: `userIds must be an array of at most ${MAX_BATCH_IDS} ids` });
+  }
+
+  try {
+    const teams = await Team.find({
+      $or: [
+        { leader: { $in: userIds } },
+        { members: { $in: userIds } }
+      ]
+    }).populate('hackathon', 'name theme description prize difficulty location date endDate');
+
+    const projects = {};
+    userIds.forEach(userId => {
+      projects[userId] = [];
+    });
+    teams.forEach(team => {
+      const memberIds = new Set([team.leader, ...team.members].map(id => id.toString()));
+      memberIds.forEach(userId => {
+        if (projects[userId]) {
+          projects[userId].push(formatProject(team, userId));
+        }
+      });
+    });
+
+    res.json({
+      success: true,
+      projects,
+      count: teams.length
+    });
+  } catch (error) {
+    console.error("Error getting user projects batch:", error);
+    res.status(500).json({ error: "Failed to get user projects" });
+  }
+});
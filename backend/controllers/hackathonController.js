@@ -4,6 +4,7 @@ import mongoose from "mongoose";
 import Hackathon from "../models/Hackathon.js";
 import Team from "../models/Team.js";
 import User from "../models/User.js";
+import { invalidateAgentCache, TEAM_AGENT_RESOURCES } from "../services/agentService.js";
 
 /**
  * @desc    Create a new hackathon (Admin only)
@@ -299,6 +300,7 @@ export const joinHackathon = asyncHandler(async (req, res) => {
     team.members.push(userId);
     await team.save();
   }
+  invalidateAgentCache(team.members, TEAM_AGENT_RESOURCES);
 
   // Save hackathon changes (if any)
   await hackathon.save();
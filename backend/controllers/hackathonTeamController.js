@@ -3,6 +3,7 @@ import HackathonRegistration from "../models/HackathonRegistration.js";
 import Team from "../models/Team.js";
 import Hackathon from "../models/Hackathon.js";
 import User from "../models/User.js";
+import { invalidateAgentCache, TEAM_AGENT_RESOURCES } from "../services/agentService.js";
 
 /**
  * @desc    Register for a hackathon as solo participant
@@ -90,6 +91,7 @@ export const createTeam = asyncHandler(async (req, res) => {
     members: [userId],
     maxMembers: maxMembers || 5,
   });
+  invalidateAgentCache([userId], TEAM_AGENT_RESOURCES);
 
   // Update registration
   registration.role = "leader";
@@ -163,6 +165,7 @@ export const joinTeam = asyncHandler(async (req, res) => {
   // Add user to team
   team.members.push(userId);
   await team.save();
+  invalidateAgentCache(team.members, TEAM_AGENT_RESOURCES);
 
   // Update registration
   registration.role = "member";
@@ -218,6 +221,7 @@ export const leaveTeam = asyncHandler(async (req, res) => {
     (memberId) => memberId.toString() !== userId.toString()
   );
   await team.save();
+  invalidateAgentCache([...team.members, userId], TEAM_AGENT_RESOURCES);
 
   // Update registration to solo
   registration.role = "solo";
@@ -276,6 +280,7 @@ export const removeMember = asyncHandler(async (req, res) => {
   // Remove member from team
   team.members = team.members.filter((m) => m.toString() !== memberId);
   await team.save();
+  invalidateAgentCache([...team.members, memberId], TEAM_AGENT_RESOURCES);
 
   // Update member's registration
   const memberRegistration = await HackathonRegistration.findOne({
@@ -350,6 +355,7 @@ export const transferLeadership = asyncHandler(async (req, res) => {
   // Update team leader
   team.leader = newLeaderId;
   await team.save();
+  invalidateAgentCache(team.members, TEAM_AGENT_RESOURCES);
 
   // Update registrations
   registration.role = "member";
@@ -412,6 +418,7 @@ export const deleteTeam = asyncHandler(async (req, res) => {
 
   // Delete the team
   await Team.findByIdAndDelete(team._id);
+  invalidateAgentCache(memberIds, TEAM_AGENT_RESOURCES);
 
   res.status(200).json({
     message: "Team deleted successfully. All members are now solo participants.",
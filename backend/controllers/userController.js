@@ -3,6 +3,8 @@
 import asyncHandler from "express-async-handler";
 import jwt from "jsonwebtoken";
 import User from "../models/User.js"; // adjust path/casing to your file
+import Team from "../models/Team.js";
+import { invalidateAgentCache } from "../services/agentService.js";
 // Note: do NOT import bcrypt here — user model will hash passwords in pre-save
 
 const generateToken = (id) => {
@@ -260,6 +262,10 @@ export const updateProfile = asyncHandler(async (req, res) => {
   }
 
   await user.save();
+  invalidateAgentCache([userId], ["profile", "skills"]);
+  // Teammates' connections embed this user's name, skills and bio
+  const teams = await Team.find({ $or: [{ leader: userId }, { members: userId }] }).select("leader members");
+  invalidateAgentCache(teams.flatMap((team) => [team.leader, ...team.members]), ["connections"]);
 
   const updated = await User.findById(userId)
     .select("-password -__v -tokens -resetPasswordToken -emailVerificationToken");
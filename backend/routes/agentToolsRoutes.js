@@ -6,11 +6,19 @@ import {
   getUserConnections,
   getUserSkills,
   getAllUsers,
-  searchUsers
+  searchUsers,
+  getUserProfilesBatch,
+  getUserSkillsBatch,
+  getUserProjectsBatch
 } from "../controllers/agentToolsController.js";
 
 const router = express.Router();
 
+// Batch lookups by user id (body: { userIds: [...] })
+router.post("/users/batch", getUserProfilesBatch);
+router.post("/skills/batch", getUserSkillsBatch);
+router.post("/projects/batch", getUserProjectsBatch);
+
 // User profile
 router.get("/user/:userId", getUserProfile);
 
@@ -298,3 +298,35 @@ export const checkServiceHealth = async () => {
     return false;
   }
 };
+
+// Agent-tools data derived from team membership (see agentToolsController)
+export const TEAM_AGENT_RESOURCES = ["projects", "hackathons", "connections"];
+
+/**
+ * Drop the Python service's cached agent-tools data for users whose records changed.
+ * Fire-and-forget: failures are logged, never thrown (the cache TTLs bound staleness)
+ * @param {Array} userIds - Ids of the users whose data changed
+ * @param {Array<string>} resources - Optional subset of profile, skills, projects, hackathons, connections
+ */
+export const invalidateAgentCache = (userIds, resources) => {
+  const token = process.env.AGENT_SERVICE_TOKEN;
+  const ids = [...new Set(userIds.filter(Boolean).map(String))];
+  if (!token || ids.length === 0) return;
+
+  fetch(`${PYTHON_SERVICE_URL}/api/agent/cache/invalidate`, {
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json",
+      "X-Agent-Service-Token": token,
+    },
+    body: JSON.stringify({ user_ids: ids, resources }),
+  })
+    .then((response) => {
+      if (!response.ok) {
+        console.error(`Agent cache invalidation failed: HTTP ${response.status}`);
+      }
+    })
+    .catch((error) => {
+      console.error("Agent cache invalidation failed:", error.message);
+    });
+};
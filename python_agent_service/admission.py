@@ -0,0 +1,199 @@
+"""
+Admission Control
+Per-route-class concurrency limits for the expensive endpoints (LangGraph
+workflows, resume/GitHub analysis): a bounded wait queue served round-robin
+across users, a per-user cap so one user cannot hold every slot, and fast
+rejection with a Retry-After estimate when the queue is full
+"""
+
+import os
+import math
+import time
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Deque, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Route class -> (concurrent slots, wait queue size, per-user cap, queue timeout seconds)
+ROUTE_CLASS_DEFAULTS = {
+    "workflow": (4, 16, 2, 30.0),
+    "analysis": (8, 32, 3, 20.0),
+}
+
+
+class AdmissionRejected(Exception):
+    """Request refused by admission control; surfaced as 503 with Retry-After"""
+
+    def __init__(self, route_class: str, reason: str, retry_after: int):
+        super().__init__(f"{route_class} capacity exhausted ({reason}), retry in {retry_after}s")
+        self.route_class = route_class
+        self.reason = reason  # queue_full, user_share, queue_timeout
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Concurrency limiter for one route class (event-loop only, no locking)
+
+    Waiters are kept per user and served round-robin, so a user with many
+    queued requests only gets every n-th free slot while others are waiting.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, max_per_user: int,
+                 queue_timeout: float):
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.max_per_user = max(1, max_per_user)
+        self.queue_timeout = queue_timeout
+        self._active = 0
+        self._active_by_user: Dict[str, int] = {}
+        self._waiting: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._queued = 0
+        self._avg_hold = 1.0
+        self._counters = {
+            "admitted": 0, "queued_total": 0, "rejected_queue_full": 0,
+            "rejected_user_share": 0, "rejected_queue_timeout": 0
+        }
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free: average hold time x queue turns ahead"""
+        turns = (self._queued + 1) / self.max_concurrent
+        return max(1, min(120, math.ceil(self._avg_hold * turns)))
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        self._counters[f"rejected_{reason}"] += 1
+        return AdmissionRejected(self.name, reason, self.retry_after())
+
+    def _grant(self, user: str):
+        self._active += 1
+        self._active_by_user[user] = self._active_by_user.get(user, 0) + 1
+        self._counters["admitted"] += 1
+
+    def _dispatch(self):
+        """Hand free slots to waiting users, one request per user per turn"""
+        while self._active < self.max_concurrent and self._waiting:
+            user, waiters = next(iter(self._waiting.items()))
+            future = waiters.popleft()
+            if waiters:
+                self._waiting.move_to_end(user)
+            else:
+                del self._waiting[user]
+            self._queued -= 1
+            if future.done():
+                continue
+            self._grant(user)
+            future.set_result(True)
+
+    def _forget(self, user: str, future: asyncio.Future):
+        waiters = self._waiting.get(user)
+        if waiters and future in waiters:
+            waiters.remove(future)
+            self._queued -= 1
+            if not waiters:
+                del self._waiting[user]
+
+    async def acquire(self, user: str):
+        """
+        Wait for a slot
+
+        Raises:
+            AdmissionRejected: Queue full, user over its share, or no slot within queue_timeout
+        """
+        waiting = len(self._waiting.get(user, ()))
+        if self._active_by_user.get(user, 0) + waiting >= self.max_per_user:
+            raise self._reject("user_share")
+        if self._active < self.max_concurrent and not self._queued:
+            self._grant(user)
+            return
+        if self._queued >= self.max_queue:
+            raise self._reject("queue_full")
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault(user, deque()).append(future)
+        self._queued += 1
+        self._counters["queued_total"] += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                self.release(user)  # slot was granted as we gave up
+            else:
+                self._forget(user, future)
+                future.cancel()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise self._reject("queue_timeout")
+
+    def release(self, user: str, held: Optional[float] = None):
+        self._active -= 1
+        remaining = self._active_by_user.get(user, 1) - 1
+        if remaining:
+            self._active_by_user[user] = remaining
+        else:
+            self._active_by_user.pop(user, None)
+        if held is not None:
+            self._avg_hold = 0.8 * self._avg_hold + 0.2 * held
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, user: str):
+        await self.acquire(user)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(user, time.monotonic() - started)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "max_per_user": self.max_per_user,
+            "active": self._active,
+            "queued": self._queued,
+            "users_active": len(self._active_by_user),
+            "avg_hold_s": round(self._avg_hold, 3),
+            **self._counters
+        }
+
+
+class AdmissionControl:
+    """One controller per route class, sized from ADMISSION_<CLASS>_* env vars"""
+
+    def __init__(self, enabled: bool = ADMISSION_ENABLED):
+        self.enabled = enabled
+        self.controllers: Dict[str, AdmissionController] = {}
+        for name, (concurrent, queue, per_user, timeout) in ROUTE_CLASS_DEFAULTS.items():
+            prefix = f"ADMISSION_{name.upper()}"
+            self.controllers[name] = AdmissionController(
+                name,
+                int(os.getenv(f"{prefix}_CONCURRENCY", str(concurrent))),
+                int(os.getenv(f"{prefix}_MAX_QUEUE", str(queue))),
+                int(os.getenv(f"{prefix}_PER_USER", str(per_user))),
+                float(os.getenv(f"{prefix}_QUEUE_TIMEOUT", str(timeout)))
+            )
+
+    @asynccontextmanager
+    async def slot(self, route_class: str, user: str):
+        """Hold a slot of route_class for the block (no-op when admission control is disabled)"""
+        if not self.enabled:
+            yield
+            return
+        async with self.controllers[route_class].slot(user):
+            yield
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            **{name: controller.stats() for name, controller in self.controllers.items()}
+        }
+
+
+# Global instance
+admission_control = AdmissionControl()
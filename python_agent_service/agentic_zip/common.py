@@ -1,13 +1,21 @@
 
-import os, json, re
+import sys, json, re
+from pathlib import Path
 from typing import List, Dict, Any, Optional, Literal, Tuple
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from dataclasses import dataclass
-from tenacity import retry, stop_after_attempt, wait_exponential
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Shared service runtime (llm_calls, ...) lives in python_agent_service/
+_SERVICE_ROOT = str(Path(__file__).resolve().parent.parent)
+if _SERVICE_ROOT not in sys.path:
+    sys.path.append(_SERVICE_ROOT)
+
+from llm_calls import call_llm, call_llm_json
+from structured_output import StructuredOutputError
+
 class AgentTrace(BaseModel):
     steps: List[str] = Field(default_factory=list, description="Transparent reasoning steps for the user")
 
@@ -40,6 +48,23 @@ class MentorRecommendation(BaseModel):
     mentors: List[Mentor]
     trace: AgentTrace
 
+class EvaluationResult(BaseModel):
+    decision: Literal["approved", "not approved"]
+    reason: str = ""
+
+    @field_validator("decision", mode="before")
+    @classmethod
+    def _normalize_decision(cls, value: Any) -> Any:
+        return value.strip().lower().replace("_", " ") if isinstance(value, str) else value
+
+class TaskAssignment(BaseModel):
+    member: str
+    tasks: List[str] = []
+
+class TechChoice(BaseModel):
+    tool: str
+    reason: str = ""
+
 
 def load_users(path: str) -> List[Dict[str, Any]]:
     with open(path, "r") as f:
@@ -79,32 +104,6 @@ def simple_route(user_input: str) -> str:
 
 
 
-def _use_gemini() -> bool:
-    return bool(os.getenv("GOOGLE_API_KEY"))
-
-def _use_openai() -> bool:
-    return bool(os.getenv("OPENAI_API_KEY"))
-
-@retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=1, max=4))
-def call_llm(prompt: str) -> str:
-    """Call Gemini if available, else OpenAI, else mock LLM."""
-    if _use_gemini():
-        import google.generativeai as genai
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        model = genai.GenerativeModel(model_name=os.getenv("GEMINI_MODEL", "gemini-2.5-flash"))
-        resp = model.generate_content(prompt)
-        return getattr(resp, "text", "") or "[Gemini returned empty]"
-    if _use_openai():
-        from openai import OpenAI
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-        resp = client.chat.completions.create(model=model, messages=[{"role": "user", "content": prompt}])
-        return resp.choices[0].message.content
-    # Mock fallback
-    return f"[mock-llm] {prompt[:160]}..."
-
-
-
 def tool_matchmake(payload: Dict[str, Any], users_path: str) -> MatchResult:
     skills = [s.lower() for s in payload.get("skills", [])]
     desired = [s.lower() for s in payload.get("desired", skills)]
@@ -284,23 +283,17 @@ def tool_evaluate(state: HackathonState) -> HackathonState:
     """
 
     try:
-        response = call_llm(f"{system_message}\n\n{user_prompt}")
-
-        
-        decision, reason = None, None
-        if "approved" in response.lower():
-            decision = "approved"
-        elif "not approved" in response.lower():
-            decision = "not approved"
-
-        
-        if "reason" in response.lower():
-            try:
-                parsed = json.loads(response)
-                decision = parsed.get("decision", decision)
-                reason = parsed.get("reason", None)
-            except Exception:
-                reason = response.strip()
+        try:
+            result = call_llm_json(f"{system_message}\n\n{user_prompt}", "hackathon_evaluate", EvaluationResult)
+            decision, reason = result.decision, result.reason
+        except StructuredOutputError as e:
+            # No usable JSON: fall back to reading the decision out of the text
+            response = e.text.lower()
+            decision, reason = None, e.text.strip() or None
+            if "not approved" in response:
+                decision = "not approved"
+            elif "approved" in response:
+                decision = "approved"
 
         state.evaluation = decision or "not approved"
         state.evaluation_reason = reason or "No explanation provided by LLM."
@@ -341,7 +334,8 @@ def tool_optimize(state: HackathonState) -> HackathonState:
     """
 
     try:
-        refined = call_llm(f"{system_message}\n\n{user_prompt}")
+        # Refinement loops are background work; coach chat goes ahead of them
+        refined = call_llm(f"{system_message}\n\n{user_prompt}", priority="background")
         if refined and isinstance(refined, str):
             state.project_idea = refined.strip()
         else:
@@ -477,10 +471,8 @@ def tool_team_dynamics(state: HackathonState) -> dict:
           {{"member": "Isha", "tasks": ["UI design"]}}
         ]
         """
-        response = call_llm(prompt)
-        parsed = json.loads(response)
-        if isinstance(parsed, list):
-            dynamics = parsed
+        assignments = call_llm_json(prompt, "hackathon_team_dynamics", TaskAssignment, many=True)
+        dynamics = [assignment.model_dump() for assignment in assignments]
     except Exception:
        
         dynamics = []
@@ -518,16 +510,15 @@ def tool_tech_stack(state: HackathonState) -> dict:
     """
 
     try:
-        response = call_llm(prompt)
-
-        
-        parsed = json.loads(response)
-        if isinstance(parsed, list) and all(isinstance(item, dict) for item in parsed):
-            stack = parsed
-        else:
-            
+        try:
+            choices = call_llm_json(prompt, "hackathon_tech_stack", TechChoice, many=True)
+            stack = [choice.model_dump() for choice in choices]
+        except StructuredOutputError as e:
+            if e.stage == "extract":
+                raise
+            # A JSON list of the wrong shape: fall back to "tool - reason" lines
             stack = []
-            for line in response.split("\n"):
+            for line in e.text.split("\n"):
                 if "-" in line:
                     parts = line.split("-", 1)
                     stack.append({"tool": parts[0].strip(), "reason": parts[1].strip()})
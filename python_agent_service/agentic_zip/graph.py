@@ -1,21 +1,22 @@
-
 from typing import Dict, Any, TypedDict, Optional
+from functools import lru_cache
 from pydantic import BaseModel
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
-from langchain_community.chat_message_histories import ChatMessageHistory
-from langgraph.checkpoint.sqlite import SqliteSaver
-import sqlite3
-from langsmith import Client
-import os
-
 
-client = Client(api_key=os.getenv("LANGCHAIN_API_KEY"))
-
-from common import (
-    ChatResponse, MatchResult, MentorRecommendation, AgentTrace,
-    simple_route, call_llm, tool_matchmake, tool_mentor
-)
+try:
+    # Loaded by the service as matcher_common (career_agent ships its own common.py)
+    from matcher_common import (
+        ChatResponse, MatchResult, MentorRecommendation, AgentTrace,
+        simple_route, call_llm, tool_matchmake, tool_mentor
+    )
+except ImportError:
+    from common import (
+        ChatResponse, MatchResult, MentorRecommendation, AgentTrace,
+        simple_route, call_llm, tool_matchmake, tool_mentor
+    )
+from metrics import timed_node
+from checkpoints import get_checkpointer
 
 class AgentState(TypedDict, total=False):
     user_input: str
@@ -23,7 +24,7 @@ class AgentState(TypedDict, total=False):
     output: Dict[str, Any]
     route: str
     trace: list
-    chat_history: ChatMessageHistory
+    chat_history: Any  # langchain_community ChatMessageHistory, imported on the first chat turn
 
 def node_router(state: AgentState) -> AgentState:
     text = state.get("user_input", "")
@@ -39,6 +40,8 @@ def node_router(state: AgentState) -> AgentState:
 #     return state
 
 def node_chat(state: AgentState) -> AgentState:
+    from langchain_community.chat_message_histories import ChatMessageHistory
+
     user_text = state.get("user_input", "")
     chat_history: ChatMessageHistory = state.get("chat_history", ChatMessageHistory())
 
@@ -76,10 +79,10 @@ def route_decider(state: AgentState) -> str:
 
 def build_workflow() -> StateGraph:
     builder = StateGraph(AgentState)
-    builder.add_node("router", node_router)
-    builder.add_node("chat", node_chat)
+    builder.add_node("router", timed_node("agent", "router", node_router))
+    builder.add_node("chat", timed_node("agent", "chat", node_chat))
     # builder.add_node("matchmake", node_matchmake)
-    builder.add_node("mentor", node_mentor)
+    builder.add_node("mentor", timed_node("agent", "mentor", node_mentor))
 
     builder.set_entry_point("router")
     builder.add_conditional_edges(
@@ -97,29 +100,39 @@ def build_workflow() -> StateGraph:
 
     return builder
 
+@lru_cache(maxsize=1)
+def get_workflow() -> StateGraph:
+    """Chat/mentor workflow builder, wired once per process"""
+    return build_workflow()
+
+@lru_cache(maxsize=1)
 def get_graph():
+    """
+    Compiled chat/mentor graph (state lives in the checkpointer)
+
+    Compiled once per process and shared by every worker thread; the
+    checkpointer serializes access to its SQLite connection.
+    """
     # memory = MemorySaver()
     # workflow = build_workflow().compile(checkpointer=memory)
     # return workflow
-    conn = sqlite3.connect("checkpoints.sqlite", check_same_thread=False)
-    checkpointer = SqliteSaver(conn)
-    workflow = build_workflow().compile(checkpointer=checkpointer)
-    return workflow
+    return get_workflow().compile(checkpointer=get_checkpointer())
 
 
 
 
-from langgraph.graph import StateGraph, END
-from common import (
-    HackathonState,
-    node_matchmake,
-    tool_project_ideas,
-    tool_evaluate,
-    tool_optimize,
-    tool_strategy_plan,
-    tool_team_dynamics, 
-    tool_tech_stack
-)
+# The hackathon graph uses common's node_matchmake (HackathonState), not the one above
+try:
+    from matcher_common import (
+        HackathonState, node_matchmake, tool_project_ideas, tool_evaluate,
+        tool_optimize, tool_strategy_plan, tool_team_dynamics, tool_tech_stack
+    )
+except ImportError:
+    from common import (
+        HackathonState, node_matchmake, tool_project_ideas, tool_evaluate,
+        tool_optimize, tool_strategy_plan, tool_team_dynamics, tool_tech_stack
+    )
+
 def resolve_evaluation(state: HackathonState) -> str:
     """Return edge key based on evaluation result."""
     return state.evaluation or "not approved"
@@ -128,13 +141,13 @@ def build_hackathon_graph():
     graph = StateGraph(HackathonState)
 
    
-    graph.add_node("matchmake", node_matchmake)
-    graph.add_node("ideas", tool_project_ideas)
-    graph.add_node("evaluate", tool_evaluate)
-    graph.add_node("optimize", tool_optimize)
-    graph.add_node("strategy_plan", tool_strategy_plan) 
-    graph.add_node("team_dynamics", tool_team_dynamics)
-    graph.add_node("tech_stack", tool_tech_stack)
+    graph.add_node("matchmake", timed_node("hackathon", "matchmake", node_matchmake))
+    graph.add_node("ideas", timed_node("hackathon", "ideas", tool_project_ideas))
+    graph.add_node("evaluate", timed_node("hackathon", "evaluate", tool_evaluate))
+    graph.add_node("optimize", timed_node("hackathon", "optimize", tool_optimize))
+    graph.add_node("strategy_plan", timed_node("hackathon", "strategy_plan", tool_strategy_plan)) 
+    graph.add_node("team_dynamics", timed_node("hackathon", "team_dynamics", tool_team_dynamics))
+    graph.add_node("tech_stack", timed_node("hackathon", "tech_stack", tool_tech_stack))
     graph.add_edge("matchmake", "ideas")
     graph.add_edge("ideas", "evaluate")
 
@@ -159,3 +172,9 @@ def build_hackathon_graph():
     compiled = graph.compile()
 
     return compiled
+
+
+@lru_cache(maxsize=1)
+def get_hackathon_graph():
+    """Compiled hackathon graph, built once per process"""
+    return build_hackathon_graph()
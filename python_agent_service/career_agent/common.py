@@ -1,22 +1,33 @@
 import os
+import sys
 import json
-import re
+import asyncio
+import time
 import requests
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Literal, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from dataclasses import dataclass
-from tenacity import retry, stop_after_attempt, wait_exponential
+from concurrent.futures import Future, wait as wait_futures, FIRST_COMPLETED
 from dotenv import load_dotenv
 
-# PDF support - optional import
-try:
-    import fitz  # PyMuPDF for PDF text extraction
-    HAS_PDF_SUPPORT = True
-except ImportError:
-    HAS_PDF_SUPPORT = False
+# PDF support - optional, PyMuPDF is imported on first use
+import importlib.util
+HAS_PDF_SUPPORT = importlib.util.find_spec("fitz") is not None
 
 load_dotenv()
 
+# Shared service runtime (llm_calls, ...) lives in python_agent_service/
+_SERVICE_ROOT = str(Path(__file__).resolve().parent.parent)
+if _SERVICE_ROOT not in sys.path:
+    sys.path.append(_SERVICE_ROOT)
+
+from llm_calls import call_llm_json, acall_llm_json
+from tracing import span
+from prompt_budget import budget_text, compact_json, compact_resume
+from structured_output import StructuredOutputError
+from executors import run_io, fanout_executor, ExecutorSaturatedError
+
 # ============ Data Models ============
 
 class Skill(BaseModel):
@@ -88,6 +99,27 @@ class CareerRole(BaseModel):
     experience_level: Literal["entry", "mid", "senior"]
     description: str
 
+class ParsedResume(BaseModel):
+    """Structure requested from the LLM by parse_resume_text (extra fields are kept)"""
+    model_config = ConfigDict(extra="allow")
+
+    name: Optional[str] = ""
+    email: Optional[str] = ""
+    education: List[Any] = []
+    skills: Union[Dict[str, Any], List[Any]] = Field(default_factory=lambda: {
+        "languages": [],
+        "frameworks": [],
+        "tools": [],
+        "soft_skills": []
+    })
+    projects: List[Any] = []
+    experience: List[Any] = []
+    certifications: List[Any] = []
+    achievements: List[Any] = []
+    github: Optional[str] = ""
+    linkedin: Optional[str] = ""
+    career_summary: Optional[str] = ""
+
 # ============ State Models ============
 
 class CareerAgentState(BaseModel):
@@ -121,30 +153,6 @@ def load_json_data(path: str) -> List[Dict[str, Any]]:
     except FileNotFoundError:
         return []
 
-def _use_gemini() -> bool:
-    return bool(os.getenv("GOOGLE_API_KEY"))
-
-def _use_openai() -> bool:
-    return bool(os.getenv("OPENAI_API_KEY"))
-
-@retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=1, max=4))
-def call_llm(prompt: str) -> str:
-    """Call Gemini if available, else OpenAI, else mock LLM."""
-    if _use_gemini():
-        import google.generativeai as genai
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        model = genai.GenerativeModel(model_name=os.getenv("GEMINI_MODEL", "gemini-2.5-flash"))
-        resp = model.generate_content(prompt)
-        return getattr(resp, "text", "") or "[Gemini returned empty]"
-    if _use_openai():
-        from openai import OpenAI
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-        resp = client.chat.completions.create(model=model, messages=[{"role": "user", "content": prompt}])
-        return resp.choices[0].message.content
-    # Mock fallback
-    return f"[mock-llm] {prompt[:160]}..."
-
 # ============ PDF Extraction ============
 
 def extract_text_from_pdf(pdf_path: str) -> Dict[str, Any]:
@@ -153,6 +161,8 @@ def extract_text_from_pdf(pdf_path: str) -> Dict[str, Any]:
         return {"error": "PDF support not available. Install PyMuPDF: pip install PyMuPDF"}
     
     try:
+        import fitz  # PyMuPDF for PDF text extraction
+
         text = ""
         pdf = fitz.open(pdf_path)
         page_count = len(pdf)
@@ -255,11 +265,14 @@ def extract_github_data(username: str) -> Dict[str, Any]:
 def _extract_basic_github_data(username: str) -> Dict[str, Any]:
     """Fallback basic GitHub data extraction"""
     try:
-        user_url = f"https://api.github.com/users/{username}"
-        repos_url = f"https://api.github.com/users/{username}/repos"
+        api_url = os.getenv("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+        user_url = f"{api_url}/users/{username}"
+        repos_url = f"{api_url}/users/{username}/repos"
         
-        user_resp = requests.get(user_url, timeout=10)
-        repos_resp = requests.get(repos_url, timeout=10)
+        with span(f"/users/{username}", "github"):
+            user_resp = requests.get(user_url, timeout=10)
+        with span(f"/users/{username}/repos", "github"):
+            repos_resp = requests.get(repos_url, timeout=10)
         
         if user_resp.status_code != 200 or repos_resp.status_code != 200:
             return {"error": "Failed to fetch GitHub data"}
@@ -291,7 +304,7 @@ def parse_resume_text(resume_text: str) -> Dict[str, Any]:
     Parse this resume and extract structured information in the EXACT JSON format below:
 
     Resume Text:
-    {resume_text}
+    {budget_text("parse_resume", resume_text)}
 
     Return a JSON object with this EXACT structure:
     {{
@@ -338,40 +351,12 @@ def parse_resume_text(resume_text: str) -> Dict[str, Any]:
     """
     
     try:
-        response = call_llm(prompt)
-        json_match = re.search(r'\{.*\}', response, re.DOTALL)
-        if json_match:
-            parsed_data = json.loads(json_match.group())
-            
-            # Ensure all required fields exist
-            required_structure = {
-                "name": "",
-                "email": "",
-                "education": [],
-                "skills": {
-                    "languages": [],
-                    "frameworks": [],
-                    "tools": [],
-                    "soft_skills": []
-                },
-                "projects": [],
-                "experience": [],
-                "certifications": [],
-                "achievements": [],
-                "github": "",
-                "linkedin": "",
-                "career_summary": ""
-            }
-            
-            # Merge parsed data with required structure
-            for key, default_value in required_structure.items():
-                if key not in parsed_data:
-                    parsed_data[key] = default_value
-            
-            return parsed_data
-            
-        return {"error": "Could not parse resume - no JSON found in response"}
-    except json.JSONDecodeError as e:
+        # Validation fills in any missing required fields with their defaults
+        parsed = call_llm_json(prompt, "parse_resume", ParsedResume, cache=True)
+        return parsed.model_dump()
+    except StructuredOutputError as e:
+        if e.stage == "extract":
+            return {"error": "Could not parse resume - no JSON found in response"}
         return {"error": f"Invalid JSON in resume parsing: {str(e)}"}
     except Exception as e:
         return {"error": f"Resume parsing error: {str(e)}"}
@@ -567,6 +552,14 @@ def match_mentors_node(state: CareerAgentState) -> CareerAgentState:
 
 # ============ ATS Analysis & Enhancement Functions ============
 
+# Section prompts fan out concurrently; cap and per-section timeout are tunable
+SECTION_ENHANCEMENT_CONCURRENCY = int(os.getenv("SECTION_ENHANCEMENT_CONCURRENCY", "4"))
+SECTION_ENHANCEMENT_TIMEOUT = float(os.getenv("SECTION_ENHANCEMENT_TIMEOUT", "45"))
+
+# "per_section": one prompt per section + ATS; "batched": ATS and all sections in one prompt
+RESUME_ANALYSIS_MODES = ("per_section", "batched")
+RESUME_ANALYSIS_MODE = os.getenv("RESUME_ANALYSIS_MODE", "per_section")
+
 class ATSScore(BaseModel):
     overall_score: float = Field(ge=0, le=100, description="Overall ATS score 0-100")
     section_scores: Dict[str, float] = {}
@@ -588,14 +581,13 @@ class EnhancedResumeAnalysis(BaseModel):
     section_enhancements: List[SectionEnhancement] = []
     overall_recommendations: List[str] = []
 
-def analyze_ats_score(resume_data: Dict[str, Any], target_role: str = "Software Engineer") -> ATSScore:
-    """Analyze ATS score for the resume"""
-    
-    prompt = f"""
+def _build_ats_prompt(resume_data: Dict[str, Any], target_role: str) -> str:
+    """ATS scoring prompt shared by the sync and async paths"""
+    return f"""
     Analyze this resume for ATS (Applicant Tracking System) compatibility and scoring for a {target_role} position.
     
     Resume Data:
-    {json.dumps(resume_data, indent=2)}
+    {compact_resume(resume_data, "ats_score")}
     
     Provide ATS analysis in this JSON format:
     {{
@@ -627,41 +619,47 @@ def analyze_ats_score(resume_data: Dict[str, Any], target_role: str = "Software
     
     Return only the JSON object.
     """
-    
+
+def analyze_ats_score(resume_data: Dict[str, Any], target_role: str = "Software Engineer") -> ATSScore:
+    """Analyze ATS score for the resume"""
     try:
-        response = call_llm(prompt)
-        json_match = re.search(r'\{.*\}', response, re.DOTALL)
-        if json_match:
-            ats_data = json.loads(json_match.group())
-            return ATSScore(**ats_data)
+        return call_llm_json(_build_ats_prompt(resume_data, target_role), "ats_score", ATSScore, cache=True)
+    except StructuredOutputError:
         return ATSScore(overall_score=50, improvements=["Could not analyze ATS score"])
     except Exception as e:
         return ATSScore(overall_score=50, improvements=[f"ATS analysis error: {str(e)}"])
 
-def generate_section_enhancements(resume_data: Dict[str, Any], target_role: str = "Software Engineer") -> List[SectionEnhancement]:
-    """Generate detailed enhancement suggestions for each resume section"""
-    
+async def aanalyze_ats_score(resume_data: Dict[str, Any], target_role: str = "Software Engineer") -> ATSScore:
+    """Async analyze_ats_score (does not block the event loop)"""
+    try:
+        return await acall_llm_json(_build_ats_prompt(resume_data, target_role), "ats_score", ATSScore, cache=True)
+    except StructuredOutputError:
+        return ATSScore(overall_score=50, improvements=["Could not analyze ATS score"])
+    except Exception as e:
+        return ATSScore(overall_score=50, improvements=[f"ATS analysis error: {str(e)}"])
+
+def _resume_sections(resume_data: Dict[str, Any], only_sections: Optional[List[str]] = None) -> List[tuple]:
+    """(section_name, section_data) pairs worth analyzing, in display order"""
     sections = [
         ("Contact Information", resume_data.get("name", "") + " " + resume_data.get("email", "")),
-        ("Skills", json.dumps(resume_data.get("skills", {}))),
-        ("Experience", json.dumps(resume_data.get("experience", []))),
-        ("Education", json.dumps(resume_data.get("education", []))),
-        ("Projects", json.dumps(resume_data.get("projects", []))),
-        ("Certifications", json.dumps(resume_data.get("certifications", []))),
-        ("Achievements", json.dumps(resume_data.get("achievements", [])))
+        ("Skills", compact_json(resume_data.get("skills", {}))),
+        ("Experience", compact_json(resume_data.get("experience", []))),
+        ("Education", compact_json(resume_data.get("education", []))),
+        ("Projects", compact_json(resume_data.get("projects", []))),
+        ("Certifications", compact_json(resume_data.get("certifications", []))),
+        ("Achievements", compact_json(resume_data.get("achievements", [])))
     ]
-    
-    enhancements = []
-    
-    for section_name, section_data in sections:
-        if not section_data or section_data in ['""', '[]', '{}']:
-            continue
-            
-        prompt = f"""
+    return [
+        (name, data) for name, data in sections
+        if data and data not in ['""', '[]', '{}'] and (only_sections is None or name in only_sections)
+    ]
+
+def _build_section_prompt(section_name: str, section_data: str, target_role: str) -> str:
+    return f"""
         Analyze this resume section for a {target_role} position and provide enhancement suggestions.
         
         Section: {section_name}
-        Data: {section_data}
+        Data: {budget_text("section_enhancement", section_data)}
         
         Provide analysis in this JSON format:
         {{
@@ -698,50 +696,320 @@ def generate_section_enhancements(resume_data: Dict[str, Any], target_role: str
         
         Return only the JSON object.
         """
-        
+
+def _section_error(section_name: str, error: Exception) -> SectionEnhancement:
+    return SectionEnhancement(
+        section_name=section_name,
+        current_score=50,
+        improvements=[f"Analysis error: {str(error)}"]
+    )
+
+def _analyze_section(section_name: str, section_data: str, target_role: str) -> Optional[SectionEnhancement]:
+    """None when the reply has no JSON (section skipped); invalid JSON raises and becomes an error entry"""
+    try:
+        return call_llm_json(_build_section_prompt(section_name, section_data, target_role),
+                             "section_enhancement", SectionEnhancement, cache=True)
+    except StructuredOutputError as e:
+        if e.stage == "extract":
+            return None
+        raise
+
+async def _aanalyze_section(section_name: str, section_data: str, target_role: str) -> Optional[SectionEnhancement]:
+    """Async _analyze_section"""
+    try:
+        return await acall_llm_json(_build_section_prompt(section_name, section_data, target_role),
+                                    "section_enhancement", SectionEnhancement, cache=True)
+    except StructuredOutputError as e:
+        if e.stage == "extract":
+            return None
+        raise
+
+def _start_on_fanout(fn, *args) -> Future:
+    """Run fn on the shared fan-out pool; when that pool's queue is full, run it on the caller's thread"""
+    try:
+        return fanout_executor.submit(fn, *args)
+    except ExecutorSaturatedError:
+        future = Future()
         try:
-            response = call_llm(prompt)
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                enhancement_data = json.loads(json_match.group())
-                enhancements.append(SectionEnhancement(**enhancement_data))
+            future.set_result(fn(*args))
         except Exception as e:
-            enhancements.append(SectionEnhancement(
-                section_name=section_name,
-                current_score=50,
-                improvements=[f"Analysis error: {str(e)}"]
-            ))
-    
-    return enhancements
+            future.set_exception(e)
+        return future
 
-def generate_enhanced_resume_analysis(resume_data: Dict[str, Any], target_role: str = "Software Engineer") -> EnhancedResumeAnalysis:
-    """Generate comprehensive resume analysis with ATS scoring and enhancement suggestions"""
+def generate_section_enhancements(
+    resume_data: Dict[str, Any],
+    target_role: str = "Software Engineer",
+    max_concurrency: Optional[int] = None,
+    section_timeout: Optional[float] = None,
+    only_sections: Optional[List[str]] = None
+) -> List[SectionEnhancement]:
+    """Generate detailed enhancement suggestions for each resume section
+
+    Section prompts run concurrently on the fan-out executor (at most max_concurrency
+    at once). A section that fails or is still running section_timeout after it was
+    submitted gets an error entry; the others are still returned, in the same section
+    order as before. only_sections restricts the run to the named sections.
+    """
+    sections = _resume_sections(resume_data, only_sections)
+    if not sections:
+        return []
+    max_concurrency = max(1, max_concurrency or SECTION_ENHANCEMENT_CONCURRENCY)
+    section_timeout = section_timeout or SECTION_ENHANCEMENT_TIMEOUT
     
-    # Generate ATS score
-    ats_score = analyze_ats_score(resume_data, target_role)
+    results: Dict[int, Optional[SectionEnhancement]] = {}
+    pending = list(enumerate(sections))
+    running: Dict[Future, tuple] = {}  # future -> (section index, deadline)
+    while pending or running:
+        # Keep at most max_concurrency sections in flight; each one's clock starts at submit
+        while pending and len(running) < max_concurrency:
+            index, (section_name, section_data) = pending.pop(0)
+            running[_start_on_fanout(_analyze_section, section_name, section_data, target_role)] = (
+                index, time.monotonic() + section_timeout
+            )
+        wait_futures(running, timeout=max(0.0, min(deadline for _, deadline in running.values()) - time.monotonic()),
+                     return_when=FIRST_COMPLETED)
+        now = time.monotonic()
+        for future, (index, deadline) in list(running.items()):
+            section_name = sections[index][0]
+            if future.done():
+                del running[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    results[index] = _section_error(section_name, e)
+            elif now >= deadline:
+                # The worker can't be interrupted; its late result is dropped
+                del running[future]
+                future.cancel()
+                results[index] = _section_error(section_name, TimeoutError(f"timed out after {section_timeout:g}s"))
     
-    # Generate section enhancements
-    section_enhancements = generate_section_enhancements(resume_data, target_role)
+    return [results[index] for index in range(len(sections)) if results.get(index)]
+
+async def agenerate_section_enhancements(
+    resume_data: Dict[str, Any],
+    target_role: str = "Software Engineer",
+    max_concurrency: Optional[int] = None,
+    section_timeout: Optional[float] = None,
+    only_sections: Optional[List[str]] = None
+) -> List[SectionEnhancement]:
+    """Async generate_section_enhancements (bounded fan-out, per-section timeout, ordered results)"""
+    sections = _resume_sections(resume_data, only_sections)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or SECTION_ENHANCEMENT_CONCURRENCY))
+    section_timeout = section_timeout or SECTION_ENHANCEMENT_TIMEOUT
     
-    # Generate overall recommendations
-    overall_recommendations = [
+    async def analyze(section_name: str, section_data: str) -> Optional[SectionEnhancement]:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    _aanalyze_section(section_name, section_data, target_role),
+                    timeout=section_timeout
+                )
+            except asyncio.TimeoutError:
+                return _section_error(section_name, TimeoutError(f"timed out after {section_timeout:g}s"))
+            except Exception as e:
+                return _section_error(section_name, e)
+    
+    results = await asyncio.gather(*(analyze(name, data) for name, data in sections))
+    return [enhancement for enhancement in results if enhancement]
+
+def _overall_recommendations(ats_score: ATSScore) -> List[str]:
+    return [
         f"Current ATS Score: {ats_score.overall_score}/100 - {'Excellent' if ats_score.overall_score >= 80 else 'Good' if ats_score.overall_score >= 60 else 'Needs Improvement'}",
         "Focus on adding quantifiable achievements with specific metrics",
         "Ensure all sections use industry-standard keywords",
         "Consider adding missing skills identified in the analysis",
         "Regularly update your resume with new projects and certifications"
     ]
-    
+
+def _resolve_analysis_mode(mode: Optional[str]) -> str:
+    mode = (mode or RESUME_ANALYSIS_MODE).lower()
+    return mode if mode in RESUME_ANALYSIS_MODES else "per_section"
+
+def _build_batched_prompt(resume_data: Dict[str, Any], target_role: str, section_names: List[str]) -> str:
+    """One prompt asking for the ATS score and every section enhancement together"""
+    return f"""
+    Analyze this resume for a {target_role} position. Score its ATS (Applicant Tracking System)
+    compatibility and give enhancement suggestions for each of these sections:
+    {json.dumps(section_names)}
+
+    Resume Data:
+    {compact_resume(resume_data, "batched_analysis")}
+
+    Provide the analysis in this JSON format:
+    {{
+        "ats_score": {{
+            "overall_score": 85,
+            "section_scores": {{"contact_info": 90, "skills": 80, "experience": 85}},
+            "improvements": ["Include quantifiable achievements"],
+            "keywords_missing": ["API", "Testing"],
+            "keywords_found": ["Python", "Git"]
+        }},
+        "section_enhancements": [
+            {{
+                "section_name": "<one of the section names above>",
+                "current_score": 75,
+                "improvements": ["Add specific metrics and numbers"],
+                "skill_development_suggestions": ["Get AWS certification"],
+                "ats_optimization_tips": ["Use standard job titles"],
+                "future_learning_paths": ["Cloud architecture certification"]
+            }}
+        ]
+    }}
+
+    Include exactly one entry in "section_enhancements" per section listed above, using the
+    section name verbatim. Focus on ATS optimization, skill development, future career growth,
+    quantifiable improvements and industry best practices.
+
+    Return only the JSON object.
+    """
+
+def _parse_batched_response(data: Dict[str, Any], section_names: List[str]) -> tuple:
+    """
+    Validate a decoded batched response piece by piece
+
+    Returns:
+        (ATSScore or None, {section_name: SectionEnhancement}) with only the parts that validated
+    """
+    ats_score, by_name = None, {}
+    try:
+        ats_score = ATSScore(**data.get("ats_score", {}))
+    except Exception:
+        ats_score = None
+
+    wanted = {name.lower(): name for name in section_names}
+    for item in data.get("section_enhancements") or []:
+        try:
+            enhancement = SectionEnhancement(**item)
+        except Exception:
+            continue
+        name = wanted.get(enhancement.section_name.lower())
+        if name and name not in by_name:
+            by_name[name] = enhancement
+    return ats_score, by_name
+
+def _merge_section_results(section_names: List[str], by_name: Dict[str, SectionEnhancement],
+                           repaired: List[SectionEnhancement]) -> List[SectionEnhancement]:
+    """Fold re-requested sections back in, keeping the usual section order"""
+    wanted = {name.lower(): name for name in section_names}
+    extras = []
+    for enhancement in repaired:
+        name = wanted.get(enhancement.section_name.lower())
+        if name and name not in by_name:
+            by_name[name] = enhancement
+        else:
+            extras.append(enhancement)
+    return [by_name[name] for name in section_names if name in by_name] + extras
+
+def _log_analysis_path(mode: str, ats_repaired: bool = False, repaired_sections: Optional[List[str]] = None):
+    path = mode
+    if ats_repaired or repaired_sections:
+        path += f" + re-request (ats={ats_repaired}, sections={repaired_sections or []})"
+    print(f"[INFO] Resume analysis served by {path} path")
+
+def _generate_batched_analysis(resume_data: Dict[str, Any], target_role: str) -> tuple:
+    """Single-call analysis; only the parts that fail validation are re-requested"""
+    section_names = [name for name, _ in _resume_sections(resume_data)]
+    try:
+        data = call_llm_json(_build_batched_prompt(resume_data, target_role, section_names), "batched_analysis", cache=True)
+        ats_score, by_name = _parse_batched_response(data, section_names)
+    except Exception as e:
+        print(f"[WARN] Batched resume analysis call failed: {e}")
+        ats_score, by_name = None, {}
+
+    missing = [name for name in section_names if name not in by_name]
+    ats_repaired = ats_score is None
+    ats_future = _start_on_fanout(analyze_ats_score, resume_data, target_role) if ats_repaired else None
+    repaired = generate_section_enhancements(resume_data, target_role, only_sections=missing) if missing else []
+    if ats_future is not None:
+        ats_score = ats_future.result()
+
+    _log_analysis_path("batched", ats_repaired, missing)
+    return ats_score, _merge_section_results(section_names, by_name, repaired)
+
+async def _agenerate_batched_analysis(resume_data: Dict[str, Any], target_role: str) -> tuple:
+    """Async _generate_batched_analysis"""
+    section_names = [name for name, _ in _resume_sections(resume_data)]
+    try:
+        data = await acall_llm_json(_build_batched_prompt(resume_data, target_role, section_names), "batched_analysis", cache=True)
+        ats_score, by_name = _parse_batched_response(data, section_names)
+    except Exception as e:
+        print(f"[WARN] Batched resume analysis call failed: {e}")
+        ats_score, by_name = None, {}
+
+    missing = [name for name in section_names if name not in by_name]
+    ats_repaired = ats_score is None
+
+    async def keep(value):
+        return value
+
+    ats_score, repaired = await asyncio.gather(
+        aanalyze_ats_score(resume_data, target_role) if ats_repaired else keep(ats_score),
+        agenerate_section_enhancements(resume_data, target_role, only_sections=missing) if missing else keep([])
+    )
+
+    _log_analysis_path("batched", ats_repaired, missing)
+    return ats_score, _merge_section_results(section_names, by_name, repaired)
+
+def generate_enhanced_resume_analysis(
+    resume_data: Dict[str, Any],
+    target_role: str = "Software Engineer",
+    mode: Optional[str] = None
+) -> EnhancedResumeAnalysis:
+    """Generate comprehensive resume analysis with ATS scoring and enhancement suggestions
+
+    mode="per_section" (default) sends one prompt per section plus the ATS prompt;
+    mode="batched" asks for everything in one structured response.
+    """
+    mode = _resolve_analysis_mode(mode)
+
+    if mode == "batched":
+        ats_score, section_enhancements = _generate_batched_analysis(resume_data, target_role)
+    else:
+        # Score ATS alongside the section fan-out so the whole analysis costs ~one round-trip
+        ats_future = _start_on_fanout(analyze_ats_score, resume_data, target_role)
+        section_enhancements = generate_section_enhancements(resume_data, target_role)
+        ats_score = ats_future.result()
+        _log_analysis_path(mode)
+
     return EnhancedResumeAnalysis(
         resume_data=resume_data,
         ats_score=ats_score,
         section_enhancements=section_enhancements,
-        overall_recommendations=overall_recommendations
+        overall_recommendations=_overall_recommendations(ats_score)
+    )
+
+async def agenerate_enhanced_resume_analysis(
+    resume_data: Dict[str, Any],
+    target_role: str = "Software Engineer",
+    mode: Optional[str] = None
+) -> EnhancedResumeAnalysis:
+    """Async generate_enhanced_resume_analysis"""
+    mode = _resolve_analysis_mode(mode)
+
+    if mode == "batched":
+        ats_score, section_enhancements = await _agenerate_batched_analysis(resume_data, target_role)
+    else:
+        ats_score, section_enhancements = await asyncio.gather(
+            aanalyze_ats_score(resume_data, target_role),
+            agenerate_section_enhancements(resume_data, target_role)
+        )
+        _log_analysis_path(mode)
+
+    return EnhancedResumeAnalysis(
+        resume_data=resume_data,
+        ats_score=ats_score,
+        section_enhancements=section_enhancements,
+        overall_recommendations=_overall_recommendations(ats_score)
     )
 
 # ============ Enhanced Workflow Functions ============
 
-def enhanced_resume_analysis_workflow(input_data: str, input_type: str, target_role: str = "Software Engineer") -> Dict[str, Any]:
+def enhanced_resume_analysis_workflow(
+    input_data: str,
+    input_type: str,
+    target_role: str = "Software Engineer",
+    analysis_mode: Optional[str] = None
+) -> Dict[str, Any]:
     """Enhanced workflow that includes ATS analysis and improvement suggestions"""
     
     # Import here to avoid circular imports
@@ -759,16 +1027,50 @@ def enhanced_resume_analysis_workflow(input_data: str, input_type: str, target_r
     
     try:
         # Generate enhanced analysis
-        enhanced_analysis = generate_enhanced_resume_analysis(resume_data, target_role)
+        enhanced_analysis = generate_enhanced_resume_analysis(resume_data, target_role, mode=analysis_mode)
         
         # Combine results
         return {
             **basic_result,
             "enhanced_analysis": enhanced_analysis.model_dump(),
-            "target_role": target_role
+            "target_role": target_role,
+            "analysis_mode": _resolve_analysis_mode(analysis_mode)
         }
     except Exception as e:
         return {
             **basic_result,
             "enhancement_error": f"Could not generate enhancements: {str(e)}"
-        }
\ No newline at end of file
+        }
+
+async def aenhanced_resume_analysis_workflow(
+    input_data: str,
+    input_type: str,
+    target_role: str = "Software Engineer",
+    analysis_mode: Optional[str] = None
+) -> Dict[str, Any]:
+    """Async enhanced_resume_analysis_workflow for the FastAPI endpoints"""
+    from graph import quick_skill_analysis_workflow
+    
+    # The LangGraph parse step is synchronous; keep it off the event loop
+    basic_result = await run_io(quick_skill_analysis_workflow, input_data, input_type)
+    
+    if basic_result.get("error"):
+        return basic_result
+    
+    resume_data = basic_result.get("resume_data", {})
+    if not resume_data:
+        return {"error": "No resume data found for enhancement analysis"}
+    
+    try:
+        enhanced_analysis = await agenerate_enhanced_resume_analysis(resume_data, target_role, mode=analysis_mode)
+        return {
+            **basic_result,
+            "enhanced_analysis": enhanced_analysis.model_dump(),
+            "target_role": target_role,
+            "analysis_mode": _resolve_analysis_mode(analysis_mode)
+        }
+    except Exception as e:
+        return {
+            **basic_result,
+            "enhancement_error": f"Could not generate enhancements: {str(e)}"
+        }
@@ -5,6 +5,7 @@ Enhanced GitHub Analyzer - Comprehensive profile and repository analysis
 Matches the exact specifications provided for GitHub analysis
 """
 
+import os
 import requests
 import json
 import re
@@ -13,6 +14,18 @@ from typing import Dict, List, Any, Optional
 from collections import Counter, defaultdict
 import time
 
+# Request tracing lives in the agent service runtime; standalone use runs untraced
+try:
+    from tracing import span
+except ImportError:
+    from contextlib import nullcontext
+
+    def span(name, cat, **args):
+        return nullcontext()
+
+# Override to point the analyzer at a GitHub Enterprise or local stand-in API
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+
 class EnhancedGitHubAnalyzer:
     """Comprehensive GitHub profile analyzer matching exact specifications"""
     
@@ -71,12 +84,17 @@ class EnhancedGitHubAnalyzer:
         except Exception as e:
             return {'error': f'Analysis failed: {str(e)}'}
     
+    def _get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10) -> requests.Response:
+        """GitHub API GET, traced as one span per call"""
+        with span(url.split("?")[0].replace(GITHUB_API_URL, ""), "github"):
+            return requests.get(url, headers=headers, timeout=timeout)
+    
     def _get_profile_overview(self, username: str) -> Dict[str, Any]:
         """1️⃣ Profile Overview - Username, followers, repos, stars, contribution level"""
         
         try:
-            url = f'https://api.github.com/users/{username}'
-            response = requests.get(url, headers=self.headers, timeout=10)
+            url = f'{GITHUB_API_URL}/users/{username}'
+            response = self._get(url, headers=self.headers, timeout=10)
             
             if response.status_code != 200:
                 return {'error': f'Failed to fetch profile: {response.status_code}'}
@@ -84,8 +102,8 @@ class EnhancedGitHubAnalyzer:
             data = response.json()
             
             # Calculate total stars, forks, and watchers across all repos
-            repos_url = f'https://api.github.com/users/{username}/repos?per_page=100'
-            repos_response = requests.get(repos_url, headers=self.headers, timeout=10)
+            repos_url = f'{GITHUB_API_URL}/users/{username}/repos?per_page=100'
+            repos_response = self._get(repos_url, headers=self.headers, timeout=10)
             
             total_stars = 0
             total_forks = 0
@@ -125,8 +143,8 @@ class EnhancedGitHubAnalyzer:
             per_page = 100
             
             while len(repos) < 300:  # Limit to prevent excessive API calls
-                url = f'https://api.github.com/users/{username}/repos?page={page}&per_page={per_page}&sort=updated'
-                response = requests.get(url, headers=self.headers, timeout=10)
+                url = f'{GITHUB_API_URL}/users/{username}/repos?page={page}&per_page={per_page}&sort=updated'
+                response = self._get(url, headers=self.headers, timeout=10)
                 
                 if response.status_code != 200:
                     break
@@ -1,8 +1,7 @@
-from typing import Dict, Any, TypedDict
+from typing import Dict, Any, TypedDict, Optional, Callable
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.sqlite import SqliteSaver
-import sqlite3
 import os
+from functools import lru_cache
 
 from common import (
     CareerAgentState,
@@ -12,17 +11,19 @@ from common import (
     build_portfolio_node,
     match_mentors_node
 )
+from metrics import timed_node
+from checkpoints import get_checkpointer
 
 def build_career_workflow() -> StateGraph:
     """Build the career development workflow"""
     builder = StateGraph(CareerAgentState)
     
     # Add nodes
-    builder.add_node("input_processor", process_input_node)
-    builder.add_node("skill_profiler", create_skill_profile_node)
-    builder.add_node("learning_path_generator", generate_learning_path_node)
-    builder.add_node("portfolio_builder", build_portfolio_node)
-    builder.add_node("mentor_matcher", match_mentors_node)
+    builder.add_node("input_processor", timed_node("career", "input_processor", process_input_node))
+    builder.add_node("skill_profiler", timed_node("career", "skill_profiler", create_skill_profile_node))
+    builder.add_node("learning_path_generator", timed_node("career", "learning_path_generator", generate_learning_path_node))
+    builder.add_node("portfolio_builder", timed_node("career", "portfolio_builder", build_portfolio_node))
+    builder.add_node("mentor_matcher", timed_node("career", "mentor_matcher", match_mentors_node))
     
     # Set entry point
     builder.set_entry_point("input_processor")
@@ -36,31 +37,39 @@ def build_career_workflow() -> StateGraph:
     
     return builder
 
+@lru_cache(maxsize=1)
+def get_career_workflow() -> StateGraph:
+    """Career workflow builder, wired once per process"""
+    return build_career_workflow()
+
+@lru_cache(maxsize=1)
 def get_career_graph():
-    """Get compiled career development graph with checkpointing"""
-    # Create SQLite connection for checkpointing
-    db_path = "checkpoints.sqlite"
-    
-    conn = sqlite3.connect(db_path, check_same_thread=False)
-    checkpointer = SqliteSaver(conn)
-    
-    workflow = build_career_workflow().compile(checkpointer=checkpointer)
-    return workflow
+    """Get compiled career development graph with checkpointing
+
+    Compiled once per process (startup warm-up) and shared by every worker
+    thread; the checkpointer serializes access to its SQLite connection.
+    """
+    return get_career_workflow().compile(checkpointer=get_checkpointer())
 
 # ============ Specialized Workflows ============
 
-def quick_skill_analysis_workflow(input_data: str, input_type: str) -> Dict[str, Any]:
-    """Quick workflow for skill analysis only"""
+@lru_cache(maxsize=1)
+def get_quick_analysis_graph():
+    """Compiled two-node skill analysis graph (built once per process)"""
     # Build a simple workflow without checkpointing for quick analysis
     builder = StateGraph(CareerAgentState)
-    builder.add_node("input_processor", process_input_node)
-    builder.add_node("skill_profiler", create_skill_profile_node)
+    builder.add_node("input_processor", timed_node("career", "input_processor", process_input_node))
+    builder.add_node("skill_profiler", timed_node("career", "skill_profiler", create_skill_profile_node))
     builder.set_entry_point("input_processor")
     builder.add_edge("input_processor", "skill_profiler")
     builder.add_edge("skill_profiler", END)
     
     # Compile without checkpointing to avoid LangSmith issues
-    workflow = builder.compile()
+    return builder.compile()
+
+def quick_skill_analysis_workflow(input_data: str, input_type: str) -> Dict[str, Any]:
+    """Quick workflow for skill analysis only"""
+    workflow = get_quick_analysis_graph()
     
     state = CareerAgentState(
         user_id="quick_analysis",
@@ -92,9 +101,13 @@ def full_career_development_workflow(
     input_data: str, 
     input_type: str, 
     target_role: str,
-    user_id: str = "default"
+    user_id: str = "default",
+    progress: Optional[Callable[..., None]] = None
 ) -> CareerAgentState:
-    """Complete career development workflow"""
+    """Complete career development workflow
+
+    progress, if given, is called as progress(node, trace=[...]) after each node (job API).
+    """
     graph = get_career_graph()
     
     state = CareerAgentState(
@@ -103,8 +116,13 @@ def full_career_development_workflow(
         input_data=input_data,
         target_role=target_role
     )
+    config = {"configurable": {"thread_id": user_id}}
     
-    result_dict = graph.invoke(state, config={"configurable": {"thread_id": user_id}})
+    if progress is None:
+        result_dict = graph.invoke(state, config=config)
+    else:
+        from jobs import stream_graph
+        result_dict = stream_graph(graph, state.model_dump(), config, on_node=progress)
     
     # Convert back to state object
     return CareerAgentState(**result_dict)
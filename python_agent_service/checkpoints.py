@@ -0,0 +1,50 @@
+"""
+Checkpoint Store
+One SQLite checkpointer (checkpoints.sqlite) shared by the compiled career and
+chat/mentor graphs, so each graph is compiled once per process and every
+worker thread runs the same compiled instance
+"""
+
+import sqlite3
+import threading
+from functools import lru_cache
+from typing import Any, Iterator
+
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+CHECKPOINT_DB_PATH = "checkpoints.sqlite"
+
+# SqliteSaver takes no lock of its own; all use of the shared connection goes through this one
+_conn_lock = threading.RLock()
+
+
+class LockedSqliteSaver(SqliteSaver):
+    """SqliteSaver safe to share across threads: every read/write holds _conn_lock"""
+
+    def get(self, config, *args, **kwargs):
+        with _conn_lock:
+            return super().get(config, *args, **kwargs)
+
+    def put(self, config, *args, **kwargs):
+        with _conn_lock:
+            return super().put(config, *args, **kwargs)
+
+    def get_tuple(self, config, *args, **kwargs):
+        with _conn_lock:
+            return super().get_tuple(config, *args, **kwargs)
+
+    def put_writes(self, config, *args, **kwargs):
+        with _conn_lock:
+            return super().put_writes(config, *args, **kwargs)
+
+    def list(self, config, *args, **kwargs) -> Iterator[Any]:
+        # Read the rows under the lock rather than holding it while the caller iterates
+        with _conn_lock:
+            return iter(list(super().list(config, *args, **kwargs)))
+
+
+@lru_cache(maxsize=1)
+def get_checkpointer() -> LockedSqliteSaver:
+    """Process-wide checkpointer over one SQLite connection"""
+    conn = sqlite3.connect(CHECKPOINT_DB_PATH, check_same_thread=False)
+    return LockedSqliteSaver(conn)
@@ -0,0 +1,173 @@
+"""
+Bounded Executors
+Service-wide pools for blocking work called from async endpoints: an I/O pool
+(Node API / GitHub requests, LangGraph runs waiting on the LLM), a smaller
+CPU pool (PDF extraction) and a fan-out pool for the parallel sub-calls that
+blocking code already running on the I/O pool makes (resume section prompts,
+batch Node API lookups), each with queue-depth and saturation metrics
+"""
+
+import os
+import asyncio
+import threading
+import time
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, TypeVar
+from dotenv import load_dotenv
+
+load_dotenv()
+
+EXECUTOR_IO_WORKERS = int(os.getenv("EXECUTOR_IO_WORKERS", "32"))
+EXECUTOR_CPU_WORKERS = int(os.getenv("EXECUTOR_CPU_WORKERS", str(max(2, os.cpu_count() or 2))))
+# Separate from the I/O pool so an I/O worker waiting on its sub-calls can't starve that pool;
+# tasks on this pool must never block on other fan-out tasks
+EXECUTOR_FANOUT_WORKERS = int(os.getenv("EXECUTOR_FANOUT_WORKERS", "16"))
+# Max tasks waiting for a worker; 0 = unbounded
+EXECUTOR_IO_MAX_QUEUE = int(os.getenv("EXECUTOR_IO_MAX_QUEUE", "0"))
+EXECUTOR_CPU_MAX_QUEUE = int(os.getenv("EXECUTOR_CPU_MAX_QUEUE", "0"))
+EXECUTOR_FANOUT_MAX_QUEUE = int(os.getenv("EXECUTOR_FANOUT_MAX_QUEUE", "0"))
+
+T = TypeVar("T")
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when a bounded executor's wait queue is full"""
+
+    def __init__(self, name: str, queued: int):
+        super().__init__(f"{name} executor saturated ({queued} tasks queued)")
+        self.name = name
+        self.queued = queued
+
+
+class BoundedExecutor:
+    """ThreadPoolExecutor with a bounded wait queue and queue/latency metrics"""
+
+    def __init__(self, name: str, max_workers: int, max_queue: int = 0):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"{name}-exec")
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queued = 0
+        self._peak_queued = 0
+        self._counters = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self._wait_total = 0.0
+        self._run_total = 0.0
+        self._recent_waits = deque(maxlen=500)
+
+    def _admit(self):
+        with self._lock:
+            if self.max_queue and self._queued >= self.max_queue:
+                self._counters["rejected"] += 1
+                raise ExecutorSaturatedError(self.name, self._queued)
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+            self._counters["submitted"] += 1
+
+    def _wrap(self, fn: Callable[..., T], args: tuple, kwargs: dict) -> Callable[[], T]:
+        enqueued_at = time.monotonic()
+
+        def task() -> T:
+            started = time.monotonic()
+            with self._lock:
+                task.started = True
+                self._queued -= 1
+                self._active += 1
+                self._wait_total += started - enqueued_at
+                self._recent_waits.append(started - enqueued_at)
+            failed = False
+            try:
+                return fn(*args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._run_total += time.monotonic() - started
+                    self._counters["failed" if failed else "completed"] += 1
+
+        task.started = False
+        return task
+
+    def _forget(self, task: Callable):
+        """Un-count a task that was cancelled before a worker picked it up"""
+        with self._lock:
+            if not task.started:
+                task.started = True
+                self._queued -= 1
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a blocking callable on the pool without blocking the event loop
+
+        Context variables (e.g. the LLM priority lane) are carried into the worker thread.
+
+        Raises:
+            ExecutorSaturatedError: If the wait queue is full
+        """
+        self._admit()
+        ctx = contextvars.copy_context()
+        task = self._wrap(fn, args, kwargs)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._pool, ctx.run, task)
+        except asyncio.CancelledError:
+            self._forget(task)
+            raise
+
+    def submit(self, fn: Callable[..., T], *args, **kwargs):
+        """Thread-side submit (returns a concurrent.futures.Future) with the same accounting"""
+        self._admit()
+        ctx = contextvars.copy_context()
+        return self._pool.submit(ctx.run, self._wrap(fn, args, kwargs))
+
+    def in_worker(self) -> bool:
+        """True on one of this pool's worker threads, where waiting on this pool's futures can deadlock"""
+        return threading.current_thread().name.startswith(f"{self.name}-exec")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            finished = self._counters["completed"] + self._counters["failed"]
+            started = finished + self._active
+            recent = sorted(self._recent_waits)
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "queue_depth": self._queued,
+                "peak_queue_depth": self._peak_queued,
+                "utilization": round(self._active / self.max_workers, 3),
+                "saturated": self._active >= self.max_workers and self._queued > 0,
+                **self._counters,
+                "wait_avg_ms": round(self._wait_total / started * 1000, 2) if started else 0.0,
+                "wait_p95_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))] * 1000, 2) if recent else 0.0,
+                "run_avg_ms": round(self._run_total / finished * 1000, 2) if finished else 0.0
+            }
+
+    def shutdown(self, wait: bool = False):
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+
+def executor_stats() -> Dict[str, Any]:
+    """Metrics for every service executor (health/metrics reporting)"""
+    return {"io": io_executor.stats(), "cpu": cpu_executor.stats(), "fanout": fanout_executor.stats()}
+
+
+async def run_io(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run blocking I/O (HTTP calls, LangGraph runs waiting on the LLM) off the event loop"""
+    return await io_executor.run(fn, *args, **kwargs)
+
+
+async def run_cpu(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run CPU-heavy work (PDF extraction) on the smaller CPU pool"""
+    return await cpu_executor.run(fn, *args, **kwargs)
+
+
+# Global instances
+io_executor = BoundedExecutor("io", EXECUTOR_IO_WORKERS, EXECUTOR_IO_MAX_QUEUE)
+cpu_executor = BoundedExecutor("cpu", EXECUTOR_CPU_WORKERS, EXECUTOR_CPU_MAX_QUEUE)
+fanout_executor = BoundedExecutor("fanout", EXECUTOR_FANOUT_WORKERS, EXECUTOR_FANOUT_MAX_QUEUE)
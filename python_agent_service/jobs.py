@@ -0,0 +1,206 @@
+"""
+Background Jobs
+Run long workflows (full career development, hackathon graph, PDF resume
+analysis) off the request path: submit returns a job id, a dedicated worker
+pool runs the workflow, and status/progress/results are kept in a local
+in-process store until their TTL expires
+"""
+
+import os
+import time
+import uuid
+import threading
+import traceback
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable
+from pydantic import BaseModel
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from executors import BoundedExecutor
+
+JOBS_WORKERS = int(os.getenv("JOBS_WORKERS", "4"))
+JOBS_MAX_QUEUE = int(os.getenv("JOBS_MAX_QUEUE", "100"))
+JOBS_RESULT_TTL = float(os.getenv("JOBS_RESULT_TTL", "3600"))
+JOBS_MAX_STORED = int(os.getenv("JOBS_MAX_STORED", "1000"))
+# How often the SSE job subscription checks for new progress
+JOBS_EVENTS_POLL_INTERVAL = float(os.getenv("JOBS_EVENTS_POLL_INTERVAL", "0.5"))
+
+FINISHED_STATES = ("succeeded", "failed")
+
+ProgressCallback = Callable[..., None]
+
+
+@dataclass
+class Job:
+    """One submitted workflow run and everything reported about it"""
+    id: str
+    kind: str
+    status: str = "queued"  # queued, running, succeeded, failed
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    progress: List[Dict[str, Any]] = field(default_factory=list)
+    result: Any = None
+    error: Optional[str] = None
+
+    def to_dict(self, include_result: bool = False) -> Dict[str, Any]:
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "current_node": self.progress[-1]["node"] if self.progress else None,
+            "progress": list(self.progress),
+            "error": self.error
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+def stream_graph(graph, state: Dict[str, Any], config: Optional[Dict[str, Any]] = None,
+                 on_node: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    Run a compiled LangGraph node by node, reporting each finished node
+
+    Args:
+        graph: Compiled graph
+        state: Initial state dict
+        config: Graph config (thread_id etc.)
+        on_node: Called as on_node(node_name, trace=new_trace_lines) after each node
+
+    Returns:
+        Final state dict (node updates merged in order)
+    """
+    final = dict(state)
+    seen_trace = len(final.get("trace") or [])
+    for chunk in graph.stream(state, config=config):
+        for node, update in chunk.items():
+            if isinstance(update, BaseModel):
+                update = update.model_dump()
+            if isinstance(update, dict):
+                final.update(update)
+            if on_node is None or node == "__end__":
+                continue
+            trace = final.get("trace") or []
+            on_node(node, trace=trace[seen_trace:])
+            seen_trace = len(trace)
+    return final
+
+
+class JobManager:
+    """Submit workflows to a bounded worker pool and track them in a TTL store"""
+
+    def __init__(self, workers: int = JOBS_WORKERS, max_queue: int = JOBS_MAX_QUEUE,
+                 ttl: float = JOBS_RESULT_TTL, max_stored: int = JOBS_MAX_STORED):
+        self.ttl = ttl
+        self.max_stored = max_stored
+        self._executor = BoundedExecutor("jobs", workers, max_queue)
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}
+        self._counters = {"submitted": 0, "succeeded": 0, "failed": 0, "expired": 0}
+
+    def _purge(self):
+        """Drop expired finished jobs, then the oldest finished ones over max_stored; caller holds the lock"""
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.status in FINISHED_STATES and now - job.finished_at > self.ttl:
+                del self._jobs[job_id]
+                self._counters["expired"] += 1
+        if len(self._jobs) > self.max_stored:
+            finished = sorted(
+                (job for job in self._jobs.values() if job.status in FINISHED_STATES),
+                key=lambda job: job.finished_at
+            )
+            for job in finished[:len(self._jobs) - self.max_stored]:
+                del self._jobs[job.id]
+                self._counters["expired"] += 1
+
+    def _progress(self, job: Job) -> ProgressCallback:
+        def report(node: str, trace: Optional[List[str]] = None, **detail):
+            entry = {"node": node, "at": time.time(), "trace": list(trace or [])}
+            if detail:
+                entry["detail"] = detail
+            with self._lock:
+                job.progress.append(entry)
+        return report
+
+    def _run(self, job: Job, fn: Callable[..., Any], args: tuple, kwargs: dict):
+        with self._lock:
+            job.status = "running"
+            job.started_at = time.time()
+        print(f"[INFO] Job {job.id} ({job.kind}) started")
+        try:
+            result = fn(*args, progress=self._progress(job), **kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            with self._lock:
+                job.status, job.error, job.finished_at = "failed", str(e), time.time()
+                self._counters["failed"] += 1
+            print(f"[ERROR] Job {job.id} ({job.kind}) failed: {e}")
+            return
+        with self._lock:
+            job.status, job.result, job.finished_at = "succeeded", result, time.time()
+            self._counters["succeeded"] += 1
+        print(f"[INFO] Job {job.id} ({job.kind}) finished in {job.finished_at - job.started_at:.1f}s")
+
+    def submit(self, kind: str, fn: Callable[..., Any], *args, **kwargs) -> Job:
+        """
+        Queue a workflow run
+
+        fn is called as fn(*args, progress=callback, **kwargs); callback(node, trace=[...]) records progress.
+        Context variables (e.g. llm_priority) active at submit time apply to the run.
+
+        Raises:
+            ExecutorSaturatedError: If the job queue is full
+        """
+        job = Job(id=uuid.uuid4().hex, kind=kind)
+        with self._lock:
+            self._purge()
+            self._jobs[job.id] = job
+        try:
+            self._executor.submit(self._run, job, fn, args, kwargs)
+        except Exception:
+            with self._lock:
+                self._jobs.pop(job.id, None)
+            raise
+        with self._lock:
+            self._counters["submitted"] += 1
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            self._purge()
+            return self._jobs.get(job_id)
+
+    def snapshot(self, job_id: str, include_result: bool = False) -> Optional[Dict[str, Any]]:
+        """Consistent dict view of a job (None if unknown or expired)"""
+        with self._lock:
+            self._purge()
+            job = self._jobs.get(job_id)
+            return job.to_dict(include_result) if job else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            by_status: Dict[str, int] = {}
+            for job in self._jobs.values():
+                by_status[job.status] = by_status.get(job.status, 0) + 1
+            counters = dict(self._counters)
+        return {
+            "stored": sum(by_status.values()),
+            "by_status": by_status,
+            "ttl_seconds": self.ttl,
+            **counters,
+            "pool": self._executor.stats()
+        }
+
+    def shutdown(self):
+        self._executor.shutdown()
+
+
+# Global instance
+job_manager = JobManager()
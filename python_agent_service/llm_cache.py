@@ -0,0 +1,274 @@
+"""
+LLM Response Cache
+Content-addressed two-tier cache for call_llm: an in-memory LRU with TTL in
+front of an on-disk SQLite store that survives restarts. The async API serves
+memory hits inline and runs the SQLite tier on the I/O executor
+"""
+
+import os
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from dotenv import load_dotenv
+
+from executors import run_io, ExecutorSaturatedError
+
+load_dotenv()
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_CACHE_MEMORY_SIZE = int(os.getenv("LLM_CACHE_MEMORY_SIZE", "512"))
+LLM_CACHE_MEMORY_TTL = float(os.getenv("LLM_CACHE_MEMORY_TTL", "3600"))
+LLM_CACHE_DISK_TTL = float(os.getenv("LLM_CACHE_DISK_TTL", str(7 * 24 * 3600)))
+# Set LLM_CACHE_PATH to an empty string to disable the SQLite tier
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", str(Path(__file__).parent / "llm_cache.sqlite"))
+
+
+def cache_key(provider: str, model: str, prompt: str) -> str:
+    """Content address for a completion: sha256 over provider, model and prompt"""
+    digest = hashlib.sha256()
+    for part in (provider, model, prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class LLMResponseCache:
+    """Memory LRU (with TTL) backed by a SQLite table; both tiers are thread-safe.
+
+    The memory tier and counters have their own lock, never held across SQLite I/O,
+    so an event-loop lookup only ever waits on another memory lookup.
+    """
+
+    def __init__(self,
+                 max_entries: int = LLM_CACHE_MEMORY_SIZE,
+                 memory_ttl: float = LLM_CACHE_MEMORY_TTL,
+                 disk_ttl: float = LLM_CACHE_DISK_TTL,
+                 db_path: Optional[str] = LLM_CACHE_PATH,
+                 enabled: bool = LLM_CACHE_ENABLED):
+        self.max_entries = max_entries
+        self.memory_ttl = memory_ttl
+        self.disk_ttl = disk_ttl
+        self.db_path = db_path or None
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "disk_errors": 0
+        }
+
+    # ----- SQLite tier -----
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite store lazily; caller must hold the disk lock"""
+        if not self.db_path:
+            return None
+        if self._conn is None:
+            try:
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: LLM cache disk tier disabled: {e}")
+                self._disk_error()
+                self.db_path = None
+                self._conn = None
+        return self._conn
+
+    def _disk_get(self, key: str, now: float) -> Optional[str]:
+        conn = self._db()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if now - created_at > self.disk_ttl:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            return value
+        except sqlite3.Error:
+            self._disk_error()
+            return None
+
+    def _disk_set(self, key: str, value: str, now: float):
+        conn = self._db()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, now)
+            )
+            conn.commit()
+        except sqlite3.Error:
+            self._disk_error()
+
+    def _disk_error(self):
+        with self._lock:
+            self._counters["disk_errors"] += 1
+
+    def _disk_lookup(self, key: str, now: float) -> Optional[str]:
+        """Memory-miss path: read the SQLite tier and promote a hit into memory"""
+        with self._disk_lock:
+            value = self._disk_get(key, now)
+        with self._lock:
+            if value is None:
+                self._counters["misses"] += 1
+                return None
+            self._memory_put(key, value, now)
+            self._counters["disk_hits"] += 1
+            return value
+
+    def _disk_store(self, key: str, value: str, now: float):
+        with self._disk_lock:
+            self._disk_set(key, value, now)
+
+    # ----- Memory tier -----
+
+    def _memory_get(self, key: str, now: float) -> Optional[str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if now - stored_at <= self.memory_ttl:
+                self._memory.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return value
+            del self._memory[key]
+            return None
+
+    def _memory_store(self, key: str, value: str, now: float):
+        with self._lock:
+            self._memory_put(key, value, now)
+            self._counters["writes"] += 1
+
+    def _memory_put(self, key: str, value: str, now: float):
+        """Caller must hold the lock"""
+        self._memory[key] = (now, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    # ----- Public API -----
+
+    def get(self, provider: str, model: str, prompt: str) -> Optional[str]:
+        """
+        Look up a cached completion
+
+        Args:
+            provider: LLM provider name
+            model: Provider model name
+            prompt: Exact prompt text
+
+        Returns:
+            Cached completion text, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        key = cache_key(provider, model, prompt)
+        now = time.time()
+        value = self._memory_get(key, now)
+        if value is not None:
+            return value
+        return self._disk_lookup(key, now)
+
+    def set(self, provider: str, model: str, prompt: str, value: str):
+        """Store a completion in both tiers"""
+        if not self.enabled or not value:
+            return
+        key = cache_key(provider, model, prompt)
+        now = time.time()
+        self._memory_store(key, value, now)
+        self._disk_store(key, value, now)
+
+    async def aget(self, provider: str, model: str, prompt: str) -> Optional[str]:
+        """get() for the event loop: memory hits inline, the SQLite lookup on the I/O executor"""
+        if not self.enabled:
+            return None
+        key = cache_key(provider, model, prompt)
+        now = time.time()
+        value = self._memory_get(key, now)
+        if value is not None:
+            return value
+        if not self.db_path:
+            # No SQLite tier: this only records the miss
+            return self._disk_lookup(key, now)
+        try:
+            return await run_io(self._disk_lookup, key, now)
+        except ExecutorSaturatedError:
+            # Treat as a miss rather than queueing a cache read behind a full pool
+            with self._lock:
+                self._counters["misses"] += 1
+            return None
+
+    async def aset(self, provider: str, model: str, prompt: str, value: str):
+        """set() for the event loop: the SQLite write runs on the I/O executor"""
+        if not self.enabled or not value:
+            return
+        key = cache_key(provider, model, prompt)
+        now = time.time()
+        self._memory_store(key, value, now)
+        if not self.db_path:
+            return
+        try:
+            await run_io(self._disk_store, key, value, now)
+        except ExecutorSaturatedError:
+            # The memory tier has the entry; skip persisting it
+            pass
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+        with self._disk_lock:
+            conn = self._db()
+            if conn is not None:
+                try:
+                    conn.execute("DELETE FROM llm_cache")
+                    conn.commit()
+                except sqlite3.Error:
+                    self._disk_error()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for health/metrics reporting"""
+        with self._lock:
+            counters = dict(self._counters)
+            memory_entries = len(self._memory)
+        hits = counters["memory_hits"] + counters["disk_hits"]
+        lookups = hits + counters["misses"]
+        return {
+            "enabled": self.enabled,
+            "disk_enabled": bool(self.db_path),
+            "memory_entries": memory_entries,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            **counters
+        }
+
+    def close(self):
+        with self._disk_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Global instance
+llm_cache = LLMResponseCache()
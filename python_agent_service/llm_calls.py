@@ -0,0 +1,113 @@
+"""
+LLM Calls
+The call_llm family shared by both agent packages (career_agent/common.py,
+agentic_zip/common.py) and main.py: pooled clients from llm_registry,
+tenacity retries, the shared response cache and provider JSON mode with
+structured-output validation
+"""
+
+from typing import Any, AsyncIterator, Iterator, Optional
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_not_exception_type
+
+from llm_clients import llm_registry, resolve_provider
+from llm_cache import llm_cache
+from metrics import call_site, record_llm_retry
+from structured_output import StructuredOutputError, parse_structured
+
+
+@retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=1, max=4),
+       before_sleep=record_llm_retry)
+def call_llm(prompt: str, cache: bool = False, priority: Optional[str] = None) -> str:
+    """Call Gemini if available, else OpenAI, else mock LLM (clients are pooled process-wide).
+
+    Pass cache=True at call sites whose prompt fully determines a reusable answer;
+    the reply is then served from / stored in the shared LLM response cache.
+    priority ("interactive", "batch", "background") picks the admission lane;
+    by default the lane set for the current request via llm_priority() is used.
+    """
+    if not cache:
+        return llm_registry.generate(prompt, priority=priority)
+    provider, model = resolve_provider()
+    cached = llm_cache.get(provider, model, prompt)
+    if cached is not None:
+        return cached
+    reply = llm_registry.generate(prompt, provider=provider, model=model, priority=priority)
+    if provider != "mock":
+        llm_cache.set(provider, model, prompt, reply)
+    return reply
+
+
+@retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=1, max=4),
+       before_sleep=record_llm_retry)
+async def acall_llm(prompt: str, cache: bool = False, priority: Optional[str] = None) -> str:
+    """Awaitable call_llm: same provider order, retries, mock fallback, cache and priority, on the async SDKs."""
+    if not cache:
+        return await llm_registry.agenerate(prompt, priority=priority)
+    provider, model = resolve_provider()
+    cached = await llm_cache.aget(provider, model, prompt)
+    if cached is not None:
+        return cached
+    reply = await llm_registry.agenerate(prompt, provider=provider, model=model, priority=priority)
+    if provider != "mock":
+        await llm_cache.aset(provider, model, prompt, reply)
+    return reply
+
+
+@retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=1, max=4),
+       retry=retry_if_not_exception_type(StructuredOutputError), before_sleep=record_llm_retry)
+def call_llm_json(prompt: str, site: str, schema: Optional[type] = None, many: bool = False,
+                  cache: bool = False, priority: Optional[str] = None) -> Any:
+    """call_llm for JSON replies: provider JSON mode where supported, then shared extraction/validation.
+
+    Returns a schema instance (a list of them with many=True) or the decoded JSON when schema is None.
+    Raises StructuredOutputError when the reply doesn't parse; unparseable replies are never cached
+    and provider retries are not spent on them.
+    """
+    provider, model = resolve_provider()
+    json_mode = llm_registry.supports_json_mode(provider, many)
+    if cache:
+        cached = llm_cache.get(provider, model, prompt)
+        if cached is not None:
+            try:
+                return parse_structured(site, cached, schema, many, native=json_mode)
+            except StructuredOutputError:
+                pass
+    with call_site(site):
+        reply = llm_registry.generate(prompt, provider=provider, model=model, priority=priority, json_mode=json_mode)
+    result = parse_structured(site, reply, schema, many, native=json_mode)
+    if cache and provider != "mock":
+        llm_cache.set(provider, model, prompt, reply)
+    return result
+
+
+@retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=1, max=4),
+       retry=retry_if_not_exception_type(StructuredOutputError), before_sleep=record_llm_retry)
+async def acall_llm_json(prompt: str, site: str, schema: Optional[type] = None, many: bool = False,
+                         cache: bool = False, priority: Optional[str] = None) -> Any:
+    """Awaitable call_llm_json."""
+    provider, model = resolve_provider()
+    json_mode = llm_registry.supports_json_mode(provider, many)
+    if cache:
+        cached = await llm_cache.aget(provider, model, prompt)
+        if cached is not None:
+            try:
+                return parse_structured(site, cached, schema, many, native=json_mode)
+            except StructuredOutputError:
+                pass
+    with call_site(site):
+        reply = await llm_registry.agenerate(prompt, provider=provider, model=model, priority=priority, json_mode=json_mode)
+    result = parse_structured(site, reply, schema, many, native=json_mode)
+    if cache and provider != "mock":
+        await llm_cache.aset(provider, model, prompt, reply)
+    return result
+
+
+def stream_llm(prompt: str, priority: Optional[str] = None) -> Iterator[str]:
+    """Streaming call_llm: yields reply chunks as the provider generates them (no cache, no retry mid-stream)."""
+    yield from llm_registry.stream_generate(prompt, priority=priority)
+
+
+async def astream_llm(prompt: str, priority: Optional[str] = None) -> AsyncIterator[str]:
+    """Async stream_llm for the FastAPI streaming endpoints."""
+    async for chunk in llm_registry.astream_generate(prompt, priority=priority):
+        yield chunk
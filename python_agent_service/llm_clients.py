@@ -0,0 +1,392 @@
+"""
+LLM Client Registry
+Process-wide pool of provider clients shared by every call_llm in the service,
+so Gemini/OpenAI connections are configured once and kept alive between calls
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple, Iterator, AsyncIterator
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from llm_scheduler import llm_scheduler
+from mock_llm import mock_llm
+from metrics import track_llm_call
+
+# Connection pool sizing for HTTP-based providers (OpenAI)
+LLM_POOL_MAX_CONNECTIONS = int(os.getenv("LLM_POOL_MAX_CONNECTIONS", "20"))
+LLM_POOL_MAX_KEEPALIVE = int(os.getenv("LLM_POOL_MAX_KEEPALIVE", "10"))
+LLM_POOL_KEEPALIVE_EXPIRY = float(os.getenv("LLM_POOL_KEEPALIVE_EXPIRY", "60"))
+LLM_REQUEST_TIMEOUT = float(os.getenv("LLM_REQUEST_TIMEOUT", "60"))
+
+
+def resolve_provider() -> Tuple[str, str]:
+    """Pick the provider and model the same way call_llm always has: Gemini, else OpenAI, else mock
+
+    LLM_PROVIDER=mock forces the offline mock even when API keys are set (benchmarks, load tests).
+    """
+    if os.getenv("LLM_PROVIDER", "").lower() == "mock":
+        return "mock", "mock"
+    if os.getenv("GOOGLE_API_KEY"):
+        return "gemini", os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+    if os.getenv("OPENAI_API_KEY"):
+        return "openai", os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    return "mock", "mock"
+
+
+def _usage(resp: Any) -> Optional[Tuple[int, int]]:
+    """(prompt, completion) token counts reported by the provider, if any"""
+    usage = getattr(resp, "usage", None)
+    if usage is not None and getattr(usage, "prompt_tokens", None) is not None:
+        return usage.prompt_tokens, usage.completion_tokens or 0
+    usage = getattr(resp, "usage_metadata", None)
+    if usage is not None and getattr(usage, "prompt_token_count", None) is not None:
+        return usage.prompt_token_count, getattr(usage, "candidates_token_count", 0) or 0
+    return None
+
+
+class LLMClientRegistry:
+    """Thread-safe registry of provider clients keyed by (provider, model)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        self._stats: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._gemini_configured = False
+        self._gemini_json_mode: Optional[bool] = None
+        self._http_client = None
+        self._async_clients: Dict[Tuple[str, str], Any] = {}
+        self._async_http_client = None
+
+    def get_client(self, provider: str, model: str) -> Any:
+        """
+        Get (or lazily build) the client for a provider/model pair
+
+        Args:
+            provider: "gemini" or "openai"
+            model: Provider model name
+
+        Returns:
+            A ready-to-use client object (GenerativeModel or OpenAI)
+        """
+        key = (provider, model)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._build_client(provider, model)
+                    self._clients[key] = client
+                    self._init_stats(key)
+        return client
+
+    def get_async_client(self, provider: str, model: str) -> Any:
+        """
+        Get (or lazily build) the asyncio-native client for a provider/model pair
+
+        Gemini's GenerativeModel serves both paths (generate_content_async), so it
+        is shared with get_client; OpenAI gets an AsyncOpenAI on a pooled httpx.AsyncClient.
+        """
+        if provider == "gemini":
+            return self.get_client(provider, model)
+        key = (provider, model)
+        client = self._async_clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._async_clients.get(key)
+                if client is None:
+                    client = self._build_async_client(provider, model)
+                    self._async_clients[key] = client
+                    self._init_stats(key)
+        return client
+
+    def _init_stats(self, key: Tuple[str, str]):
+        """Create the stats record for a key; caller must hold the lock"""
+        if key not in self._stats:
+            self._stats[key] = {
+                "created_at": time.time(),
+                "requests": 0,
+                "errors": 0,
+                "last_used": None
+            }
+
+    def _build_client(self, provider: str, model: str) -> Any:
+        """Create a new client; caller must hold the lock"""
+        if provider == "gemini":
+            import google.generativeai as genai
+            if not self._gemini_configured:
+                genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+                self._gemini_configured = True
+            return genai.GenerativeModel(model_name=model)
+        if provider == "openai":
+            import httpx
+            from openai import OpenAI
+            if self._http_client is None:
+                self._http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=LLM_POOL_MAX_CONNECTIONS,
+                        max_keepalive_connections=LLM_POOL_MAX_KEEPALIVE,
+                        keepalive_expiry=LLM_POOL_KEEPALIVE_EXPIRY
+                    ),
+                    timeout=LLM_REQUEST_TIMEOUT
+                )
+            return OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=self._http_client)
+        raise ValueError(f"Unknown LLM provider: {provider}")
+
+    def _build_async_client(self, provider: str, model: str) -> Any:
+        """Create a new async client; caller must hold the lock"""
+        if provider == "openai":
+            import httpx
+            from openai import AsyncOpenAI
+            if self._async_http_client is None:
+                self._async_http_client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=LLM_POOL_MAX_CONNECTIONS,
+                        max_keepalive_connections=LLM_POOL_MAX_KEEPALIVE,
+                        keepalive_expiry=LLM_POOL_KEEPALIVE_EXPIRY
+                    ),
+                    timeout=LLM_REQUEST_TIMEOUT
+                )
+            return AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=self._async_http_client)
+        raise ValueError(f"Unknown LLM provider: {provider}")
+
+    def supports_json_mode(self, provider: str, many: bool = False) -> bool:
+        """
+        Whether the provider can be asked for JSON-only output
+
+        OpenAI's json_object mode only returns objects, so array replies
+        (many=True) fall back to prompt instructions plus extraction. Gemini
+        needs an SDK with GenerationConfig.response_mime_type.
+        """
+        if provider == "openai":
+            return not many
+        if provider == "gemini":
+            if self._gemini_json_mode is None:
+                try:
+                    import inspect
+                    from google.generativeai.types import GenerationConfig
+                    self._gemini_json_mode = "response_mime_type" in inspect.signature(GenerationConfig).parameters
+                except Exception:
+                    self._gemini_json_mode = False
+            return self._gemini_json_mode
+        return False
+
+    def _request_kwargs(self, provider: str, json_mode: bool) -> Dict[str, Any]:
+        if not json_mode:
+            return {}
+        if provider == "gemini":
+            return {"generation_config": {"response_mime_type": "application/json"}}
+        return {"response_format": {"type": "json_object"}}
+
+    def _record(self, key: Tuple[str, str], error: bool = False):
+        stats = self._stats.get(key)
+        if stats is None:
+            return
+        with self._lock:
+            stats["requests"] += 1
+            stats["last_used"] = time.time()
+            if error:
+                stats["errors"] += 1
+
+    def generate(self, prompt: str, provider: Optional[str] = None, model: Optional[str] = None,
+                 priority: Optional[str] = None, json_mode: bool = False) -> str:
+        """
+        Run a single completion on the pooled client
+
+        Args:
+            prompt: Prompt text
+            provider: Override the resolved provider
+            model: Override the resolved model
+            json_mode: Ask the provider for JSON-only output (check supports_json_mode first)
+
+        Returns:
+            Completion text (from the offline mock provider when none is configured)
+        """
+        if provider is None or model is None:
+            provider, model = resolve_provider()
+        if provider == "mock":
+            with track_llm_call(provider, prompt) as call, llm_scheduler.slot(provider, model, priority):
+                call.reply = mock_llm.generate(prompt, json_mode)
+            return call.reply
+
+        client = self.get_client(provider, model)
+        key = (provider, model)
+        extra = self._request_kwargs(provider, json_mode)
+        try:
+            with track_llm_call(provider, prompt) as call, llm_scheduler.slot(provider, model, priority):
+                if provider == "gemini":
+                    resp = client.generate_content(prompt, **extra)
+                    text = getattr(resp, "text", "") or "[Gemini returned empty]"
+                else:
+                    resp = client.chat.completions.create(model=model, messages=[{"role": "user", "content": prompt}], **extra)
+                    text = resp.choices[0].message.content
+                call.reply, call.usage = text, _usage(resp)
+        except Exception:
+            self._record(key, error=True)
+            raise
+        self._record(key)
+        return text
+
+    async def agenerate(self, prompt: str, provider: Optional[str] = None, model: Optional[str] = None,
+                        priority: Optional[str] = None, json_mode: bool = False) -> str:
+        """Awaitable twin of generate() using the providers' async SDKs"""
+        if provider is None or model is None:
+            provider, model = resolve_provider()
+        if provider == "mock":
+            with track_llm_call(provider, prompt) as call:
+                async with llm_scheduler.aslot(provider, model, priority):
+                    call.reply = await mock_llm.agenerate(prompt, json_mode)
+            return call.reply
+
+        client = self.get_async_client(provider, model)
+        key = (provider, model)
+        extra = self._request_kwargs(provider, json_mode)
+        try:
+            with track_llm_call(provider, prompt) as call:
+                async with llm_scheduler.aslot(provider, model, priority):
+                    if provider == "gemini":
+                        resp = await client.generate_content_async(prompt, **extra)
+                        text = getattr(resp, "text", "") or "[Gemini returned empty]"
+                    else:
+                        resp = await client.chat.completions.create(model=model, messages=[{"role": "user", "content": prompt}], **extra)
+                        text = resp.choices[0].message.content
+                    call.reply, call.usage = text, _usage(resp)
+        except Exception:
+            self._record(key, error=True)
+            raise
+        self._record(key)
+        return text
+
+    def stream_generate(self, prompt: str, provider: Optional[str] = None, model: Optional[str] = None,
+                        priority: Optional[str] = None) -> Iterator[str]:
+        """
+        Stream a completion chunk by chunk on the pooled client
+
+        Yields:
+            Text chunks in generation order (mock provider chunks when none is configured)
+        """
+        if provider is None or model is None:
+            provider, model = resolve_provider()
+        if provider == "mock":
+            with track_llm_call(provider, prompt) as call, llm_scheduler.slot(provider, model, priority):
+                for text in mock_llm.stream(prompt):
+                    call.reply += text
+                    yield text
+            return
+
+        client = self.get_client(provider, model)
+        key = (provider, model)
+        try:
+            with track_llm_call(provider, prompt) as call, llm_scheduler.slot(provider, model, priority):
+                if provider == "gemini":
+                    for chunk in client.generate_content(prompt, stream=True):
+                        text = getattr(chunk, "text", "")
+                        if text:
+                            call.reply += text
+                            yield text
+                else:
+                    stream = client.chat.completions.create(
+                        model=model, messages=[{"role": "user", "content": prompt}], stream=True
+                    )
+                    for chunk in stream:
+                        text = chunk.choices[0].delta.content if chunk.choices else None
+                        if text:
+                            call.reply += text
+                            yield text
+        except Exception:
+            self._record(key, error=True)
+            raise
+        self._record(key)
+
+    async def astream_generate(self, prompt: str, provider: Optional[str] = None, model: Optional[str] = None,
+                               priority: Optional[str] = None) -> AsyncIterator[str]:
+        """Async stream_generate using the providers' async streaming APIs"""
+        if provider is None or model is None:
+            provider, model = resolve_provider()
+        if provider == "mock":
+            with track_llm_call(provider, prompt) as call:
+                async with llm_scheduler.aslot(provider, model, priority):
+                    async for chunk in mock_llm.astream(prompt):
+                        call.reply += chunk
+                        yield chunk
+            return
+
+        client = self.get_async_client(provider, model)
+        key = (provider, model)
+        try:
+            with track_llm_call(provider, prompt) as call:
+                async with llm_scheduler.aslot(provider, model, priority):
+                    if provider == "gemini":
+                        response = await client.generate_content_async(prompt, stream=True)
+                        async for chunk in response:
+                            text = getattr(chunk, "text", "")
+                            if text:
+                                call.reply += text
+                                yield text
+                    else:
+                        stream = await client.chat.completions.create(
+                            model=model, messages=[{"role": "user", "content": prompt}], stream=True
+                        )
+                        async for chunk in stream:
+                            text = chunk.choices[0].delta.content if chunk.choices else None
+                            if text:
+                                call.reply += text
+                                yield text
+        except Exception:
+            self._record(key, error=True)
+            raise
+        self._record(key)
+
+    def warm(self) -> Dict[str, Any]:
+        """Build the client for the configured provider ahead of the first request"""
+        provider, model = resolve_provider()
+        if provider != "mock":
+            try:
+                self.get_client(provider, model)
+            except Exception as e:
+                print(f"Warning: Could not warm {provider} client: {e}")
+        return self.stats()
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool statistics for health/metrics reporting"""
+        with self._lock:
+            clients = {
+                f"{provider}:{model}": dict(stats)
+                for (provider, model), stats in self._stats.items()
+            }
+        return {
+            "provider": ":".join(resolve_provider()),
+            "clients": clients,
+            "client_count": len(clients),
+            "mock": mock_llm.stats(),
+            "http_pool": {
+                "max_connections": LLM_POOL_MAX_CONNECTIONS,
+                "max_keepalive_connections": LLM_POOL_MAX_KEEPALIVE,
+                "keepalive_expiry": LLM_POOL_KEEPALIVE_EXPIRY
+            }
+        }
+
+    async def aclose(self):
+        """Release pooled connections, sync and async (called on shutdown)"""
+        async_http_client = self._async_http_client
+        self._async_http_client = None
+        if async_http_client is not None:
+            await async_http_client.aclose()
+        self.close()
+
+    def close(self):
+        """Release pooled sync connections"""
+        with self._lock:
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+            self._clients.clear()
+            self._async_clients.clear()
+            self._stats.clear()
+
+
+# Global instance
+llm_registry = LLMClientRegistry()
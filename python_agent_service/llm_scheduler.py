@@ -0,0 +1,273 @@
+"""
+LLM Admission Scheduler
+Global gate in front of every provider call: a token bucket per provider/model,
+a max-in-flight cap, and priority lanes so interactive coach chat is admitted
+ahead of batch resume analysis and background hackathon loops
+"""
+
+import os
+import asyncio
+import threading
+import time
+import itertools
+import contextvars
+from collections import deque
+from contextlib import contextmanager, asynccontextmanager
+from typing import Dict, Any, List, Optional, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Lower number = admitted first
+PRIORITIES = {"interactive": 0, "batch": 1, "background": 2}
+DEFAULT_PRIORITY = "batch"
+
+LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "16"))
+LLM_RATE_LIMIT_RPM = float(os.getenv("LLM_RATE_LIMIT_RPM", "120"))
+LLM_RATE_LIMIT_BURST = float(os.getenv("LLM_RATE_LIMIT_BURST", "10"))
+
+_current_priority: contextvars.ContextVar = contextvars.ContextVar("llm_priority", default=DEFAULT_PRIORITY)
+
+
+def current_priority() -> str:
+    """Priority lane for LLM calls made from the current request/task"""
+    return _current_priority.get()
+
+
+@contextmanager
+def llm_priority(priority: str):
+    """Run a block (and any tasks/threads spawned via asyncio from it) in the given lane"""
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown LLM priority: {priority}")
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def _rate_limit_rpm(provider: str) -> float:
+    """Per-provider override via LLM_RATE_LIMIT_RPM_<PROVIDER>, e.g. LLM_RATE_LIMIT_RPM_GEMINI=60"""
+    return float(os.getenv(f"LLM_RATE_LIMIT_RPM_{provider.upper()}", LLM_RATE_LIMIT_RPM))
+
+
+class TokenBucket:
+    """Classic token bucket; not thread-safe on its own (the scheduler lock guards it)"""
+
+    def __init__(self, rate_per_second: float, burst: float):
+        self.rate = rate_per_second
+        self.capacity = max(1.0, burst)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_take(self, now: float) -> bool:
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def seconds_until_token(self, now: float) -> float:
+        self._refill(now)
+        if self.tokens >= 1 or self.rate <= 0:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "key", "enqueued_at", "granted", "_event", "_loop", "_future")
+
+    def __init__(self, priority: int, seq: int, key: Tuple[str, str], loop=None):
+        self.priority = priority
+        self.seq = seq
+        self.key = key
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+        self._loop = loop
+        if loop is None:
+            self._event = threading.Event()
+            self._future = None
+        else:
+            self._event = None
+            self._future = loop.create_future()
+
+    def grant(self):
+        self.granted = True
+        if self._event is not None:
+            self._event.set()
+        else:
+            self._loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self):
+        if not self._future.done():
+            self._future.set_result(None)
+
+
+class LLMScheduler:
+    """Thread- and asyncio-safe admission control shared by sync and async LLM calls"""
+
+    def __init__(self, max_in_flight: int = LLM_MAX_IN_FLIGHT, burst: float = LLM_RATE_LIMIT_BURST):
+        self.max_in_flight = max(1, max_in_flight)
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._queue: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._in_flight = 0
+        self._timer: Optional[threading.Timer] = None
+
+        self._admitted = {name: 0 for name in PRIORITIES}
+        self._wait_total = {name: 0.0 for name in PRIORITIES}
+        self._wait_max = {name: 0.0 for name in PRIORITIES}
+        self._recent_waits = {name: deque(maxlen=500) for name in PRIORITIES}
+
+    # ----- Core dispatch (caller holds the lock) -----
+
+    def _bucket(self, key: Tuple[str, str]) -> Optional[TokenBucket]:
+        provider = key[0]
+        if provider == "mock":
+            return None
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(_rate_limit_rpm(provider) / 60.0, self.burst)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _dispatch(self):
+        if not self._queue:
+            return
+        now = time.monotonic()
+        self._queue.sort(key=lambda w: (w.priority, w.seq))
+        next_refill = None
+        remaining = []
+        for waiter in self._queue:
+            if self._in_flight >= self.max_in_flight:
+                remaining.append(waiter)
+                continue
+            bucket = self._bucket(waiter.key)
+            if bucket is None or bucket.try_take(now):
+                self._in_flight += 1
+                self._record_admit(waiter, now)
+                waiter.grant()
+            else:
+                remaining.append(waiter)
+                wait = bucket.seconds_until_token(now)
+                next_refill = wait if next_refill is None else min(next_refill, wait)
+        self._queue = remaining
+        if next_refill is not None and self._in_flight < self.max_in_flight:
+            self._schedule_refill(next_refill)
+
+    def _schedule_refill(self, delay: float):
+        if self._timer is not None and self._timer.is_alive():
+            return
+        self._timer = threading.Timer(max(delay, 0.001), self._on_refill)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_refill(self):
+        with self._lock:
+            self._timer = None
+            self._dispatch()
+
+    def _record_admit(self, waiter: _Waiter, now: float):
+        name = _priority_name(waiter.priority)
+        waited = now - waiter.enqueued_at
+        self._admitted[name] += 1
+        self._wait_total[name] += waited
+        self._wait_max[name] = max(self._wait_max[name], waited)
+        self._recent_waits[name].append(waited)
+
+    def _enqueue(self, priority: Optional[str], key: Tuple[str, str], loop=None) -> _Waiter:
+        lane = PRIORITIES.get(priority or current_priority(), PRIORITIES[DEFAULT_PRIORITY])
+        waiter = _Waiter(lane, next(self._seq), key, loop)
+        with self._lock:
+            self._queue.append(waiter)
+            self._dispatch()
+        return waiter
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+            self._dispatch()
+
+    def _abandon(self, waiter: _Waiter):
+        """Drop a waiter whose caller gave up; hand back its slot if it was already admitted"""
+        with self._lock:
+            if waiter in self._queue:
+                self._queue.remove(waiter)
+                return
+        if waiter.granted:
+            self._release()
+
+    # ----- Public API -----
+
+    @contextmanager
+    def slot(self, provider: str, model: str, priority: Optional[str] = None):
+        """Block the calling thread until an LLM call may start; release when the block exits"""
+        waiter = self._enqueue(priority, (provider, model))
+        try:
+            waiter._event.wait()
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def aslot(self, provider: str, model: str, priority: Optional[str] = None):
+        """Await admission without blocking the event loop; release when the block exits"""
+        waiter = self._enqueue(priority, (provider, model), loop=asyncio.get_running_loop())
+        try:
+            await waiter._future
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, in-flight count and wait-time metrics per priority lane"""
+        with self._lock:
+            depth = {name: 0 for name in PRIORITIES}
+            for waiter in self._queue:
+                depth[_priority_name(waiter.priority)] += 1
+            lanes = {}
+            for name in PRIORITIES:
+                admitted = self._admitted[name]
+                recent = sorted(self._recent_waits[name])
+                lanes[name] = {
+                    "queue_depth": depth[name],
+                    "admitted": admitted,
+                    "wait_avg_ms": round(self._wait_total[name] / admitted * 1000, 2) if admitted else 0.0,
+                    "wait_p95_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))] * 1000, 2) if recent else 0.0,
+                    "wait_max_ms": round(self._wait_max[name] * 1000, 2)
+                }
+            return {
+                "in_flight": self._in_flight,
+                "max_in_flight": self.max_in_flight,
+                "queue_depth": len(self._queue),
+                "lanes": lanes,
+                "rate_limits_rpm": {
+                    f"{provider}:{model}": round(bucket.rate * 60, 2)
+                    for (provider, model), bucket in self._buckets.items()
+                }
+            }
+
+
+def _priority_name(value: int) -> str:
+    for name, lane in PRIORITIES.items():
+        if lane == value:
+            return name
+    return DEFAULT_PRIORITY
+
+
+# Global instance
+llm_scheduler = LLMScheduler()
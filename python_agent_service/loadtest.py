@@ -0,0 +1,608 @@
+"""
+Offline Load Test
+Starts the agent service (uvicorn subprocess) against local stand-ins - a fake
+Node /api/agent-tools server, a fake GitHub API and the mock LLM - drives a
+weighted request mix at a target rate and reports per-route p50/p95/p99
+latency, throughput and error rate. Results are saved as JSON so runs before
+and after a change can be compared.
+
+Usage:
+    python loadtest.py --rate 20 --duration 30
+    python loadtest.py --mix coach=4,resume=2,pdf=1,matcher=2,hackathon=1 --llm-latency lognormal:400:0.5
+    python loadtest.py --compare loadtest_results/baseline.json
+    python loadtest.py --target http://localhost:8000   # drive an already running service
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import asyncio
+import argparse
+import threading
+import subprocess
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+import httpx
+
+SERVICE_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = SERVICE_DIR / "loadtest_results"
+
+DEFAULT_MIX = "coach=4,resume=2,pdf=1,matcher=2,hackathon=1"
+
+SKILL_POOL = [
+    "Python", "JavaScript", "TypeScript", "React", "Node.js", "FastAPI", "Django", "SQL",
+    "MongoDB", "Docker", "Kubernetes", "AWS", "Machine Learning", "PyTorch", "Figma", "Go",
+    "Rust", "GraphQL", "CI/CD", "Data Analysis"
+]
+LANGUAGES = ["Python", "JavaScript", "TypeScript", "Go", "Rust", "Java", None]
+
+COACH_MESSAGES = [
+    "How can I become a better backend engineer?",
+    "What should I learn next for machine learning roles?",
+    "Can you find teammates for my hackathon project?",
+    "Please analyze my resume for a data engineer role",
+    "Review my GitHub profile",
+    "What career path fits my skills?",
+    "How do I prepare for system design interviews?"
+]
+
+RESUME_TEMPLATE = """{name}
+{role} | {email} | github.com/{github}
+
+SUMMARY
+{years} years building web services and data pipelines. Focused on {skill_a} and {skill_b}.
+
+EXPERIENCE
+Senior Engineer, Acme Corp (2021 - Present)
+- Led migration of the order service to {skill_a}, cutting p95 latency by 40%
+- Built CI/CD pipelines and on-call tooling used by 6 teams
+
+Software Engineer, Globex (2018 - 2021)
+- Shipped {skill_b} features for 2M monthly users
+- Mentored 3 junior engineers
+
+EDUCATION
+B.Sc. Computer Science, State University (2018)
+
+SKILLS
+{skills}
+
+PROJECTS
+- Hackathon matcher: team recommendation engine ({skill_a}, {skill_c})
+- Open-source contributor to a popular {skill_c} library
+"""
+
+
+# ============ Synthetic data ============
+
+class Dataset:
+    """Deterministic users, projects and GitHub profiles shared by the stand-ins and the driver"""
+
+    def __init__(self, users: int = 200, seed: int = 7):
+        rng = random.Random(seed)
+        self.users = []
+        for i in range(users):
+            skills = rng.sample(SKILL_POOL, rng.randint(3, 7))
+            self.users.append({
+                "id": f"user{i:05d}",
+                "_id": f"user{i:05d}",
+                "name": f"Test User {i}",
+                "email": f"user{i}@example.com",
+                "skills": skills,
+                "interests": rng.sample(SKILL_POOL, 2),
+                "github_username": f"dev{i:05d}",
+                "bio": f"Engineer interested in {skills[0]}"
+            })
+        self.by_id = {user["id"]: user for user in self.users}
+        self.by_github = {user["github_username"]: user for user in self.users}
+
+    def projects(self, user_id: str) -> List[Dict[str, Any]]:
+        rng = random.Random(user_id)
+        return [
+            {"title": f"Project {n}", "description": "Synthetic project", "technologies": rng.sample(SKILL_POOL, 3)}
+            for n in range(rng.randint(1, 4))
+        ]
+
+    def hackathons(self, user_id: str) -> List[Dict[str, Any]]:
+        rng = random.Random(user_id + "h")
+        return [{"name": f"Hack {n}", "placement": rng.choice(["winner", "finalist", "participant"])}
+                for n in range(rng.randint(0, 3))]
+
+    def connections(self, user_id: str) -> List[Dict[str, Any]]:
+        rng = random.Random(user_id + "c")
+        return [{"id": user["id"], "name": user["name"]} for user in rng.sample(self.users, min(5, len(self.users)))]
+
+    def search(self, skills: List[str], exclude_id: Optional[str], limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        wanted = {skill.lower() for skill in skills}
+        matches = [
+            user for user in self.users
+            if user["id"] != exclude_id and (not wanted or wanted & {s.lower() for s in user["skills"]})
+        ]
+        return matches[offset:offset + limit]
+
+    def github_repos(self, username: str) -> List[Dict[str, Any]]:
+        rng = random.Random(username)
+        now = datetime.now(timezone.utc)
+        repos = []
+        for n in range(rng.randint(3, 12)):
+            updated = now.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+            repos.append({
+                "name": f"repo-{n}",
+                "full_name": f"{username}/repo-{n}",
+                "description": "Synthetic repository with README and tests",
+                "language": rng.choice(LANGUAGES),
+                "stargazers_count": rng.randint(0, 200),
+                "forks_count": rng.randint(0, 40),
+                "watchers_count": rng.randint(0, 200),
+                "open_issues_count": rng.randint(0, 10),
+                "size": rng.randint(10, 5000),
+                "fork": False,
+                "topics": rng.sample(["api", "ml", "web", "cli", "testing"], 2),
+                "has_wiki": rng.random() < 0.3,
+                "homepage": "",
+                "created_at": "2021-01-01T00:00:00Z",
+                "updated_at": updated,
+                "pushed_at": updated
+            })
+        return repos
+
+
+# ============ Local stand-ins ============
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """JSON handler; subclasses map paths to payloads in route()"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, like the Node/Express backend
+    disable_nagle_algorithm = True  # headers and body are separate writes; don't stall on delayed ACKs
+    dataset: Dataset = None
+    latency_ms: float = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, payload: Any):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, body: Optional[Dict[str, Any]] = None):
+        if self.latency_ms:
+            time.sleep(random.uniform(0.5, 1.5) * self.latency_ms / 1000)
+        url = urlparse(self.path)
+        result = self.route(url.path.rstrip("/").split("/"), parse_qs(url.query), body or {})
+        if result is None:
+            self._reply(404, {"error": "not found"})
+        else:
+            self._reply(200, result)
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            body = {}
+        self._handle(body)
+
+    def route(self, parts: List[str], query: Dict[str, List[str]], body: Dict[str, Any]) -> Optional[Any]:
+        raise NotImplementedError
+
+
+class NodeAPIHandler(_StandInHandler):
+    """
+    Fake Node backend: /api/agent-tools/{user,connections,projects,hackathons,skills}/:id, /users,
+    /search-users and the {users,skills,projects}/batch bulk lookups
+    """
+
+    def route(self, parts, query, body):
+        if parts[:3] != ["", "api", "agent-tools"] or len(parts) < 4:
+            return None
+        resource, rest = parts[3], parts[4:]
+        data = self.dataset
+        if rest == ["batch"]:
+            ids = [user_id for user_id in body.get("userIds", []) if user_id in data.by_id]
+            if resource == "users":
+                return {"users": {user_id: data.by_id[user_id] for user_id in ids}}
+            if resource == "skills":
+                return {"skills": {user_id: data.by_id[user_id]["skills"] for user_id in ids}}
+            if resource == "projects":
+                return {"projects": {user_id: data.projects(user_id) for user_id in ids}}
+            return None
+        if resource == "users":
+            skills = [s for s in (query.get("skills", [""])[0]).split(",") if s]
+            return {"users": data.search(skills, query.get("excludeId", [None])[0], 50)}
+        if resource == "search-users":
+            return {"users": data.search(body.get("skills") or [], body.get("excludeId"), body.get("limit") or 20,
+                                         body.get("offset") or 0)}
+        if not rest:
+            return None
+        user = data.by_id.get(rest[0])
+        if resource == "user":
+            return {"user": user} if user else None
+        if resource == "skills":
+            return {"skills": user["skills"] if user else []}
+        if resource == "projects":
+            return {"projects": data.projects(rest[0])}
+        if resource == "hackathons":
+            return {"hackathons": data.hackathons(rest[0])}
+        if resource == "connections":
+            return {"connections": data.connections(rest[0])}
+        return None
+
+
+class GitHubAPIHandler(_StandInHandler):
+    """Fake GitHub REST API: /users/:name and /users/:name/repos (single page)"""
+
+    def route(self, parts, query, body):
+        if len(parts) < 3 or parts[1] != "users":
+            return None
+        username = parts[2]
+        repos = self.dataset.github_repos(username)
+        if len(parts) == 4 and parts[3] == "repos":
+            page = int(query.get("page", ["1"])[0])
+            return repos if page == 1 else []
+        if len(parts) == 3:
+            return {
+                "login": username,
+                "name": username.title(),
+                "bio": "Synthetic GitHub profile",
+                "followers": len(repos) * 3,
+                "following": 10,
+                "public_repos": len(repos),
+                "created_at": "2019-01-01T00:00:00Z"
+            }
+        return None
+
+
+def start_stand_in(handler: type, dataset: Dataset, latency_ms: float) -> Tuple[ThreadingHTTPServer, str]:
+    """Serve a stand-in on a free localhost port in a daemon thread; returns (server, base_url)"""
+    handler_cls = type(handler.__name__, (handler,), {"dataset": dataset, "latency_ms": latency_ms})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_service(env: Dict[str, str], log_path: Path, port: Optional[int] = None,
+                  startup_timeout: float = 90.0) -> Tuple[subprocess.Popen, str]:
+    """Run main:app under uvicorn with the stand-in environment and wait for /ready (warm-up done)"""
+    port = port or _free_port()
+    log = open(log_path, "w")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=str(SERVICE_DIR), env={**os.environ, **env}, stdout=log, stderr=subprocess.STDOUT
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Service exited during startup (code {proc.returncode}); see {log_path}")
+        try:
+            if httpx.get(f"{base_url}/ready", timeout=2).status_code == 200:
+                return proc, base_url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.25)
+    proc.terminate()
+    raise RuntimeError(f"Service not ready after {startup_timeout:g}s; see {log_path}")
+
+
+# ============ Request mix ============
+
+def _sample_pdf(text: str) -> Optional[bytes]:
+    try:
+        import fitz
+    except ImportError:
+        return None
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_textbox(fitz.Rect(40, 40, 560, 800), text, fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class Scenarios:
+    """Builds one request per route name: (method, path, httpx kwargs)"""
+
+    def __init__(self, dataset: Dataset, seed: int):
+        self.dataset = dataset
+        self.rng = random.Random(seed)
+        self.resumes = [self._resume(user) for user in dataset.users[:20]]
+        self.pdfs = [pdf for pdf in (_sample_pdf(text) for text in self.resumes[:5]) if pdf]
+
+    def _resume(self, user: Dict[str, Any]) -> str:
+        skills = user["skills"] + ["SQL", "Docker", "Python"]
+        return RESUME_TEMPLATE.format(
+            name=user["name"], role="Software Engineer", email=user["email"], github=user["github_username"],
+            years=3 + len(user["skills"]), skill_a=skills[0], skill_b=skills[1], skill_c=skills[2],
+            skills=", ".join(user["skills"])
+        )
+
+    def available(self) -> List[str]:
+        routes = ["coach", "resume", "matcher", "hackathon", "github"]
+        return routes + (["pdf"] if self.pdfs else [])
+
+    def build(self, route: str) -> Tuple[str, str, Dict[str, Any]]:
+        user = self.rng.choice(self.dataset.users)
+        if route == "coach":
+            coach_user = {key: user[key] for key in ("id", "name", "email", "skills", "github_username")}
+            return "POST", "/api/agent/coach", {"json": {"message": self.rng.choice(COACH_MESSAGES), "user": coach_user}}
+        if route == "resume":
+            return "POST", "/api/agent/resume/analyze", {"json": {
+                "resume_text": self.rng.choice(self.resumes), "target_role": "Backend Engineer"
+            }}
+        if route == "pdf":
+            return "POST", "/api/agent/resume/analyze-pdf", {
+                "params": {"target_role": "Software Engineer"},
+                "files": {"file": ("resume.pdf", self.rng.choice(self.pdfs), "application/pdf")}
+            }
+        if route == "matcher":
+            return "POST", "/api/agent/matcher", {"json": {
+                "user_profile": {"user_id": user["id"], "skills": user["skills"],
+                                 "desired_skills": self.rng.sample(SKILL_POOL, 3)},
+                "action": "matchmake"
+            }}
+        if route == "hackathon":
+            return "POST", "/api/agent/hackathon/workflow", {"json": {
+                "duration": "48 hours",
+                "user_skills": user["skills"],
+                "required_skills": self.rng.sample(SKILL_POOL, 4),
+                "goal": "Build an AI study buddy",
+                "max_iterations": 2
+            }}
+        if route == "github":
+            return "POST", "/api/agent/github/analyze", {"json": {"username": user["github_username"]}}
+        raise ValueError(f"Unknown route: {route}")
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """"coach=4,resume=2" -> {"coach": 4.0, "resume": 2.0}"""
+    mix = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+# ============ Driver and report ============
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples: List[Tuple[float, int, Optional[str]]], elapsed: float) -> Dict[str, Any]:
+    """samples: (latency_s, status, error) per request"""
+    latencies = sorted(latency for latency, _, _ in samples)
+    errors = [sample for sample in samples if sample[2] or not 200 <= sample[1] < 300]
+    statuses: Dict[str, int] = {}
+    for _, status, error in samples:
+        key = str(status) if status else (error or "error")
+        statuses[key] = statuses.get(key, 0) + 1
+    return {
+        "requests": len(samples),
+        "errors": len(errors),
+        "error_rate": round(len(errors) / len(samples), 4) if samples else 0.0,
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 1),
+            "p95": round(percentile(latencies, 95) * 1000, 1),
+            "p99": round(percentile(latencies, 99) * 1000, 1),
+            "mean": round(sum(latencies) / len(latencies) * 1000, 1) if latencies else 0.0,
+            "max": round(latencies[-1] * 1000, 1) if latencies else 0.0
+        },
+        "status_codes": statuses
+    }
+
+
+async def drive(base_url: str, scenarios: Scenarios, mix: Dict[str, float], rate: float, duration: float,
+                max_in_flight: int, timeout: float, poisson: bool, seed: int) -> Dict[str, Any]:
+    """Open-loop load: requests start on schedule regardless of how slow earlier ones are (up to max_in_flight)"""
+    rng = random.Random(seed)
+    routes, weights = list(mix), list(mix.values())
+    samples: Dict[str, List[Tuple[float, int, Optional[str]]]] = {route: [] for route in routes}
+    gate = asyncio.Semaphore(max_in_flight)
+    late_starts = 0
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        async def one(route: str):
+            method, path, kwargs = scenarios.build(route)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, **kwargs)
+                samples[route].append((time.perf_counter() - started, response.status_code, None))
+            except httpx.HTTPError as e:
+                samples[route].append((time.perf_counter() - started, 0, type(e).__name__))
+            finally:
+                gate.release()
+
+        tasks = []
+        start = time.perf_counter()
+        next_at = 0.0
+        while next_at < duration:
+            delay = start + next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if gate.locked():
+                late_starts += 1
+            await gate.acquire()
+            tasks.append(asyncio.create_task(one(rng.choices(routes, weights)[0])))
+            next_at += rng.expovariate(rate) if poisson else 1 / rate
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+
+        try:
+            health = (await client.get("/health")).json()
+        except (httpx.HTTPError, ValueError):
+            health = None
+
+    all_samples = [sample for route_samples in samples.values() for sample in route_samples]
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "late_starts": late_starts,
+        "overall": summarize(all_samples, elapsed),
+        "routes": {route: summarize(route_samples, elapsed) for route, route_samples in samples.items() if route_samples},
+        "service_health": health
+    }
+
+
+def print_report(result: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None):
+    header = f"{'route':<12}{'reqs':>7}{'err%':>8}{'rps':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    print(header)
+    print("-" * len(header))
+    rows = list(result["routes"].items()) + [("ALL", result["overall"])]
+    for route, stats in rows:
+        lat = stats["latency_ms"]
+        print(f"{route:<12}{stats['requests']:>7}{stats['error_rate'] * 100:>7.1f}%{stats['throughput_rps']:>8.1f}"
+              f"{lat['p50']:>10.1f}{lat['p95']:>10.1f}{lat['p99']:>10.1f}")
+        if baseline is None:
+            continue
+        base = baseline["overall"] if route == "ALL" else baseline.get("routes", {}).get(route)
+        if not base:
+            continue
+        deltas = []
+        for key in ("p50", "p95", "p99"):
+            before = base["latency_ms"][key]
+            change = (lat[key] - before) / before * 100 if before else 0.0
+            deltas.append(f"{key} {change:+.0f}%")
+        err_change = (stats["error_rate"] - base["error_rate"]) * 100
+        print(f"{'':<12}  vs baseline: {', '.join(deltas)}, err {err_change:+.1f}pp, "
+              f"rps {stats['throughput_rps'] - base['throughput_rps']:+.1f}")
+    if result.get("late_starts"):
+        print(f"\n[WARN] {result['late_starts']} requests started late (max in-flight reached); "
+              "the service could not keep up with the target rate")
+
+
+def _git_rev() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=str(SERVICE_DIR),
+                              capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline load test for the agent service")
+    parser.add_argument("--rate", type=float, default=10.0, help="Target request rate (req/s)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Route weights (default {DEFAULT_MIX}; also: github)")
+    parser.add_argument("--poisson", action="store_true", help="Exponential inter-arrival times instead of a fixed interval")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="Client-side cap on concurrent requests")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout (s)")
+    parser.add_argument("--llm-latency", default="lognormal:300:0.5", help="MOCK_LLM_LATENCY spec for the service")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0, help="MOCK_LLM_ERROR_RATE for the service")
+    parser.add_argument("--backend-latency-ms", type=float, default=15.0, help="Mean latency of the fake Node/GitHub APIs")
+    parser.add_argument("--users", type=int, default=200, help="Synthetic users in the fake Node API")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="Extra service environment (repeatable)")
+    parser.add_argument("--target", help="Drive an already running service at this URL instead of starting one")
+    parser.add_argument("--label", default="", help="Name stored with the results (e.g. 'before-cache')")
+    parser.add_argument("--out", help="Results JSON path (default loadtest_results/<timestamp>.json)")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    dataset = Dataset(args.users, args.seed)
+    scenarios = Scenarios(dataset, args.seed)
+    mix = parse_mix(args.mix)
+    unknown = set(mix) - set(scenarios.available())
+    if unknown:
+        parser.error(f"Unknown or unavailable routes in --mix: {', '.join(sorted(unknown))}")
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    service_env = {}
+    proc = None
+    stand_ins = []
+    try:
+        if args.target:
+            base_url = args.target.rstrip("/")
+        else:
+            node_server, node_url = start_stand_in(NodeAPIHandler, dataset, args.backend_latency_ms)
+            github_server, github_url = start_stand_in(GitHubAPIHandler, dataset, args.backend_latency_ms)
+            stand_ins = [node_server, github_server]
+            service_env = {
+                "NODE_API_URL": node_url,
+                "GITHUB_API_URL": github_url,
+                "LLM_PROVIDER": "mock",
+                "MOCK_LLM_LATENCY": args.llm_latency,
+                "MOCK_LLM_ERROR_RATE": str(args.llm_error_rate),
+                "MOCK_LLM_SEED": str(args.seed),
+                "LLM_CACHE_ENABLED": "false"
+            }
+            for item in args.env:
+                key, _, value = item.partition("=")
+                service_env[key] = value
+            print(f"[INFO] Fake Node API at {node_url}, fake GitHub at {github_url}")
+            proc, base_url = start_service(service_env, RESULTS_DIR / f"{stamp}-service.log")
+            print(f"[INFO] Service up at {base_url}")
+
+        print(f"[INFO] Driving {args.rate:g} req/s for {args.duration:g}s, mix {mix}")
+        result = asyncio.run(drive(base_url, scenarios, mix, args.rate, args.duration,
+                                   args.max_in_flight, args.timeout, args.poisson, args.seed))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        for server in stand_ins:
+            server.shutdown()
+
+    report = {
+        "label": args.label,
+        "started_at": stamp,
+        "git_rev": _git_rev(),
+        "config": {
+            "rate": args.rate,
+            "duration": args.duration,
+            "mix": mix,
+            "poisson": args.poisson,
+            "max_in_flight": args.max_in_flight,
+            "llm_latency": args.llm_latency,
+            "llm_error_rate": args.llm_error_rate,
+            "backend_latency_ms": args.backend_latency_ms,
+            "users": args.users,
+            "seed": args.seed,
+            "target": args.target,
+            "service_env": service_env
+        },
+        **result
+    }
+    out = Path(args.out) if args.out else RESULTS_DIR / f"{stamp}.json"
+    out.write_text(json.dumps(report, indent=2, default=str))
+
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    print()
+    print_report(report, baseline)
+    print(f"\n[INFO] Results saved to {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,52 +4,96 @@ Exposes both Career Agent and Matcher Agent workflows
 Uses real MongoDB data via Node.js API
 """
 
-from fastapi import FastAPI, HTTPException, UploadFile, File
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+# Imported first so the rest of the service's import time is measured
+from startup import startup_state, load_module_as
+
+with startup_state.timed_import("fastapi"):
+    from fastapi import FastAPI, HTTPException, UploadFile, File, Request, Header
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import StreamingResponse, JSONResponse, PlainTextResponse
+    from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Callable
 import sys
 import os
+import json
+import hmac
+import asyncio
+import time
 from pathlib import Path
 
-# Import agent tools for database access
-from tools import agent_tools
-from pdf_utils import extract_text_from_pdf
-
-# Add agent folders to path - IMPORTANT: Order matters!
+with startup_state.timed_import("service_runtime"):
+    # Import agent tools for database access
+    from tools import agent_tools, async_agent_tools
+    from tools_cache import agent_tools_cache, RESOURCE_TTL_DEFAULTS, AGENT_SERVICE_TOKEN
+    from pdf_utils import extract_text_from_pdf
+    from llm_clients import llm_registry
+    from llm_cache import llm_cache
+    from llm_calls import acall_llm, astream_llm
+    from llm_scheduler import llm_scheduler, llm_priority
+    from prompt_budget import budget_text, fit_sections, prompt_budget_stats
+    from structured_output import structured_output_stats
+    from executors import run_io, run_cpu, io_executor, cpu_executor, fanout_executor, executor_stats, ExecutorSaturatedError
+    from jobs import job_manager, stream_graph, JOBS_EVENTS_POLL_INTERVAL
+    from singleflight import single_flight, flight_key, normalize_text
+    from metrics import metrics, http_request_seconds, coach_branch_seconds, call_site
+    from tracing import trace_exporter, request_scope, span
+    from admission import admission_control, AdmissionRejected
+    from response_encoding import FastJSONResponse, ResponseEncodingMiddleware, response_stats
+
+# Agent folders: career_agent is on sys.path; agentic_zip's same-named
+# graph.py/common.py are loaded lazily as matcher_graph/matcher_common
 career_agent_path = str(Path(__file__).parent / "career_agent")
 agentic_zip_path = str(Path(__file__).parent / "agentic_zip")
 
-# Insert career_agent first so its modules take precedence
 sys.path.insert(0, career_agent_path)
-sys.path.insert(1, agentic_zip_path)
 
 # Import career agent workflows
 try:
-    from graph import (
-        full_career_development_workflow,
-        quick_skill_analysis_workflow,
-        enhanced_resume_analysis_graph_workflow
-    )
-    from common import extract_github_data, enhanced_resume_analysis_workflow
+    with startup_state.timed_import("career_agent"):
+        from graph import (
+            full_career_development_workflow,
+            quick_skill_analysis_workflow,
+            enhanced_resume_analysis_graph_workflow,
+            get_career_graph,
+            get_quick_analysis_graph
+        )
+        from common import (
+            extract_github_data,
+            enhanced_resume_analysis_workflow,
+            aenhanced_resume_analysis_workflow
+        )
     career_agent_imported = True
 except ImportError as e:
     print(f"Warning: Could not import career agent: {e}")
     career_agent_imported = False
 
-# Now switch to agentic_zip for matcher imports
-sys.path.insert(0, agentic_zip_path)
+startup_state.imports_done()
 
-# Import matcher agent workflows
-try:
-    import graph as matcher_graph
-    import common as matcher_common
-    matcher_agent_imported = True
-except ImportError as e:
-    print(f"Warning: Could not import matcher agent: {e}")
-    matcher_agent_imported = False
+def load_matcher_agent():
+    """
+    Matcher/hackathon agent modules (langchain_community), imported on
+    first use - normally by the startup warm-up, not on the import path
 
-app = FastAPI(title="SyncUp AI Agent Service", version="1.0.0")
+    Returns:
+        (matcher_graph, matcher_common) modules
+    """
+    def load():
+        # agentic_zip's graph imports matcher_common, so common must be registered first
+        matcher_common = load_module_as("matcher_common", os.path.join(agentic_zip_path, "common.py"))
+        matcher_graph = load_module_as("matcher_graph", os.path.join(agentic_zip_path, "graph.py"))
+        return matcher_graph, matcher_common
+    return startup_state.lazy("matcher_agent", load)
+
+async def require_matcher_agent(detail: str):
+    """load_matcher_agent off the event loop, surfacing any load failure as 503"""
+    try:
+        return await run_io(load_matcher_agent)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"{detail}: {e}")
+
+# FastJSONResponse: orjson rendering plus ?fields= projection on every JSON endpoint
+app = FastAPI(title="SyncUp AI Agent Service", version="1.0.0", default_response_class=FastJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -60,6 +104,96 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Per-route latency histogram (route template, so path ids don't explode the label set)"""
+    if not metrics.enabled:
+        return await call_next(request)
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        http_request_seconds.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=status
+        )
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    """Root span per request; every span below it carries the request id (echoed as X-Request-ID).
+    The root span also gets the request's prompt-budget savings when any prompt was budgeted"""
+    with request_scope(request.headers.get("x-request-id")) as request_id, \
+            span(f"{request.method} {request.url.path}", "http", method=request.method) as root:
+        response = await call_next(request)
+        route = request.scope.get("route")
+        root.name = f"{request.method} {getattr(route, 'path', request.url.path)}"
+        root.set(status=response.status_code)
+        budget = prompt_budget_stats.for_request(request_id)
+        if budget:
+            root.set(prompt_tokens_before=budget["tokens_before"], prompt_tokens_saved=budget["tokens_saved"])
+    response.headers["X-Request-ID"] = request_id
+    return response
+
+# Added last so it is outermost: compresses the final body, binds ?fields= for every layer below
+app.add_middleware(ResponseEncodingMiddleware)
+
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected(request: Request, exc: AdmissionRejected):
+    """Fast 503 so clients back off instead of piling onto a saturated route class"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc), "reason": exc.reason, "retry_after": exc.retry_after},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+def client_key(http_request: Request, user_id: Optional[str] = None) -> str:
+    """Fair-share identity for admission control: user id, else X-User-ID header, else client address"""
+    if user_id and user_id != "default":
+        return user_id
+    header = http_request.headers.get("x-user-id")
+    if header:
+        return header
+    return http_request.client.host if http_request.client else "anonymous"
+
+# ============ Lifecycle ============
+
+@app.on_event("startup")
+async def warm_llm_clients():
+    """Build pooled LLM clients before the first request arrives"""
+    llm_registry.warm()
+
+@app.on_event("startup")
+async def warm_agent_graphs():
+    """Compile the agent graphs in the background; /ready turns 200 once the required ones are built"""
+    steps = []
+    if career_agent_imported:
+        steps += [("career_graph", get_career_graph), ("quick_analysis_graph", get_quick_analysis_graph)]
+    steps += [
+        ("matcher_agent", load_matcher_agent),
+        ("matcher_graph", lambda: load_matcher_agent()[0].get_graph())
+    ]
+    # Only the hackathon planner needs it; the service is usable without it
+    optional_steps = [("hackathon_graph", lambda: load_matcher_agent()[0].get_hackathon_graph())]
+    startup_state.start_warmup(steps, optional_steps)
+
+@app.on_event("shutdown")
+async def close_llm_clients():
+    await llm_registry.aclose()
+    llm_cache.close()
+    io_executor.shutdown()
+    cpu_executor.shutdown()
+    fanout_executor.shutdown()
+    job_manager.shutdown()
+    trace_exporter.close()
+    agent_tools.close()
+    await async_agent_tools.aclose()
+
 # ============ Request/Response Models ============
 
 class CareerCoachRequest(BaseModel):
@@ -75,6 +209,7 @@ class ResumeAnalysisRequest(BaseModel):
     resume_text: str
     target_role: str = "Software Engineer"
     user_id: str = "default"
+    analysis_mode: Optional[str] = None  # per_section, batched (default: RESUME_ANALYSIS_MODE)
 
 class GitHubAnalysisRequest(BaseModel):
     username: str
@@ -92,68 +227,83 @@ class HackathonWorkflowRequest(BaseModel):
     goal: str
     max_iterations: int = 5
 
+class CacheInvalidationRequest(BaseModel):
+    user_id: Optional[str] = None  # None (and no user_ids) = every user
+    user_ids: Optional[List[str]] = None  # several users at once (e.g. every member of a changed team)
+    resources: Optional[List[str]] = None  # profile, skills, projects, hackathons, connections; None = all
+
 # ============ Career Agent Endpoints ============
 
-@app.post("/api/agent/coach")
-async def career_coach(request: CareerCoachRequest):
+@dataclass
+class CoachPlan:
     """
-    Career Coach - Provides conversational AI coaching and guidance
-    Uses the career agent's full workflow capabilities
-    USES REAL DATABASE DATA via Node.js API
+    How a coach message will be answered: either a ready result, or an LLM
+    prompt plus a finalize step that turns the reply into the response body
     """
-    if not career_agent_imported:
-        raise HTTPException(status_code=503, detail="Career agent not available")
-    
-    try:
-        user = request.user
-        message = request.message
-        
-        print(f"[DEBUG] Received message: {message[:100]}...")
-        print(f"[DEBUG] User ID: {user.get('id')}")
-        
-        # Get real user data from database
-        user_id = user.get("id")
-        if user_id:
-            db_user = agent_tools.get_user_profile(user_id)
-            user_projects = agent_tools.get_user_projects(user_id)
-            user_hackathons = agent_tools.get_user_hackathons(user_id)
-            user_connections = agent_tools.get_user_connections(user_id)
-            
-            # Enrich user context with real DB data
-            user["db_profile"] = db_user
-            user["projects"] = user_projects
-            user["hackathons"] = user_hackathons
-            user["connections"] = user_connections
-            user["connection_count"] = len(user_connections)
-        
-        # Determine if this is a workflow request or simple chat
-        message_lower = message.lower()
-        
-        print(f"[DEBUG] Message contains 'resume': {'resume' in message_lower}")
-        print(f"[DEBUG] Message contains 'analyze': {'analyze' in message_lower}")
-        
-        # Check if user wants resume analysis
-        # The resume text is in the message itself after "suggestions:"
-        if "resume" in message_lower and "analyze" in message_lower:
-            # Extract resume text from message (it comes after the prompt)
-            resume_text = None
-            if "suggestions:" in message or "suggestions:\n\n" in message:
-                # Resume text is after the prompt
-                parts = message.split("suggestions:", 1)
-                if len(parts) > 1:
-                    resume_text = parts[1].strip()
-            
-            # If no resume in message, check user profile
-            if not resume_text:
-                resume_text = user.get("resume_text")
-            
-            if resume_text:
-                print(f"[DEBUG] Analyzing resume, length: {len(resume_text)}")
-                # Use the default chat handler with resume analysis context
-                # This will use call_llm which works
-                from common import call_llm
-                
-                analysis_prompt = f"""
+    route: str
+    prompt: Optional[str] = None
+    finalize: Optional[Callable[[str], Dict[str, Any]]] = None
+    result: Optional[Dict[str, Any]] = None
+
+def classify_coach_message(message: str) -> str:
+    """Route type for a coach message (decided from the text alone, before any DB/LLM work)"""
+    message_lower = message.lower()
+    if "resume" in message_lower and "analyze" in message_lower:
+        return "resume_analysis"
+    if "github" in message_lower and ("analyze" in message_lower or "profile" in message_lower):
+        return "github_analysis"
+    if any(word in message_lower for word in ["teammate", "team member", "find team", "team match"]):
+        return "team_matching"
+    if any(word in message_lower for word in ["career path", "learning path", "mentor", "portfolio"]):
+        return "full_workflow"
+    return "chat"
+
+async def plan_coach_reply(request: CareerCoachRequest, route: str) -> CoachPlan:
+    """Gather DB context for a coach message and decide how to answer it"""
+    user = request.user
+    message = request.message
+
+    print(f"[DEBUG] Received message: {message[:100]}...")
+    print(f"[DEBUG] User ID: {user.get('id')}")
+
+    # Get real user data from database (concurrently, bounded by USER_CONTEXT_DEADLINE)
+    user_id = user.get("id")
+    if user_id:
+        context = await async_agent_tools.fetch_user_context(user_id)
+
+        # Enrich user context with real DB data
+        user["db_profile"] = context["profile"]
+        user["projects"] = context["projects"]
+        user["hackathons"] = context["hackathons"]
+        user["connections"] = context["connections"]
+        user["connection_count"] = len(context["connections"])
+        user["context_missing"] = context["missing"]
+
+    message_lower = message.lower()
+
+    print(f"[DEBUG] Message contains 'resume': {'resume' in message_lower}")
+    print(f"[DEBUG] Message contains 'analyze': {'analyze' in message_lower}")
+
+    # Check if user wants resume analysis
+    # The resume text is in the message itself after "suggestions:"
+    resume_text = None
+    if route == "resume_analysis":
+        # Extract resume text from message (it comes after the prompt)
+        if "suggestions:" in message or "suggestions:\n\n" in message:
+            # Resume text is after the prompt
+            parts = message.split("suggestions:", 1)
+            if len(parts) > 1:
+                resume_text = parts[1].strip()
+
+        # If no resume in message, check user profile
+        if not resume_text:
+            resume_text = user.get("resume_text")
+
+    # Without a resume / GitHub username these routes fall through to the default chat reply
+    if route == "resume_analysis" and resume_text:
+        print(f"[DEBUG] Analyzing resume, length: {len(resume_text)}")
+        # Use the default chat handler with resume analysis context
+        analysis_prompt = f"""
 You are an expert ATS (Applicant Tracking System) resume analyzer and career coach.
 
 Analyze this resume and provide a WELL-STRUCTURED analysis using this EXACT format:
@@ -217,53 +367,54 @@ Analyze this resume and provide a WELL-STRUCTURED analysis using this EXACT form
 ---
 
 RESUME TEXT:
-{resume_text}
+{budget_text("coach_resume", resume_text)}
 
 Provide your structured analysis following the format above EXACTLY:
 """
-                
-                reply = call_llm(analysis_prompt)
-                
-                return {
-                    "type": "resume_analysis",
-                    "reply": reply,
-                    "message": reply
-                }
-        
-        # Check if user wants GitHub analysis
-        elif "github" in message_lower and ("analyze" in message_lower or "profile" in message_lower):
-            if user.get("github_username"):
-                result = extract_github_data(user["github_username"])
-                return {
-                    "type": "github_analysis",
-                    "result": result,
-                    "message": f"I've analyzed the GitHub profile for {user['github_username']}:"
-                }
-        
-        # Check if user wants teammates (USES REAL DB DATA)
-        elif any(word in message_lower for word in ["teammate", "team member", "find team", "team match"]):
-            # Extract required skills from message or use user's skills
-            user_skills = user.get("skills", [])
-            
-            # Find real teammates from database
-            teammates = agent_tools.find_teammates(
-                user_id=user_id,
-                required_skills=user_skills
-            )
-            
-            if teammates:
-                # Use AI to provide reasoning for matches
-                from common import call_llm
-                
-                teammates_summary = ""
-                for i, teammate in enumerate(teammates[:5], 1):
-                    teammates_summary += f"\n{i}. {teammate['name']} (Match: {teammate['match_score']}/10)"
-                    teammates_summary += f"\n   Skills: {', '.join(teammate.get('skills', [])[:5])}"
-                    teammates_summary += f"\n   Complements: {', '.join(teammate.get('complement_skills', []))}"
-                    if teammate.get('bio'):
-                        teammates_summary += f"\n   Bio: {teammate['bio'][:80]}"
-                
-                ai_prompt = f"""
+
+        return CoachPlan(
+            route=route,
+            prompt=analysis_prompt,
+            finalize=lambda reply: {
+                "type": "resume_analysis",
+                "reply": reply,
+                "message": reply
+            }
+        )
+
+    # Check if user wants GitHub analysis
+    elif route == "github_analysis" and user.get("github_username"):
+        result = await github_analysis(user["github_username"])
+        return CoachPlan(route=route, result={
+            "type": "github_analysis",
+            "result": result,
+            "message": f"I've analyzed the GitHub profile for {user['github_username']}:"
+        })
+
+    # Check if user wants teammates (USES REAL DB DATA)
+    elif route == "team_matching":
+        # Extract required skills from message or use user's skills
+        user_skills = user.get("skills", [])
+
+        # Find real teammates from database
+        teammates = await async_agent_tools.find_teammates(
+            user_id=user_id,
+            required_skills=user_skills,
+            # The context fetch already loaded the profile; reuse its skills when present
+            user_skills=(user.get("db_profile") or {}).get("skills")
+        )
+
+        if teammates:
+            # Use AI to provide reasoning for matches
+            teammates_summary = ""
+            for i, teammate in enumerate(teammates[:5], 1):
+                teammates_summary += f"\n{i}. {teammate['name']} (Match: {teammate['match_score']}/10)"
+                teammates_summary += f"\n   Skills: {', '.join(teammate.get('skills', [])[:5])}"
+                teammates_summary += f"\n   Complements: {', '.join(teammate.get('complement_skills', []))}"
+                if teammate.get('bio'):
+                    teammates_summary += f"\n   Bio: {teammate['bio'][:80]}"
+
+            ai_prompt = f"""
 You are the SyncUp AI Coach. I found {len(teammates)} potential teammates from our REAL database.
 
 USER'S PROFILE:
@@ -279,9 +430,8 @@ Provide a brief analysis (2-3 paragraphs):
 
 Be specific and evidence-based. Reference their actual skills.
 """
-                
-                ai_analysis = call_llm(ai_prompt)
-                
+
+            def finalize_team_matching(ai_analysis: str) -> Dict[str, Any]:
                 response = f"**Found {len(teammates)} Real Teammates from Database**\n\n{ai_analysis}\n\n**Detailed Matches:**\n"
                 for i, teammate in enumerate(teammates[:5], 1):
                     response += f"\n{i}. **{teammate['name']}** (Match: {teammate['match_score']}/10)"
@@ -290,94 +440,113 @@ Be specific and evidence-based. Reference their actual skills.
                     if teammate.get('bio'):
                         response += f"\n   • {teammate['bio'][:100]}"
                     response += "\n"
-                
+
                 return {
                     "type": "team_matching",
                     "teammates": teammates,
                     "message": response,
                     "ai_analysis": ai_analysis
                 }
-            else:
-                # Even with no perfect match, suggest best available
-                all_users = agent_tools.get_all_users(exclude_id=user_id)
-                
-                if all_users:
-                    response = f"I didn't find perfect matches, but here are {len(all_users[:3])} users from our database who might still work:\n\n"
-                    for i, user_candidate in enumerate(all_users[:3], 1):
-                        response += f"{i}. **{user_candidate['name']}**\n"
-                        response += f"   - Skills: {', '.join(user_candidate.get('skills', [])[:5])}\n"
-                        if user_candidate.get('bio'):
-                            response += f"   - Bio: {user_candidate['bio'][:100]}\n"
-                        response += "\n"
-                    response += "\n**Recommendation**: Consider reaching out to discuss your project goals. Sometimes the best teams form from diverse backgrounds!"
-                else:
-                    response = "No users found in the database yet. As more people join SyncUp, I'll be able to suggest better matches!"
-                
-                return {
-                    "type": "team_matching",
-                    "teammates": all_users[:3] if all_users else [],
-                    "message": response
-                }
-        
-        # Check if user wants full career workflow
-        elif any(word in message_lower for word in ["career path", "learning path", "mentor", "portfolio"]):
-            # Run full career development workflow
-            input_data = user.get("resume_text") or user.get("github_username", "")
-            input_type = "resume" if user.get("resume_text") else "github"
-            target_role = user.get("target_role", "Software Engineer")
-            
-            result = full_career_development_workflow(
-                input_data=input_data,
-                input_type=input_type,
-                target_role=target_role,
-                user_id=user.get("id", "default")
-            )
-            
-            return {
-                "type": "full_workflow",
-                "result": {
-                    "skill_profile": result.skill_profile.model_dump() if result.skill_profile else None,
-                    "learning_path": result.learning_path.model_dump() if result.learning_path else None,
-                    "portfolio_projects": [p.model_dump() for p in result.portfolio_projects],
-                    "mentor_matches": [m.model_dump() for m in result.mentor_matches],
-                    "trace": result.trace
-                },
-                "message": "I've created a complete career development plan for you:"
-            }
-        
-        # Default: Simple conversational response with DB context
+
+            return CoachPlan(route=route, prompt=ai_prompt, finalize=finalize_team_matching)
         else:
-            print("[DEBUG] Entering default chat response handler")
-            # Use real DB data for context
-            user_context = {
-                "name": user.get("name", ""),
-                "skills": user.get("skills", []),
-                "bio": user.get("bio", ""),
-                "experience": user.get("experience", ""),
-                "projects_count": len(user.get("projects", [])),
-                "hackathons_count": len(user.get("hackathons", [])),
-                "connections_count": user.get("connection_count", 0)
-            }
-            
-            # Generate contextual response with real data
-            from common import call_llm
-            
-            # Get detailed project and hackathon info if available
-            projects_detail = ""
-            if user.get("projects"):
-                projects_detail = "\n\nUser's Projects:"
-                for proj in user["projects"][:3]:
-                    projects_detail += f"\n- {proj.get('name', 'Unnamed')}: {proj.get('description', 'No description')}"
-                    if proj.get('techStack'):
-                        projects_detail += f" (Tech: {', '.join(proj['techStack'][:3])})"
-            
-            hackathons_detail = ""
-            if user.get("hackathons"):
-                hackathons_detail = "\n\nUser's Hackathons:"
-                for hack in user["hackathons"][:3]:
-                    hackathons_detail += f"\n- {hack.get('name', 'Unnamed')}: {hack.get('theme', 'No theme')}"
-            
-            context_str = f"""
+            # Even with no perfect match, suggest best available
+            all_users = await async_agent_tools.get_all_users(exclude_id=user_id)
+
+            if all_users:
+                response = f"I didn't find perfect matches, but here are {len(all_users[:3])} users from our database who might still work:\n\n"
+                for i, user_candidate in enumerate(all_users[:3], 1):
+                    response += f"{i}. **{user_candidate['name']}**\n"
+                    response += f"   - Skills: {', '.join(user_candidate.get('skills', [])[:5])}\n"
+                    if user_candidate.get('bio'):
+                        response += f"   - Bio: {user_candidate['bio'][:100]}\n"
+                    response += "\n"
+                response += "\n**Recommendation**: Consider reaching out to discuss your project goals. Sometimes the best teams form from diverse backgrounds!"
+            else:
+                response = "No users found in the database yet. As more people join SyncUp, I'll be able to suggest better matches!"
+
+            return CoachPlan(route=route, result={
+                "type": "team_matching",
+                "teammates": all_users[:3] if all_users else [],
+                "message": response
+            })
+
+    # Check if user wants full career workflow
+    elif route == "full_workflow":
+        # Run full career development workflow
+        input_data = user.get("resume_text") or user.get("github_username", "")
+        input_type = "resume" if user.get("resume_text") else "github"
+        target_role = user.get("target_role", "Software Engineer")
+
+        result = await run_io(
+            full_career_development_workflow,
+            input_data=input_data,
+            input_type=input_type,
+            target_role=target_role,
+            user_id=user.get("id", "default")
+        )
+
+        return CoachPlan(route=route, result={
+            "type": "full_workflow",
+            "result": {
+                "skill_profile": result.skill_profile.model_dump() if result.skill_profile else None,
+                "learning_path": result.learning_path.model_dump() if result.learning_path else None,
+                "portfolio_projects": [p.model_dump() for p in result.portfolio_projects],
+                "mentor_matches": [m.model_dump() for m in result.mentor_matches],
+                "trace": result.trace
+            },
+            "message": "I've created a complete career development plan for you:"
+        })
+
+    # Default: Simple conversational response with DB context
+    print("[DEBUG] Entering default chat response handler")
+    # Use real DB data for context
+    user_context = {
+        "name": user.get("name", ""),
+        "skills": user.get("skills", []),
+        "bio": user.get("bio", ""),
+        "experience": user.get("experience", ""),
+        "projects_count": len(user.get("projects", [])),
+        "hackathons_count": len(user.get("hackathons", [])),
+        "connections_count": user.get("connection_count", 0),
+        "context_missing": user.get("context_missing", [])
+    }
+
+    # Get detailed project and hackathon info if available
+    projects_detail = ""
+    if user.get("projects"):
+        projects_detail = "\n\nUser's Projects:"
+        for proj in user["projects"][:3]:
+            projects_detail += f"\n- {proj.get('name', 'Unnamed')}: {proj.get('description', 'No description')}"
+            if proj.get('techStack'):
+                projects_detail += f" (Tech: {', '.join(proj['techStack'][:3])})"
+
+    hackathons_detail = ""
+    if user.get("hackathons"):
+        hackathons_detail = "\n\nUser's Hackathons:"
+        for hack in user["hackathons"][:3]:
+            hackathons_detail += f"\n- {hack.get('name', 'Unnamed')}: {hack.get('theme', 'No theme')}"
+
+    # What the user's connections are building: one batch lookup for the first few
+    connections_detail = ""
+    connections = user.get("connections", [])[:5]
+    if connections:
+        connection_projects = await async_agent_tools.get_projects_by_ids([c.get("id") for c in connections])
+        connections_detail = "\n\nUser's Connections:"
+        for connection, projects in zip(connections, connection_projects):
+            connections_detail += f"\n- {connection.get('name', 'Unnamed')}"
+            if connection.get('skills'):
+                connections_detail += f" (Skills: {', '.join(connection['skills'][:3])})"
+            if projects:
+                connections_detail += f": working on {', '.join(p.get('name', 'Unnamed') for p in projects[:2])}"
+
+    # Keep DB context within the chat budget (connections, then hackathons, are trimmed before projects)
+    detail = fit_sections("coach_chat", [("projects", projects_detail), ("hackathons", hackathons_detail),
+                                         ("connections", connections_detail)])
+    projects_detail, hackathons_detail = detail["projects"], detail["hackathons"]
+    connections_detail = detail["connections"]
+
+    context_str = f"""
 You are the SyncUp AI Coach, a multi-role Agentic AI assistant.
 
 REAL DATABASE DATA FOR THIS USER:
@@ -387,7 +556,7 @@ REAL DATABASE DATA FOR THIS USER:
 - Experience: {user_context['experience']}
 - Projects: {user_context['projects_count']} projects in database
 - Hackathons: {user_context['hackathons_count']} hackathons participated
-- Connections: {user_context['connections_count']} connections{projects_detail}{hackathons_detail}
+- Connections: {user_context['connections_count']} connections{projects_detail}{hackathons_detail}{connections_detail}
 
 User Question: {message}
 
@@ -408,31 +577,116 @@ FORMATTING GUIDELINES:
 
 Respond as the SyncUp AI Coach with proper formatting:
 """
-            
-            reply = call_llm(context_str)
-            
-            print(f"[DEBUG] LLM Reply length: {len(reply)}")
-            print(f"[DEBUG] LLM Reply preview: {reply[:200]}")
-            
-            response_data = {
-                "type": "chat",
-                "reply": reply,
-                "message": reply,
-                "user_stats": user_context
-            }
-            
-            print(f"[DEBUG] Returning response with keys: {response_data.keys()}")
-            
-            return response_data
-            
+
+    def finalize_chat(reply: str) -> Dict[str, Any]:
+        print(f"[DEBUG] LLM Reply length: {len(reply)}")
+        print(f"[DEBUG] LLM Reply preview: {reply[:200]}")
+
+        response_data = {
+            "type": "chat",
+            "reply": reply,
+            "message": reply,
+            "user_stats": user_context
+        }
+
+        print(f"[DEBUG] Returning response with keys: {response_data.keys()}")
+
+        return response_data
+
+    return CoachPlan(route=route, prompt=context_str, finalize=finalize_chat)
+
+@app.post("/api/agent/coach")
+async def career_coach(request: CareerCoachRequest):
+    """
+    Career Coach - Provides conversational AI coaching and guidance
+    Uses the career agent's full workflow capabilities
+    USES REAL DATABASE DATA via Node.js API
+    """
+    if not career_agent_imported:
+        raise HTTPException(status_code=503, detail="Career agent not available")
+
+    route = classify_coach_message(request.message)
+    try:
+        with coach_branch_seconds.time(branch=route, mode="sync"), call_site(f"coach_{route}"):
+            plan = await plan_coach_reply(request, route)
+            if plan.prompt is None:
+                return plan.result
+
+            reply = await acall_llm(plan.prompt, priority="interactive")
+            return plan.finalize(reply)
+
     except Exception as e:
         print(f"[ERROR] Career coach exception: {str(e)}")
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Career coach error: {str(e)}")
 
+def _sse(event: str, data: Any) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+@app.post("/api/agent/coach/stream")
+async def career_coach_stream(request: CareerCoachRequest):
+    """
+    Streaming Career Coach (text/event-stream)
+    Events: "route" ({"type": ...}) first, then "token" chunks ({"text": ...}),
+    then "done" with the same body /api/agent/coach would return, or "error"
+    """
+    if not career_agent_imported:
+        raise HTTPException(status_code=503, detail="Career agent not available")
+
+    async def events():
+        route = classify_coach_message(request.message)
+        yield _sse("route", {"type": route})
+        try:
+            with coach_branch_seconds.time(branch=route, mode="stream"), call_site(f"coach_{route}"):
+                plan = await plan_coach_reply(request, route)
+                if plan.prompt is None:
+                    yield _sse("done", plan.result)
+                    return
+
+                chunks = []
+                async for chunk in astream_llm(plan.prompt, priority="interactive"):
+                    chunks.append(chunk)
+                    yield _sse("token", {"text": chunk})
+                yield _sse("done", plan.finalize("".join(chunks)))
+        except Exception as e:
+            print(f"[ERROR] Career coach stream exception: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            yield _sse("error", {"detail": f"Career coach error: {str(e)}"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# Identical analyses already in flight (double clicks, several tabs) share one run
+def resume_flight_key(resume_text: str, target_role: str, analysis_mode: Optional[str]) -> str:
+    return flight_key(normalize_text(resume_text), normalize_text(target_role).lower(), analysis_mode)
+
+async def resume_analysis(resume_text: str, target_role: str, analysis_mode: Optional[str]) -> Dict[str, Any]:
+    with call_site("resume_analysis"):
+        return await single_flight.arun(
+            "resume_analysis",
+            resume_flight_key(resume_text, target_role, analysis_mode),
+            aenhanced_resume_analysis_workflow,
+            input_data=resume_text,
+            input_type="resume",
+            target_role=target_role,
+            analysis_mode=analysis_mode
+        )
+
+async def github_analysis(username: str) -> Dict[str, Any]:
+    # GitHub usernames are case-insensitive
+    with call_site("github_analysis"):
+        return await single_flight.arun(
+            "github_analysis", flight_key(username.strip().lower()), run_io, extract_github_data, username
+        )
+
 @app.post("/api/agent/resume/analyze")
-async def analyze_resume(request: ResumeAnalysisRequest):
+async def analyze_resume(request: ResumeAnalysisRequest, http_request: Request):
     """
     Analyze resume with ATS scoring and enhancement suggestions
     """
@@ -440,12 +694,11 @@ async def analyze_resume(request: ResumeAnalysisRequest):
         raise HTTPException(status_code=503, detail="Resume analysis not available")
     
     try:
-        result = enhanced_resume_analysis_workflow(
-            input_data=request.resume_text,
-            input_type="resume",
-            target_role=request.target_role
-        )
-        return {"success": True, "result": result}
+        async with admission_control.slot("analysis", client_key(http_request, request.user_id)):
+            result = await resume_analysis(request.resume_text, request.target_role, request.analysis_mode)
+        return FastJSONResponse({"success": True, "result": result})
+    except AdmissionRejected:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Resume analysis error: {str(e)}")
 
@@ -467,8 +720,8 @@ async def extract_pdf_text(file: UploadFile = File(...)):
         # Read PDF bytes
         pdf_bytes = await file.read()
         
-        # Extract text
-        result = extract_text_from_pdf(pdf_bytes)
+        # Extract text (PyMuPDF is CPU-bound; keep it off the event loop)
+        result = await run_cpu(extract_text_from_pdf, pdf_bytes)
         
         if not result["success"]:
             raise HTTPException(status_code=400, detail=f"PDF extraction failed: {result.get('error', 'Unknown error')}")
@@ -499,7 +752,7 @@ async def extract_pdf_text_base64(request: PdfBase64Request):
         pdf_bytes = base64.b64decode(request.pdf_base64)
         
         # Extract text
-        result = extract_text_from_pdf(pdf_bytes)
+        result = await run_cpu(extract_text_from_pdf, pdf_bytes)
         
         if not result["success"]:
             raise HTTPException(status_code=400, detail=f"PDF extraction failed: {result.get('error', 'Unknown error')}")
@@ -517,8 +770,10 @@ async def extract_pdf_text_base64(request: PdfBase64Request):
 
 @app.post("/api/agent/resume/analyze-pdf")
 async def analyze_resume_pdf(
+    http_request: Request,
     file: UploadFile = File(...),
-    target_role: str = "Software Engineer"
+    target_role: str = "Software Engineer",
+    analysis_mode: Optional[str] = None
 ):
     """
     Upload PDF resume and get automatic ATS analysis
@@ -534,7 +789,7 @@ async def analyze_resume_pdf(
         
         # Read and extract PDF
         pdf_bytes = await file.read()
-        extraction_result = extract_text_from_pdf(pdf_bytes)
+        extraction_result = await run_cpu(extract_text_from_pdf, pdf_bytes)
         
         if not extraction_result["success"]:
             raise HTTPException(
@@ -548,27 +803,24 @@ async def analyze_resume_pdf(
             raise HTTPException(status_code=400, detail="No text could be extracted from PDF")
         
         # Analyze the extracted resume text
-        analysis_result = enhanced_resume_analysis_workflow(
-            input_data=resume_text,
-            input_type="resume",
-            target_role=target_role
-        )
+        async with admission_control.slot("analysis", client_key(http_request)):
+            analysis_result = await resume_analysis(resume_text, target_role, analysis_mode)
         
-        return {
+        return FastJSONResponse({
             "success": True,
             "filename": file.filename,
             "page_count": extraction_result["page_count"],
             "text_length": len(resume_text),
             "analysis": analysis_result
-        }
+        })
     
-    except HTTPException:
+    except (HTTPException, AdmissionRejected):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Resume analysis error: {str(e)}")
 
 @app.post("/api/agent/github/analyze")
-async def analyze_github(request: GitHubAnalysisRequest):
+async def analyze_github(request: GitHubAnalysisRequest, http_request: Request):
     """
     Comprehensive GitHub profile analysis
     """
@@ -576,15 +828,37 @@ async def analyze_github(request: GitHubAnalysisRequest):
         raise HTTPException(status_code=503, detail="GitHub analysis not available")
     
     try:
-        result = extract_github_data(request.username)
+        async with admission_control.slot("analysis", client_key(http_request)):
+            result = await github_analysis(request.username)
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
-        return {"success": True, "result": result}
+        # Large payload (enhanced_analysis plus its top-level copies): clients trim it with ?fields=
+        return FastJSONResponse({"success": True, "result": result})
+    except AdmissionRejected:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"GitHub analysis error: {str(e)}")
 
+def run_full_workflow(request: FullWorkflowRequest, progress: Optional[Callable[..., None]] = None) -> Dict[str, Any]:
+    """Run the full career workflow and shape its state for the API (shared by the sync and job endpoints)"""
+    result = full_career_development_workflow(
+        input_data=request.input_data,
+        input_type=request.input_type,
+        target_role=request.target_role,
+        user_id=request.user_id,
+        progress=progress
+    )
+    return {
+        "skill_profile": result.skill_profile.model_dump() if result.skill_profile else None,
+        "learning_path": result.learning_path.model_dump() if result.learning_path else None,
+        "portfolio_projects": [p.model_dump() for p in result.portfolio_projects],
+        "mentor_matches": [m.model_dump() for m in result.mentor_matches],
+        "trace": result.trace,
+        "current_step": result.current_step
+    }
+
 @app.post("/api/agent/workflow/full")
-async def full_workflow(request: FullWorkflowRequest):
+async def full_workflow(request: FullWorkflowRequest, http_request: Request):
     """
     Complete career development workflow
     """
@@ -592,24 +866,15 @@ async def full_workflow(request: FullWorkflowRequest):
         raise HTTPException(status_code=503, detail="Full workflow not available")
     
     try:
-        result = full_career_development_workflow(
-            input_data=request.input_data,
-            input_type=request.input_type,
-            target_role=request.target_role,
-            user_id=request.user_id
-        )
+        async with admission_control.slot("workflow", client_key(http_request, request.user_id)):
+            result = await run_io(run_full_workflow, request)
         
-        return {
+        return FastJSONResponse({
             "success": True,
-            "result": {
-                "skill_profile": result.skill_profile.model_dump() if result.skill_profile else None,
-                "learning_path": result.learning_path.model_dump() if result.learning_path else None,
-                "portfolio_projects": [p.model_dump() for p in result.portfolio_projects],
-                "mentor_matches": [m.model_dump() for m in result.mentor_matches],
-                "trace": result.trace,
-                "current_step": result.current_step
-            }
-        }
+            "result": result
+        })
+    except AdmissionRejected:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Workflow error: {str(e)}")
 
@@ -621,8 +886,7 @@ async def matcher_agent(request: MatcherRequest):
     Matcher Agent - Team matching, mentor recommendations, hackathon workflows
     USES REAL DATABASE DATA via Node.js API
     """
-    if not matcher_agent_imported:
-        raise HTTPException(status_code=503, detail="Matcher agent not available")
+    matcher_graph, matcher_common = await require_matcher_agent("Matcher agent not available")
     
     try:
         action = request.action
@@ -635,7 +899,7 @@ async def matcher_agent(request: MatcherRequest):
             desired_skills = user_profile.get("desired_skills", user_skills)
             
             # Find real teammates from database
-            teammates = agent_tools.find_teammates(
+            teammates = await async_agent_tools.find_teammates(
                 user_id=user_id,
                 required_skills=desired_skills
             )
@@ -674,7 +938,7 @@ async def matcher_agent(request: MatcherRequest):
             # Mentor recommendations
             goal = user_profile.get("goal", "General career guidance")
             mentors_path = str(Path(__file__).parent / "agentic_zip" / "data" / "mock_mentors.json")
-            result = matcher_common.tool_mentor(goal, mentors_path)
+            result = await run_io(matcher_common.tool_mentor, goal, mentors_path)
             
             return {
                 "type": "mentor",
@@ -692,7 +956,10 @@ async def matcher_agent(request: MatcherRequest):
             }
             
             input_state = {"user_input": user_input, "context": ctx}
-            result = graph.invoke(input_state, config={"configurable": {"thread_id": user_profile.get("user_id", "default")}})
+            result = await run_io(
+                graph.invoke, input_state,
+                config={"configurable": {"thread_id": user_profile.get("user_id", "default")}}
+            )
             
             return {
                 "type": "chat",
@@ -705,42 +972,240 @@ async def matcher_agent(request: MatcherRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Matcher agent error: {str(e)}")
 
+def run_hackathon_workflow(request: HackathonWorkflowRequest, progress: Optional[Callable[..., None]] = None) -> Dict[str, Any]:
+    """Build and run the hackathon graph (shared by the sync and job endpoints)"""
+    # Compiled hackathon graph (built once, normally by the startup warm-up)
+    matcher_graph, matcher_common = load_matcher_agent()
+    graph = matcher_graph.get_hackathon_graph()
+    
+    # Create initial state
+    state = matcher_common.HackathonState(
+        duration=request.duration,
+        user_skills=request.user_skills,
+        required_skills=request.required_skills,
+        goal=request.goal,
+        max_iterations=request.max_iterations
+    )
+    
+    if progress is None:
+        return graph.invoke(state.model_dump())
+    return stream_graph(graph, state.model_dump(), on_node=progress)
+
 @app.post("/api/agent/hackathon/workflow")
-async def hackathon_workflow(request: HackathonWorkflowRequest):
+async def hackathon_workflow(request: HackathonWorkflowRequest, http_request: Request):
     """
     Complete hackathon workflow - team matching, project ideas, evaluation, strategy
     """
-    if not matcher_agent_imported:
-        raise HTTPException(status_code=503, detail="Hackathon workflow not available")
+    await require_matcher_agent("Hackathon workflow not available")
     
     try:
-        # Build hackathon graph
-        graph = matcher_graph.build_hackathon_graph()
+        # Run workflow (its LLM calls queue behind interactive coach chat)
+        async with admission_control.slot("workflow", client_key(http_request)):
+            with llm_priority("background"):
+                result = await run_io(run_hackathon_workflow, request)
         
-        # Create initial state
-        state = matcher_common.HackathonState(
-            duration=request.duration,
-            user_skills=request.user_skills,
-            required_skills=request.required_skills,
-            goal=request.goal,
-            max_iterations=request.max_iterations
-        )
-        
-        # Run workflow
-        result = graph.invoke(state.model_dump())
-        
-        return {
+        return FastJSONResponse({
             "success": True,
             "result": result
-        }
+        })
+    except AdmissionRejected:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Hackathon workflow error: {str(e)}")
 
+# ============ Background Job Endpoints ============
+
+def run_resume_pdf_analysis(pdf_bytes: bytes, filename: str, target_role: str, analysis_mode: Optional[str],
+                            progress: Optional[Callable[..., None]] = None) -> Dict[str, Any]:
+    """PDF extraction + resume analysis as one job (same result shape as /api/agent/resume/analyze-pdf)"""
+    report = progress or (lambda node, **kwargs: None)
+    extraction_result = extract_text_from_pdf(pdf_bytes)
+    if not extraction_result["success"]:
+        raise ValueError(f"PDF extraction failed: {extraction_result.get('error', 'Unknown error')}")
+    resume_text = extraction_result["text"]
+    if not resume_text.strip():
+        raise ValueError("No text could be extracted from PDF")
+    report("pdf_extraction", trace=[f"Extracted {extraction_result['page_count']} pages ({len(resume_text)} characters)"])
+
+    with call_site("resume_analysis"):
+        analysis_result = single_flight.run(
+            "resume_analysis",
+            resume_flight_key(resume_text, target_role, analysis_mode),
+            enhanced_resume_analysis_workflow,
+            input_data=resume_text,
+            input_type="resume",
+            target_role=target_role,
+            analysis_mode=analysis_mode
+        )
+    report("resume_analysis", trace=analysis_result.get("trace", []))
+    return {
+        "success": True,
+        "filename": filename,
+        "page_count": extraction_result["page_count"],
+        "text_length": len(resume_text),
+        "analysis": analysis_result
+    }
+
+def _submit_job(kind: str, fn: Callable[..., Any], *args) -> Dict[str, Any]:
+    try:
+        job = job_manager.submit(kind, fn, *args)
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=f"Job queue full, retry later: {e}", headers={"Retry-After": "5"})
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/api/agent/jobs/{job.id}",
+        "result_url": f"/api/agent/jobs/{job.id}/result",
+        "events_url": f"/api/agent/jobs/{job.id}/events"
+    }
+
+@app.post("/api/agent/jobs/workflow/full", status_code=202)
+async def submit_full_workflow_job(request: FullWorkflowRequest):
+    """Queue the full career development workflow; poll the returned job id"""
+    if not career_agent_imported:
+        raise HTTPException(status_code=503, detail="Full workflow not available")
+    return _submit_job("full_workflow", run_full_workflow, request)
+
+@app.post("/api/agent/jobs/hackathon/workflow", status_code=202)
+async def submit_hackathon_workflow_job(request: HackathonWorkflowRequest):
+    """Queue the hackathon workflow; poll the returned job id"""
+    await require_matcher_agent("Hackathon workflow not available")
+    with llm_priority("background"):
+        return _submit_job("hackathon_workflow", run_hackathon_workflow, request)
+
+@app.post("/api/agent/jobs/resume/analyze-pdf", status_code=202)
+async def submit_resume_pdf_job(
+    file: UploadFile = File(...),
+    target_role: str = "Software Engineer",
+    analysis_mode: Optional[str] = None
+):
+    """Queue PDF extraction + resume analysis; poll the returned job id"""
+    if not career_agent_imported:
+        raise HTTPException(status_code=503, detail="Resume analysis not available")
+    if not file.filename.endswith('.pdf'):
+        raise HTTPException(status_code=400, detail="Only PDF files are supported")
+    pdf_bytes = await file.read()
+    return _submit_job("resume_pdf_analysis", run_resume_pdf_analysis, pdf_bytes, file.filename, target_role, analysis_mode)
+
+@app.get("/api/agent/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """Job status with per-node progress (trace lines reported by each finished node)"""
+    snapshot = job_manager.snapshot(job_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return snapshot
+
+@app.get("/api/agent/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    """Finished job result; 202 with the status while the job is still running"""
+    snapshot = job_manager.snapshot(job_id, include_result=True)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    if snapshot["status"] == "failed":
+        raise HTTPException(status_code=500, detail=f"Job failed: {snapshot['error']}")
+    if snapshot["status"] != "succeeded":
+        return JSONResponse(status_code=202, content={k: v for k, v in snapshot.items() if k != "result"})
+    return FastJSONResponse({"success": True, "job_id": job_id, "result": snapshot["result"]})
+
+@app.get("/api/agent/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """
+    Subscribe to a job as server-sent events: one "progress" event per finished
+    node, then "done" (with the result) or "error"
+    """
+    if job_manager.snapshot(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+
+    async def events():
+        sent = 0
+        while True:
+            snapshot = job_manager.snapshot(job_id, include_result=True)
+            if snapshot is None:
+                yield _sse("error", {"error": "Job expired"})
+                return
+            for entry in snapshot["progress"][sent:]:
+                yield _sse("progress", entry)
+            sent = len(snapshot["progress"])
+            if snapshot["status"] == "succeeded":
+                yield _sse("done", {"job_id": job_id, "result": snapshot["result"]})
+                return
+            if snapshot["status"] == "failed":
+                yield _sse("error", {"job_id": job_id, "error": snapshot["error"]})
+                return
+            await asyncio.sleep(JOBS_EVENTS_POLL_INTERVAL)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# ============ Cache Endpoints ============
+
+@app.post("/api/agent/cache/invalidate")
+async def invalidate_agent_tools_cache(
+    request: CacheInvalidationRequest,
+    x_agent_service_token: Optional[str] = Header(default=None)
+):
+    """
+    Drop cached Node API data (called by the Node backend after a user's profile,
+    skills, projects, hackathons or connections change).
+    Requires the X-Agent-Service-Token header to match AGENT_SERVICE_TOKEN.
+    """
+    if not AGENT_SERVICE_TOKEN:
+        raise HTTPException(status_code=403, detail="Cache invalidation disabled: AGENT_SERVICE_TOKEN is not set")
+    if not x_agent_service_token or not hmac.compare_digest(x_agent_service_token, AGENT_SERVICE_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid or missing X-Agent-Service-Token")
+    unknown = sorted(set(request.resources or []) - set(RESOURCE_TTL_DEFAULTS))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown cache resources: {', '.join(unknown)}")
+    user_ids = [request.user_id] if request.user_id else []
+    user_ids += request.user_ids or []
+    if not user_ids:
+        removed = agent_tools_cache.invalidate(None, request.resources)
+    else:
+        removed = sum(agent_tools_cache.invalidate(user_id, request.resources) for user_id in dict.fromkeys(user_ids))
+    return {"success": True, "invalidated": removed}
+
 # ============ Health Check ============
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus text exposition of request, coach branch, graph node, LLM and Node API metrics"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 503 until every required warm-up step has succeeded; 200 "degraded" if optional ones failed"""
+    if not startup_state.ready:
+        return JSONResponse(
+            status_code=503,
+            content=startup_state.stats(),
+            headers={"Retry-After": "1"}
+        )
+    return startup_state.stats()
+
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "SyncUp AI Agent Service"}
+    return {
+        "status": "healthy",
+        "service": "SyncUp AI Agent Service",
+        "llm_pool": llm_registry.stats(),
+        "llm_cache": llm_cache.stats(),
+        "llm_scheduler": llm_scheduler.stats(),
+        "prompt_budget": prompt_budget_stats.stats(),
+        "structured_output": structured_output_stats.stats(),
+        "executors": executor_stats(),
+        "jobs": job_manager.stats(),
+        "single_flight": single_flight.stats(),
+        "tracing": trace_exporter.stats(),
+        "admission": admission_control.stats(),
+        "startup": startup_state.stats(),
+        "response_encoding": response_stats.stats(),
+        "agent_tools": agent_tools.stats(),
+        "async_agent_tools": async_agent_tools.stats(),
+        "agent_tools_cache": agent_tools_cache.stats()
+    }
 
 @app.get("/")
 async def root():
@@ -749,13 +1214,19 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "career_coach": "/api/agent/coach",
+            "career_coach_stream": "/api/agent/coach/stream",
             "matcher": "/api/agent/matcher",
             "resume_analysis": "/api/agent/resume/analyze",
             "resume_pdf_analysis": "/api/agent/resume/analyze-pdf",
             "pdf_extraction": "/api/agent/pdf/extract",
             "github_analysis": "/api/agent/github/analyze",
             "full_workflow": "/api/agent/workflow/full",
-            "hackathon_workflow": "/api/agent/hackathon/workflow"
+            "hackathon_workflow": "/api/agent/hackathon/workflow",
+            "jobs": "/api/agent/jobs/{workflow/full,hackathon/workflow,resume/analyze-pdf}",
+            "job_status": "/api/agent/jobs/{job_id}[/result|/events]",
+            "metrics": "/metrics",
+            "cache_invalidation": "/api/agent/cache/invalidate",
+            "readiness": "/ready"
         },
         "features": {
             "pdf_extraction": "Automatic PDF text extraction using PyMuPDF",
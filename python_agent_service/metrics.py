@@ -0,0 +1,257 @@
+"""
+Service Metrics
+Prometheus-style counters and latency histograms rendered in the text
+exposition format at /metrics: HTTP routes, career coach branches, LangGraph
+nodes, LLM calls (latency, tokens, retries) and Node API (agent_tools) calls
+"""
+
+import os
+import time
+import asyncio
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Tuple, Callable, Iterator
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from prompt_budget import estimate_tokens
+from tracing import span
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Latency buckets in seconds: sub-10ms Node API calls up to multi-minute graph runs
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# Call site attributed to LLM calls made without an explicit site (graph node, coach branch)
+_call_site: contextvars.ContextVar[str] = contextvars.ContextVar("llm_call_site", default="unknown")
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter per label set"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labels, key)} {_format_number(value)}" for key, value in values]
+
+
+class Histogram:
+    """Cumulative-bucket histogram per label set"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # label values -> [bucket counts..., sum, count]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[Dict[str, str]]:
+        """Observe the block's duration; labels can be filled in inside the block via the yielded dict"""
+        labels = dict(labels)
+        started = time.perf_counter()
+        try:
+            yield labels
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, list(values)) for key, values in self._series.items())
+        lines = []
+        for key, values in series:
+            for bound, count in zip(self.buckets, values):
+                le = 'le="' + _format_number(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, le)} {count}")
+            inf = _format_labels(self.labels, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{inf} {values[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {_format_number(values[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {values[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds every metric and renders the exposition text"""
+
+    def __init__(self, enabled: bool = METRICS_ENABLED):
+        self.enabled = enabled
+        self._metrics: List[Any] = []
+
+    def counter(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, help_text, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help_text: str, labels: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, help_text, labels, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global instance
+metrics = MetricsRegistry()
+
+http_request_seconds = metrics.histogram(
+    "agent_http_request_duration_seconds", "HTTP request latency by route template",
+    ("method", "route", "status")
+)
+coach_branch_seconds = metrics.histogram(
+    "agent_coach_branch_duration_seconds", "Career coach latency by routed branch",
+    ("branch", "mode")
+)
+graph_node_seconds = metrics.histogram(
+    "agent_graph_node_duration_seconds", "LangGraph node duration",
+    ("graph", "node", "outcome")
+)
+llm_call_seconds = metrics.histogram(
+    "agent_llm_call_duration_seconds", "LLM completion latency (including scheduler wait)",
+    ("provider", "site", "outcome")
+)
+llm_tokens_total = metrics.counter(
+    "agent_llm_tokens_total", "LLM tokens by direction (provider usage when reported, else estimated)",
+    ("provider", "site", "direction")
+)
+llm_retries_total = metrics.counter(
+    "agent_llm_retries_total", "call_llm retries after a failed attempt",
+    ("function", "site")
+)
+agent_tools_request_seconds = metrics.histogram(
+    "agent_tools_request_duration_seconds", "Node API (agent_tools) request latency",
+    ("method", "endpoint", "status")
+)
+
+
+@contextmanager
+def call_site(name: str):
+    """Attribute LLM calls made inside the block to this call site"""
+    token = _call_site.set(name)
+    try:
+        yield
+    finally:
+        _call_site.reset(token)
+
+
+def current_call_site() -> str:
+    return _call_site.get()
+
+
+def timed_node(graph: str, node: str, fn: Callable) -> Callable:
+    """Wrap a LangGraph node so its duration is recorded and its LLM calls carry the node as call site"""
+    def run(state):
+        outcome = "error"
+        started = time.perf_counter()
+        try:
+            with span(node, "graph", graph=graph), call_site(node):
+                result = fn(state)
+            outcome = "ok"
+            return result
+        finally:
+            if metrics.enabled:
+                graph_node_seconds.observe(time.perf_counter() - started, graph=graph, node=node, outcome=outcome)
+
+    run.__name__ = getattr(fn, "__name__", node)
+    run.__doc__ = getattr(fn, "__doc__", None)
+    return run
+
+
+class LLMCall:
+    """Filled in by the caller inside track_llm_call"""
+
+    def __init__(self):
+        self.reply = ""
+        self.usage: Optional[Tuple[int, int]] = None
+
+
+@contextmanager
+def track_llm_call(provider: str, prompt: str, site: Optional[str] = None) -> Iterator[LLMCall]:
+    """Record latency, outcome and prompt/completion tokens for one LLM call (metrics and trace span)"""
+    call = LLMCall()
+    site = site or current_call_site()
+    outcome = "error"
+    started = time.perf_counter()
+    with span(f"llm:{site}", "llm", provider=provider) as llm_span:
+        try:
+            yield call
+            outcome = "ok"
+        except (GeneratorExit, asyncio.CancelledError):
+            outcome = "cancelled"
+            raise
+        finally:
+            if call.usage:
+                prompt_tokens, completion_tokens = call.usage
+            else:
+                prompt_tokens, completion_tokens = estimate_tokens(prompt), estimate_tokens(call.reply)
+            llm_span.set(outcome=outcome, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+            if metrics.enabled:
+                llm_call_seconds.observe(time.perf_counter() - started, provider=provider, site=site, outcome=outcome)
+                llm_tokens_total.inc(prompt_tokens, provider=provider, site=site, direction="prompt")
+                if outcome == "ok":
+                    llm_tokens_total.inc(completion_tokens, provider=provider, site=site, direction="completion")
+
+
+def record_llm_retry(retry_state):
+    """tenacity before_sleep hook for the call_llm family"""
+    site = retry_state.kwargs.get("site")
+    if site is None and len(retry_state.args) > 1 and isinstance(retry_state.args[1], str):
+        site = retry_state.args[1]  # call_llm_json(prompt, site, ...)
+    site = site or current_call_site()
+    llm_retries_total.inc(function=retry_state.fn.__name__, site=site)
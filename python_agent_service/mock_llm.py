@@ -0,0 +1,372 @@
+"""
+Mock LLM Provider
+Deterministic offline stand-in for Gemini/OpenAI: recognises each prompt the
+service sends and answers with schema-valid JSON (or plausible text), with
+configurable latency and error injection so the career and hackathon graphs
+can be exercised and benchmarked without network access
+"""
+
+import os
+import re
+import json
+import math
+import time
+import random
+import asyncio
+import hashlib
+import threading
+from typing import Dict, Any, List, Optional, Callable, Iterator, AsyncIterator
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Latency spec: "50" / "fixed:50", "uniform:20:200", "normal:120:30", "lognormal:120:0.5" (ms; lognormal = median, sigma)
+MOCK_LLM_LATENCY = os.getenv("MOCK_LLM_LATENCY", "0")
+MOCK_LLM_ERROR_RATE = float(os.getenv("MOCK_LLM_ERROR_RATE", "0"))
+MOCK_LLM_MALFORMED_RATE = float(os.getenv("MOCK_LLM_MALFORMED_RATE", "0"))
+MOCK_LLM_STREAM_CHUNK_MS = float(os.getenv("MOCK_LLM_STREAM_CHUNK_MS", "0"))
+MOCK_LLM_SEED = int(os.getenv("MOCK_LLM_SEED", "0"))
+
+KNOWN_SKILLS = [
+    "Python", "JavaScript", "TypeScript", "Java", "Go", "C++", "SQL", "React", "Node.js",
+    "FastAPI", "Django", "Flask", "TensorFlow", "PyTorch", "Docker", "Kubernetes", "AWS",
+    "Git", "PostgreSQL", "MongoDB", "GraphQL", "Redis", "Linux", "Machine Learning"
+]
+TECH_STACK = [
+    ("Python", "Fast prototyping and a rich AI/ML ecosystem"),
+    ("FastAPI", "Lightweight async backend for APIs"),
+    ("React", "Component-based UI that scales with the team"),
+    ("PostgreSQL", "Reliable relational storage"),
+    ("Docker", "Reproducible builds and easy deployment"),
+    ("Redis", "Caching and background job queues"),
+    ("TensorFlow", "Model training and serving"),
+]
+
+
+class MockLLMError(RuntimeError):
+    """Injected provider failure"""
+
+
+def parse_latency_spec(spec: str) -> Callable[[random.Random], float]:
+    """Turn a latency spec string into a sampler returning seconds"""
+    parts = (spec or "0").strip().lower().split(":")
+    if parts[0].replace(".", "", 1).isdigit():
+        parts = ["fixed"] + parts
+    kind, args = parts[0], [float(p) for p in parts[1:] if p] or [0.0]
+
+    if kind == "fixed":
+        return lambda rng: args[0] / 1000
+    if kind == "uniform":
+        low, high = args[0], args[1] if len(args) > 1 else args[0]
+        return lambda rng: rng.uniform(low, high) / 1000
+    if kind == "normal":
+        mean, std = args[0], args[1] if len(args) > 1 else 0.0
+        return lambda rng: max(0.0, rng.gauss(mean, std)) / 1000
+    if kind == "lognormal":
+        median, sigma = args[0], args[1] if len(args) > 1 else 0.5
+        return lambda rng: rng.lognormvariate(math.log(max(median, 1e-6)), sigma) / 1000
+    raise ValueError(f"Unknown mock latency distribution: {spec}")
+
+
+def _section_after(prompt: str, label: str) -> str:
+    """Text following 'label' up to the next blank line"""
+    index = prompt.find(label)
+    if index < 0:
+        return ""
+    return prompt[index + len(label):].strip().split("\n\n")[0].strip()
+
+
+def _skills_in(text: str) -> List[str]:
+    lowered = text.lower()
+    return [skill for skill in KNOWN_SKILLS if skill.lower() in lowered]
+
+
+class MockLLMProvider:
+    """Prompt-type-aware fake provider; same prompt + seed always gives the same reply"""
+
+    def __init__(self, latency: str = MOCK_LLM_LATENCY, error_rate: float = MOCK_LLM_ERROR_RATE,
+                 malformed_rate: float = MOCK_LLM_MALFORMED_RATE, seed: int = MOCK_LLM_SEED,
+                 stream_chunk_ms: float = MOCK_LLM_STREAM_CHUNK_MS):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {}
+        self._errors = 0
+        self._malformed = 0
+        self._latency_total = 0.0
+        self.configure(latency, error_rate, malformed_rate, seed, stream_chunk_ms)
+
+        # (kind, marker) in match order; the first marker found in the prompt wins
+        self._kinds = [
+            ("parse_resume", "Parse this resume and extract structured information"),
+            ("batched_analysis", "give enhancement suggestions for each of these sections"),
+            ("ats_score", "Provide ATS analysis in this JSON format"),
+            ("section_enhancement", "Analyze this resume section"),
+            ("hackathon_evaluate", "professional hackathon evaluator"),
+            ("hackathon_optimize", "refine project ideas"),
+            ("hackathon_strategy", "expert hackathon project manager"),
+            ("hackathon_team_dynamics", "You are managing a hackathon project"),
+            ("hackathon_tech_stack", "recommended tech stack"),
+            ("hackathon_ideas", "project ideas that could be applied worldwide"),
+            ("coach_resume", "resume analyzer and career coach"),
+            ("coach_teammates", "potential teammates from our REAL database"),
+        ]
+        self._builders: Dict[str, Callable[[str, random.Random], Any]] = {
+            "parse_resume": self._parse_resume,
+            "batched_analysis": self._batched_analysis,
+            "ats_score": self._ats_score,
+            "section_enhancement": self._section_enhancement,
+            "hackathon_evaluate": self._evaluate,
+            "hackathon_optimize": self._optimize,
+            "hackathon_strategy": self._strategy,
+            "hackathon_team_dynamics": self._team_dynamics,
+            "hackathon_tech_stack": self._tech_stack,
+            "hackathon_ideas": self._ideas,
+            "coach_resume": self._coach_resume,
+            "coach_teammates": self._coach_teammates,
+            "chat": self._chat,
+        }
+
+    def configure(self, latency: Optional[str] = None, error_rate: Optional[float] = None,
+                  malformed_rate: Optional[float] = None, seed: Optional[int] = None,
+                  stream_chunk_ms: Optional[float] = None):
+        """Change latency/error injection at runtime (e.g. from a load-test harness)"""
+        with self._lock:
+            if latency is not None:
+                self.latency_spec = latency
+                self._sample_latency = parse_latency_spec(latency)
+            if error_rate is not None:
+                self.error_rate = error_rate
+            if malformed_rate is not None:
+                self.malformed_rate = malformed_rate
+            if seed is not None:
+                self.seed = seed
+                self._rng = random.Random(seed)
+            if stream_chunk_ms is not None:
+                self.stream_chunk_ms = stream_chunk_ms
+
+    # ----- Reply construction -----
+
+    def classify(self, prompt: str) -> str:
+        for kind, marker in self._kinds:
+            if marker in prompt:
+                return kind
+        return "chat"
+
+    def reply(self, prompt: str, json_mode: bool = False) -> str:
+        """Deterministic reply text for a prompt (no latency or error injection)"""
+        kind = self.classify(prompt)
+        digest = hashlib.sha256(f"{self.seed}:{prompt}".encode("utf-8")).digest()
+        rng = random.Random(int.from_bytes(digest[:8], "big"))
+        body = self._builders[kind](prompt, rng)
+        if isinstance(body, str):
+            return body
+        text = json.dumps(body, indent=2)
+        return text if json_mode else f"```json\n{text}\n```"
+
+    def _parse_resume(self, prompt: str, rng: random.Random) -> Dict[str, Any]:
+        resume_text = _section_after(prompt, "Resume Text:")
+        lines = [line.strip() for line in resume_text.splitlines() if line.strip()]
+        email = re.search(r"[\w.+-]+@[\w-]+\.[\w.]+", resume_text)
+        skills = _skills_in(resume_text) or rng.sample(KNOWN_SKILLS, 4)
+        return {
+            "name": lines[0][:60] if lines else "Alex Doe",
+            "email": email.group() if email else "",
+            "education": [{"degree": "B.Tech Computer Science", "institution": "State University", "year": "2024"}],
+            "skills": {
+                "languages": [s for s in skills if s in ("Python", "JavaScript", "TypeScript", "Java", "Go", "C++", "SQL")],
+                "frameworks": [s for s in skills if s in ("React", "Node.js", "FastAPI", "Django", "Flask", "TensorFlow", "PyTorch")],
+                "tools": [s for s in skills if s in ("Docker", "Kubernetes", "AWS", "Git", "PostgreSQL", "MongoDB", "Redis", "Linux")],
+                "soft_skills": ["Communication", "Teamwork"]
+            },
+            "projects": [{
+                "title": f"Project {rng.randint(1, 99)}",
+                "description": "Web application built during a hackathon",
+                "tech_stack": skills[:3],
+                "impact": f"Used by {rng.randint(50, 5000)} users"
+            }],
+            "experience": [{
+                "role": "Software Engineering Intern",
+                "organization": "Acme Corp",
+                "duration": f"{rng.randint(2, 12)} months",
+                "skills_used": skills[:2]
+            }],
+            "certifications": [],
+            "achievements": [f"Top {rng.randint(3, 10)} finish at a national hackathon"],
+            "github": "",
+            "linkedin": "",
+            "career_summary": f"Developer experienced with {', '.join(skills[:3])}"
+        }
+
+    def _ats(self, prompt: str, rng: random.Random) -> Dict[str, Any]:
+        found = _skills_in(prompt.split("Provide")[0])
+        missing = [skill for skill in ("Testing", "CI/CD", "API", "Cloud", "Agile") if skill.lower() not in prompt.lower()]
+        return {
+            "overall_score": rng.randint(55, 92),
+            "section_scores": {
+                "contact_info": rng.randint(60, 100), "skills": rng.randint(50, 95),
+                "experience": rng.randint(40, 95), "education": rng.randint(50, 95),
+                "projects": rng.randint(40, 95), "keywords": rng.randint(40, 90)
+            },
+            "improvements": ["Add quantifiable achievements", "Use standard section headers"],
+            "keywords_missing": missing[:3],
+            "keywords_found": found[:6]
+        }
+
+    def _ats_score(self, prompt: str, rng: random.Random) -> Dict[str, Any]:
+        return self._ats(prompt, rng)
+
+    def _enhancement(self, section_name: str, rng: random.Random) -> Dict[str, Any]:
+        return {
+            "section_name": section_name,
+            "current_score": rng.randint(45, 90),
+            "improvements": [f"Quantify the impact in your {section_name.lower()} section", "Lead bullets with action verbs"],
+            "skill_development_suggestions": [rng.choice(["Get an AWS certification", "Practice system design", "Contribute to open source"])],
+            "ats_optimization_tips": ["Use standard job titles", "Mirror keywords from the job description"],
+            "future_learning_paths": [rng.choice(["Cloud architecture", "Machine Learning specialization", "Engineering leadership"])]
+        }
+
+    def _section_enhancement(self, prompt: str, rng: random.Random) -> Dict[str, Any]:
+        match = re.search(r"Section:\s*(.+)", prompt)
+        return self._enhancement(match.group(1).strip() if match else "General", rng)
+
+    def _batched_analysis(self, prompt: str, rng: random.Random) -> Dict[str, Any]:
+        match = re.search(r"each of these sections:\s*(\[.*?\])", prompt, re.DOTALL)
+        try:
+            names = json.loads(match.group(1)) if match else []
+        except json.JSONDecodeError:
+            names = []
+        return {
+            "ats_score": self._ats(prompt, rng),
+            "section_enhancements": [self._enhancement(name, rng) for name in names]
+        }
+
+    def _evaluate(self, prompt: str, rng: random.Random) -> Dict[str, Any]:
+        approved = rng.random() < 0.6
+        return {
+            "decision": "approved" if approved else "not approved",
+            "reason": "Clear global impact and a feasible MVP scope." if approved
+            else "Needs a sharper problem statement and a feasible MVP scope."
+        }
+
+    def _optimize(self, prompt: str, rng: random.Random) -> str:
+        idea = _section_after(prompt, "Current Project Idea:").split("\n")[0] or "Community platform"
+        addition = rng.choice(["offline-first mobile support", "multilingual onboarding", "an open data API", "privacy-preserving analytics"])
+        return f"{idea[:300].rstrip('.')} - now with {addition}."
+
+    def _strategy(self, prompt: str, rng: random.Random) -> str:
+        return "\n".join([
+            "- Day 1: Research, scope the MVP and split work",
+            "- Day 2: Build backend APIs and data model",
+            "- Day 3: Build the frontend and integrate",
+            "- Day 4: Test, polish and prepare the pitch deck",
+        ])
+
+    def _team_dynamics(self, prompt: str, rng: random.Random) -> List[Dict[str, Any]]:
+        members = [name.strip() for name in _section_after(prompt, "Team members:").split(",") if name.strip()] or ["Member"]
+        tasks = [line.strip("-• ").strip() for line in _section_after(prompt, "Strategy plan:").splitlines() if line.strip()]
+        tasks = tasks or ["Backend setup", "UI design", "Pitch deck"]
+        assignments = [{"member": member, "tasks": []} for member in members]
+        for i, task in enumerate(tasks):
+            assignments[i % len(members)]["tasks"].append(task[:60])
+        return assignments
+
+    def _tech_stack(self, prompt: str, rng: random.Random) -> List[Dict[str, str]]:
+        picks = rng.sample(TECH_STACK, 5)
+        return [{"tool": tool, "reason": reason} for tool, reason in picks]
+
+    def _ideas(self, prompt: str, rng: random.Random) -> str:
+        match = re.search(r"goal is:\s*(.+?)\.?\n", prompt)
+        goal = match.group(1).strip() if match else "global challenges"
+        angles = ["AI-assisted", "Community-driven", "Offline-first", "Open-data", "Gamified"]
+        return "\n".join(f"- {angle} platform tackling {goal}" for angle in rng.sample(angles, 3))
+
+    def _coach_resume(self, prompt: str, rng: random.Random) -> str:
+        score = rng.randint(55, 92)
+        return (
+            "# 📊 Resume ATS Analysis\n\n"
+            f"## 🎯 Overall ATS Score: {score}/100\nSolid foundation with room to sharpen keywords.\n\n"
+            "## ✅ Key Strengths\n1. **Projects**: Hands-on hackathon work\n\n"
+            "## ⚠️ Areas for Improvement\n1. **Metrics**: Quantify impact\n\n"
+            "## 💡 Final Recommendation\nTailor the resume to each role and add measurable results."
+        )
+
+    def _coach_teammates(self, prompt: str, rng: random.Random) -> str:
+        return ("These candidates complement your skills well. Reach out to the top two first: "
+                "their skill sets cover your gaps and suggest natural backend/frontend roles.")
+
+    def _chat(self, prompt: str, rng: random.Random) -> str:
+        match = re.search(r"(?:User Question|User):\s*(.+)", prompt)
+        question = match.group(1).strip() if match else prompt.strip()[:200]
+        return (f"## Mock coach reply\n\n**You asked:** {question[:200]}\n\n"
+                "• Build one portfolio project a month\n• Join a hackathon team that complements your skills")
+
+    # ----- Injection -----
+
+    def _inject(self, prompt: str, json_mode: bool) -> tuple:
+        """Sample latency and decide error/malformed for one call"""
+        with self._lock:
+            delay = self._sample_latency(self._rng)
+            fail = self._rng.random() < self.error_rate
+            malformed = self._rng.random() < self.malformed_rate
+            kind = self.classify(prompt)
+            self._stats[kind] = self._stats.get(kind, 0) + 1
+            self._latency_total += delay
+            if fail:
+                self._errors += 1
+            elif malformed:
+                self._malformed += 1
+        return delay, fail, malformed
+
+    def _finish(self, prompt: str, json_mode: bool, fail: bool, malformed: bool) -> str:
+        if fail:
+            raise MockLLMError("Injected mock LLM failure")
+        text = self.reply(prompt, json_mode)
+        if malformed:
+            # Cut the reply short: JSON sites see a truncated object
+            return text[:max(1, len(text) // 2)]
+        return text
+
+    # ----- Provider API -----
+
+    def generate(self, prompt: str, json_mode: bool = False) -> str:
+        delay, fail, malformed = self._inject(prompt, json_mode)
+        if delay:
+            time.sleep(delay)
+        return self._finish(prompt, json_mode, fail, malformed)
+
+    async def agenerate(self, prompt: str, json_mode: bool = False) -> str:
+        delay, fail, malformed = self._inject(prompt, json_mode)
+        if delay:
+            await asyncio.sleep(delay)
+        return self._finish(prompt, json_mode, fail, malformed)
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        text = self.generate(prompt)
+        for chunk in re.findall(r"\S+\s*", text):
+            if self.stream_chunk_ms:
+                time.sleep(self.stream_chunk_ms / 1000)
+            yield chunk
+
+    async def astream(self, prompt: str) -> AsyncIterator[str]:
+        text = await self.agenerate(prompt)
+        for chunk in re.findall(r"\S+\s*", text):
+            if self.stream_chunk_ms:
+                await asyncio.sleep(self.stream_chunk_ms / 1000)
+            yield chunk
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = sum(self._stats.values())
+            return {
+                "latency": self.latency_spec,
+                "error_rate": self.error_rate,
+                "malformed_rate": self.malformed_rate,
+                "calls": calls,
+                "calls_by_kind": dict(self._stats),
+                "injected_errors": self._errors,
+                "malformed_replies": self._malformed,
+                "avg_latency_ms": round(self._latency_total / calls * 1000, 2) if calls else 0.0
+            }
+
+
+# Global instance
+mock_llm = MockLLMProvider()
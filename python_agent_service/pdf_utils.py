@@ -1,9 +1,8 @@
 """
 PDF Extraction Utilities
-Extracts text from PDF files using PyMuPDF (fitz)
+Extracts text from PDF files using PyMuPDF (fitz), imported on first use
 """
 
-import fitz  # PyMuPDF
 from typing import Dict, Any
 import io
 
@@ -19,6 +18,8 @@ def extract_text_from_pdf(pdf_bytes: bytes) -> Dict[str, Any]:
         Dictionary with extracted text and metadata
     """
     try:
+        import fitz  # PyMuPDF (deferred: only PDF uploads need it)
+
         # Open PDF from bytes
         pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
         
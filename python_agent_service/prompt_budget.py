@@ -0,0 +1,185 @@
+"""
+Prompt Budget Utilities
+Estimate prompt tokens, compact embedded JSON and trim dynamic prompt content
+to a per-call-site token budget (lowest-priority sections are trimmed first)
+"""
+
+import os
+import json
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional, Tuple
+from dotenv import load_dotenv
+
+from tracing import current_request_id
+
+load_dotenv()
+
+# Rough chars-per-token ratio for English/JSON text; good enough for budgeting
+CHARS_PER_TOKEN = 4
+TRUNCATION_MARKER = " …[truncated]"
+
+# Token budget for the dynamic part of each prompt; override with PROMPT_BUDGET_<SITE>
+DEFAULT_BUDGETS = {
+    "parse_resume": 6000,
+    "ats_score": 3000,
+    "section_enhancement": 1200,
+    "batched_analysis": 3500,
+    "coach_resume": 4000,
+    "coach_chat": 800,
+}
+
+# Resume fields in the order they matter most for scoring (first = keep longest)
+RESUME_FIELD_PRIORITY = [
+    "skills", "experience", "projects", "education", "certifications",
+    "achievements", "career_summary", "name", "email", "github", "linkedin"
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (no tokenizer dependency)"""
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def drop_empty(data: Any) -> Any:
+    """Recursively drop None, empty strings, empty lists and empty dicts"""
+    if isinstance(data, dict):
+        cleaned = {key: drop_empty(value) for key, value in data.items()}
+        return {key: value for key, value in cleaned.items() if value not in (None, "", [], {})}
+    if isinstance(data, list):
+        cleaned = [drop_empty(item) for item in data]
+        return [item for item in cleaned if item not in (None, "", [], {})]
+    return data
+
+
+def compact_json(data: Any) -> str:
+    """JSON with empty fields dropped and no indentation/whitespace"""
+    return json.dumps(drop_empty(data), separators=(",", ":"), ensure_ascii=False)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to roughly max_tokens, marking the cut"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    if max_tokens <= 0:
+        return ""
+    max_chars = max(0, max_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER))
+    return text[:max_chars].rstrip() + TRUNCATION_MARKER
+
+
+def budget_for(site: str) -> int:
+    return int(os.getenv(f"PROMPT_BUDGET_{site.upper()}", DEFAULT_BUDGETS.get(site, 2000)))
+
+
+def _new_totals() -> Dict[str, int]:
+    return {"calls": 0, "truncated_calls": 0, "tokens_before": 0, "tokens_after": 0, "tokens_saved": 0}
+
+
+def _add(totals: Dict[str, int], tokens_before: int, tokens_after: int, saved: int):
+    totals["calls"] += 1
+    totals["tokens_before"] += tokens_before
+    totals["tokens_after"] += tokens_after
+    totals["tokens_saved"] += saved
+    if saved:
+        totals["truncated_calls"] += 1
+
+
+class PromptBudgetStats:
+    """Token accounting (before/after budgeting) per call site and per traced request"""
+
+    def __init__(self, recent: int = 200, max_requests: int = 500):
+        self._lock = threading.Lock()
+        self._sites: Dict[str, Dict[str, int]] = {}
+        self._recent = deque(maxlen=recent)
+        # Totals for the latest requests, keyed by the tracing middleware's request id
+        self._requests: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self.max_requests = max_requests
+
+    def record(self, site: str, tokens_before: int, tokens_after: int):
+        request_id = current_request_id()
+        saved = max(0, tokens_before - tokens_after)
+        with self._lock:
+            _add(self._sites.setdefault(site, _new_totals()), tokens_before, tokens_after, saved)
+            if request_id is not None:
+                totals = self._requests.get(request_id)
+                if totals is None:
+                    totals = self._requests[request_id] = _new_totals()
+                    while len(self._requests) > self.max_requests:
+                        self._requests.popitem(last=False)
+                _add(totals, tokens_before, tokens_after, saved)
+            self._recent.append({
+                "site": site, "request_id": request_id,
+                "tokens_before": tokens_before, "tokens_after": tokens_after
+            })
+
+    def for_request(self, request_id: str) -> Optional[Dict[str, int]]:
+        """Totals over every budgeted prompt built while handling request_id (None if there were none)"""
+        with self._lock:
+            totals = self._requests.get(request_id)
+            return dict(totals) if totals is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "sites": {site: dict(values) for site, values in self._sites.items()},
+                "requests": {request_id: dict(values) for request_id, values in list(self._requests.items())[-20:]},
+                "recent": list(self._recent)[-20:]
+            }
+
+
+prompt_budget_stats = PromptBudgetStats()
+
+
+def fit_sections(site: str, sections: List[Tuple[str, str]], budget: Optional[int] = None,
+                 tokens_before: Optional[int] = None) -> Dict[str, str]:
+    """
+    Trim named prompt sections to fit a call-site budget
+
+    Args:
+        site: Call-site name (selects the budget and the stats bucket)
+        sections: (name, text) pairs, highest priority first
+        budget: Override the configured budget
+        tokens_before: Size of the un-compacted original, so compaction savings are counted too
+
+    Returns:
+        {name: text} with the lowest-priority sections trimmed (possibly to "") until under budget
+    """
+    budget = budget_for(site) if budget is None else budget
+    fitted = {name: text or "" for name, text in sections}
+    total = sum(estimate_tokens(text) for text in fitted.values())
+    original = total if tokens_before is None else tokens_before
+
+    for name, _ in reversed(sections):
+        excess = total - budget
+        if excess <= 0:
+            break
+        current = estimate_tokens(fitted[name])
+        fitted[name] = truncate_to_tokens(fitted[name], max(0, current - excess))
+        total = sum(estimate_tokens(text) for text in fitted.values())
+
+    prompt_budget_stats.record(site, original, total)
+    return fitted
+
+
+def budget_text(site: str, text: str, budget: Optional[int] = None) -> str:
+    """Single-section fit_sections for free text (e.g. a raw resume)"""
+    return fit_sections(site, [("text", text)], budget)["text"]
+
+
+def compact_resume(resume_data: Dict[str, Any], site: str, budget: Optional[int] = None) -> str:
+    """
+    Compact parsed resume JSON for embedding in a prompt
+
+    Fields are emitted as one compact-JSON line each, in RESUME_FIELD_PRIORITY order,
+    and the least important ones are trimmed first when over budget.
+    """
+    cleaned = drop_empty(resume_data or {})
+    keys = [key for key in RESUME_FIELD_PRIORITY if key in cleaned]
+    keys += [key for key in cleaned if key not in keys]
+    sections = [(key, json.dumps(cleaned[key], separators=(",", ":"), ensure_ascii=False)) for key in keys]
+
+    tokens_before = estimate_tokens(json.dumps(resume_data, indent=2))
+    fitted = fit_sections(site, sections, budget, tokens_before=tokens_before)
+    return "\n".join(f"{key}: {fitted[key]}" for key in keys if fitted[key])
@@ -0,0 +1,278 @@
+"""
+Response Encoding
+Fast JSON rendering (orjson when installed, stdlib json otherwise), a
+`fields=` query parameter that projects JSON bodies down to the paths a client
+renders, and gzip/brotli compression of large buffered responses
+"""
+
+import os
+import json
+import gzip
+import threading
+import contextvars
+from dataclasses import is_dataclass, asdict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
+from urllib.parse import parse_qs
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from dotenv import load_dotenv
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+load_dotenv()
+
+RESPONSE_COMPRESSION_ENABLED = os.getenv("RESPONSE_COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes")
+# Bodies smaller than this go out uncompressed (framing overhead outweighs the savings)
+RESPONSE_COMPRESSION_MIN_SIZE = int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024"))
+RESPONSE_GZIP_LEVEL = int(os.getenv("RESPONSE_GZIP_LEVEL", "6"))
+# Brotli 4-5 compresses better than gzip -6 at similar CPU; 11 is for static assets only
+RESPONSE_BROTLI_QUALITY = int(os.getenv("RESPONSE_BROTLI_QUALITY", "4"))
+
+COMPRESSIBLE_TYPES = ("application/json", "text/plain", "text/html", "text/csv")
+
+# Field tree parsed from the current request's ?fields= (None = whole body)
+_fields: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar("response_fields", default=None)
+
+
+def parse_fields(raw: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Parse a fields= value into a projection tree
+
+    Args:
+        raw: Comma-separated dotted paths, e.g. "success,result.profile_summary,result.tech_stack.languages"
+
+    Returns:
+        {"success": None, "result": {"profile_summary": None, ...}} (None = keep the whole value),
+        or None when no fields were given
+    """
+    if not raw:
+        return None
+    tree: Dict[str, Any] = {}
+    for path in raw.split(","):
+        parts = [part for part in path.strip().split(".") if part]
+        if not parts:
+            continue
+        node = tree
+        for part in parts[:-1]:
+            if part in node and node[part] is None:
+                break  # an ancestor is already kept whole
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = None
+    return tree or None
+
+
+def project(data: Any, tree: Optional[Dict[str, Any]]) -> Any:
+    """Keep only the paths in tree; lists are projected element-wise, missing paths are skipped"""
+    if tree is None:
+        return data
+    if isinstance(data, BaseModel):
+        data = data.model_dump(mode="json")
+    if isinstance(data, list):
+        return [project(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {key: project(data[key], subtree) for key, subtree in tree.items() if key in data}
+
+
+def _default(obj: Any) -> Any:
+    """Types json/orjson can't encode natively (what jsonable_encoder would have converted)"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson and the request's fields= projection
+
+    Returning one directly from an endpoint also skips FastAPI's
+    jsonable_encoder pass; pydantic models left in the content are dumped by
+    the encoder's default hook.
+    """
+
+    def render(self, content: Any) -> bytes:
+        tree = _fields.get()
+        if tree is not None:
+            content = project(content, tree)
+            response_stats.record_projection()
+        return dumps(content)
+
+
+def _accepted_encoding(accept_encoding: str) -> Optional[str]:
+    """Preferred supported encoding from an Accept-Encoding header (br over gzip, q=0 honoured)"""
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=RESPONSE_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=RESPONSE_GZIP_LEVEL)
+
+
+class ResponseStats:
+    """Projection and compression counters for /health"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {"projected": 0, "compressed_br": 0, "compressed_gzip": 0, "bytes_in": 0, "bytes_out": 0}
+
+    def record_projection(self):
+        with self._lock:
+            self._counters["projected"] += 1
+
+    def record_compression(self, encoding: str, size_in: int, size_out: int):
+        with self._lock:
+            self._counters[f"compressed_{encoding}"] += 1
+            self._counters["bytes_in"] += size_in
+            self._counters["bytes_out"] += size_out
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+        return {
+            "json_encoder": "orjson" if orjson is not None else "json",
+            "brotli_available": brotli is not None,
+            "compression_enabled": RESPONSE_COMPRESSION_ENABLED,
+            "compression_ratio": round(counters["bytes_out"] / counters["bytes_in"], 3) if counters["bytes_in"] else None,
+            **counters
+        }
+
+
+class ResponseEncodingMiddleware:
+    """
+    ASGI middleware: binds ?fields= for FastJSONResponse and compresses large bodies
+
+    Only responses with a Content-Length of at least min_size are buffered and
+    compressed; streaming responses (SSE job events, coach stream) have no
+    Content-Length and pass through untouched so events are not held back.
+    """
+
+    def __init__(self, app, enabled: bool = RESPONSE_COMPRESSION_ENABLED,
+                 min_size: int = RESPONSE_COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.enabled = enabled
+        self.min_size = min_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        token = _fields.set(parse_fields(",".join(query.get("fields", []))))
+        try:
+            encoding = None
+            if self.enabled:
+                headers = dict(scope.get("headers") or [])
+                encoding = _accepted_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"))
+            if encoding is None:
+                await self.app(scope, receive, send)
+            else:
+                await self.app(scope, receive, _CompressingSend(send, encoding, self.min_size))
+        finally:
+            _fields.reset(token)
+
+
+class _CompressingSend:
+    """send() wrapper holding a compressible response until its body is complete"""
+
+    def __init__(self, send, encoding: str, min_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.min_size = min_size
+        self.start: Optional[Dict[str, Any]] = None
+        self.buffering = False
+        self.chunks: List[bytes] = []
+
+    def _should_compress(self, message: Dict[str, Any]) -> bool:
+        headers: List[Tuple[bytes, bytes]] = message.get("headers", [])
+        values = {name.lower(): value for name, value in headers}
+        if message["status"] < 200 or message["status"] in (204, 304) or b"content-encoding" in values:
+            return False
+        content_type = values.get(b"content-type", b"").decode("latin-1").split(";")[0].strip()
+        if content_type not in COMPRESSIBLE_TYPES:
+            return False
+        try:
+            return int(values.get(b"content-length", b"")) >= self.min_size
+        except ValueError:
+            return False  # streamed, length unknown
+
+    async def __call__(self, message: Dict[str, Any]):
+        if message["type"] == "http.response.start":
+            if self._should_compress(message):
+                self.start = message
+                self.buffering = True
+                return
+            await self.send(message)
+            return
+        if message["type"] != "http.response.body" or not self.buffering:
+            await self.send(message)
+            return
+
+        self.chunks.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+        self.buffering = False
+        body = b"".join(self.chunks)
+        self.chunks = []
+        compressed = compress(body, self.encoding)
+        if len(compressed) >= len(body):
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": body})
+            return
+        response_stats.record_compression(self.encoding, len(body), len(compressed))
+        headers = [(name, value) for name, value in self.start.get("headers", []) if name.lower() != b"content-length"]
+        headers += [
+            (b"content-encoding", self.encoding.encode()),
+            (b"content-length", str(len(compressed)).encode()),
+            (b"vary", b"Accept-Encoding")
+        ]
+        await self.send({**self.start, "headers": headers})
+        await self.send({"type": "http.response.body", "body": compressed})
+
+
+# Global instance
+response_stats = ResponseStats()
@@ -0,0 +1,138 @@
+"""
+Single-Flight Coalescing
+Concurrent identical analyses (double clicks, several open tabs) share one
+computation: the first caller for a normalized input hash runs it, callers
+arriving while it is in flight wait for and receive the same result
+"""
+
+import os
+import re
+import json
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Callable, Awaitable, Tuple, TypeVar
+from dotenv import load_dotenv
+
+load_dotenv()
+
+SINGLEFLIGHT_ENABLED = os.getenv("SINGLEFLIGHT_ENABLED", "true").lower() in ("1", "true", "yes")
+
+T = TypeVar("T")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace runs so re-submitted copies of the same text hash the same"""
+    return _WHITESPACE.sub(" ", text or "").strip()
+
+
+def flight_key(*parts: Any) -> str:
+    """sha256 over the (already normalized) input parts"""
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """
+    Per-key in-flight table shared by sync (worker thread) and async callers
+
+    Results are handed to every waiter by reference, so callers must treat
+    them as read-only.
+    """
+
+    def __init__(self, enabled: bool = SINGLEFLIGHT_ENABLED):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._flights: Dict[Tuple[str, str], Future] = {}
+        self._kinds: Dict[str, Dict[str, int]] = {}
+
+    def _join(self, kind: str, key: str) -> Tuple[Future, bool]:
+        """Return (future, is_leader) for this key"""
+        with self._lock:
+            counters = self._kinds.setdefault(kind, {"executions": 0, "coalesced": 0, "failed": 0})
+            future = self._flights.get((kind, key))
+            if future is not None:
+                counters["coalesced"] += 1
+                return future, False
+            future = Future()
+            self._flights[(kind, key)] = future
+            counters["executions"] += 1
+            return future, True
+
+    def _settle(self, kind: str, key: str, future: Future, result: Any = None,
+                error: BaseException = None):
+        with self._lock:
+            if self._flights.get((kind, key)) is future:
+                del self._flights[(kind, key)]
+            if error is not None:
+                self._kinds[kind]["failed"] += 1
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def run(self, kind: str, key: str, fn: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a blocking computation once per in-flight key (call from a worker thread)
+
+        Args:
+            kind: Computation name for stats (e.g. "github_analysis")
+            key: Normalized input hash from flight_key()
+            fn: Blocking callable
+        """
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        future, leader = self._join(kind, key)
+        if not leader:
+            return future.result()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._settle(kind, key, future, error=e)
+            raise
+        self._settle(kind, key, future, result)
+        return result
+
+    async def arun(self, kind: str, key: str, fn: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """
+        Await a coroutine once per in-flight key
+
+        The shared computation runs as its own task, so a waiter that is
+        cancelled (client went away) does not cancel it for the others.
+        """
+        if not self.enabled:
+            return await fn(*args, **kwargs)
+        future, leader = self._join(kind, key)
+        if leader:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+
+            def done(task: asyncio.Task):
+                if task.cancelled():
+                    self._settle(kind, key, future, error=asyncio.CancelledError())
+                else:
+                    self._settle(kind, key, future, task.result() if task.exception() is None else None,
+                                 task.exception())
+
+            task.add_done_callback(done)
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            kinds = {kind: dict(counters) for kind, counters in self._kinds.items()}
+            in_flight = len(self._flights)
+        for counters in kinds.values():
+            requests = counters["executions"] + counters["coalesced"]
+            counters["coalesced_ratio"] = round(counters["coalesced"] / requests, 4) if requests else 0.0
+        return {
+            "enabled": self.enabled,
+            "in_flight": in_flight,
+            "coalesced": sum(counters["coalesced"] for counters in kinds.values()),
+            "kinds": kinds
+        }
+
+
+# Global instance
+single_flight = SingleFlight()
@@ -0,0 +1,223 @@
+"""
+Startup Warm-up
+Import-time measurement for the service's module groups, lazy loading of
+rarely used subsystems (matcher/hackathon agent) and a background warm-up that
+compiles the LangGraph graphs; /ready only reports ready once every required
+warm-up step has succeeded (failed ones are retried in the background), while
+optional steps get a few attempts and are then only reported
+"""
+
+import os
+import sys
+import time
+import threading
+import importlib.util
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Dict, Any, List, Callable, Tuple, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Compile graphs in the background after startup; when off, /ready is ready immediately
+STARTUP_WARMUP = os.getenv("STARTUP_WARMUP", "true").lower() in ("1", "true", "yes")
+# First delay (seconds) before failed warm-up steps are retried; doubles up to STARTUP_RETRY_MAX_BACKOFF
+STARTUP_RETRY_BACKOFF = float(os.getenv("STARTUP_RETRY_BACKOFF", "2"))
+STARTUP_RETRY_MAX_BACKOFF = float(os.getenv("STARTUP_RETRY_MAX_BACKOFF", "60"))
+# Attempts for optional steps (features the service can run without) before they are left failed
+STARTUP_OPTIONAL_ATTEMPTS = int(os.getenv("STARTUP_OPTIONAL_ATTEMPTS", "3"))
+# A failed lazy load is re-raised without retrying for this long, so requests don't hammer a broken import
+LAZY_RETRY_AFTER = float(os.getenv("LAZY_RETRY_AFTER", "5"))
+
+
+def load_module_as(name: str, path: str) -> ModuleType:
+    """
+    Import a file under an explicit module name
+
+    agentic_zip and career_agent both ship top-level common.py/graph.py, so
+    the matcher modules are registered as matcher_common/matcher_graph instead
+    of going through sys.path (where the first one imported wins).
+    """
+    existing = sys.modules.get(name)
+    if existing is not None:
+        return existing
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {name} from {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(name, None)
+        raise
+    return module
+
+
+class StartupState:
+    """Import timings, lazily loaded subsystems and warm-up progress"""
+
+    def __init__(self, warmup_enabled: bool = STARTUP_WARMUP, retry_backoff: float = STARTUP_RETRY_BACKOFF,
+                 lazy_retry_after: float = LAZY_RETRY_AFTER, optional_attempts: int = STARTUP_OPTIONAL_ATTEMPTS):
+        self.warmup_enabled = warmup_enabled
+        self.retry_backoff = retry_backoff
+        self.optional_attempts = max(1, optional_attempts)
+        self.lazy_retry_after = lazy_retry_after
+        self._created = time.perf_counter()  # main imports this module first
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        # starting -> warming -> ready; degraded while required steps are retried (503)
+        # or once ready with optional steps failed (200, see warmup_errors)
+        self.status = "starting"
+        self.import_seconds: Dict[str, float] = {}
+        self.warmup_seconds: Dict[str, float] = {}
+        self.warmup_errors: Dict[str, str] = {}
+        # name -> (value, error, monotonic time of the failure)
+        self._lazy: Dict[str, Tuple[Any, Optional[BaseException], float]] = {}
+        self._lazy_locks: Dict[str, threading.Lock] = {}
+
+    @contextmanager
+    def timed_import(self, name: str):
+        """Record how long the imports inside the block took"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.import_seconds[name] = round(time.perf_counter() - started, 4)
+
+    def imports_done(self):
+        """Close the main module's import measurement and log the slowest groups"""
+        self.import_seconds["main_total"] = round(time.perf_counter() - self._created, 4)
+        groups = sorted(
+            ((name, seconds) for name, seconds in self.import_seconds.items() if name != "main_total"),
+            key=lambda item: item[1], reverse=True
+        )
+        detail = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in groups[:4])
+        print(f"[INFO] Service imports took {self.import_seconds['main_total']:.2f}s ({detail})")
+
+    def lazy(self, name: str, loader: Callable[[], Any]) -> Any:
+        """
+        Load a subsystem on first use and cache it
+
+        A failure is not cached for good: calls within lazy_retry_after of it
+        re-raise the same error, the next one after that runs loader again.
+
+        Args:
+            name: Subsystem name reported in import timings
+            loader: Zero-argument callable doing the imports
+
+        Returns:
+            Whatever loader returned
+
+        Raises:
+            The loader's exception
+        """
+        cached = self._lazy.get(name)
+        if cached is None or self._retry_due(cached):
+            with self._lock:
+                lock = self._lazy_locks.setdefault(name, threading.Lock())
+            with lock:
+                cached = self._lazy.get(name)
+                if cached is None or self._retry_due(cached):
+                    started = time.perf_counter()
+                    try:
+                        cached = (loader(), None, 0.0)
+                    except Exception as e:
+                        print(f"[WARN] Could not load {name}: {e}")
+                        cached = (None, e, time.monotonic())
+                    self.import_seconds[f"lazy:{name}"] = round(time.perf_counter() - started, 4)
+                    self._lazy[name] = cached
+        value, error, _ = cached
+        if error is not None:
+            raise error
+        return value
+
+    def _retry_due(self, cached: Tuple[Any, Optional[BaseException], float]) -> bool:
+        _, error, failed_at = cached
+        return error is not None and time.monotonic() - failed_at >= self.lazy_retry_after
+
+    def start_warmup(self, steps: List[Tuple[str, Callable[[], Any]]],
+                     optional_steps: List[Tuple[str, Callable[[], Any]]] = ()):
+        """
+        Run warm-up steps in a daemon thread
+
+        Readiness flips once every step in steps has succeeded; optional_steps
+        never block it and are given up after optional_attempts tries.
+        """
+        if not self.warmup_enabled or not (steps or optional_steps):
+            self._mark_ready()
+            return
+        self.status = "warming"
+        threading.Thread(target=self._run_warmup, args=(list(steps), list(optional_steps)),
+                         name="startup-warmup", daemon=True).start()
+
+    def _run_warmup(self, steps: List[Tuple[str, Callable[[], Any]]],
+                    optional_steps: List[Tuple[str, Callable[[], Any]]]):
+        started = time.perf_counter()
+        failed = self._run_steps(steps)
+        failed_optional = self._run_steps(optional_steps)
+        total = len(steps) + len(optional_steps)
+        self.warmup_seconds["total"] = round(time.perf_counter() - started, 4)
+        print(f"[INFO] Warm-up finished in {self.warmup_seconds['total']:.2f}s "
+              f"({total - len(failed) - len(failed_optional)}/{total} steps ok)")
+
+        # Not ready until every required step has built; keep retrying the failed ones with backoff
+        backoff = self.retry_backoff
+        while failed:
+            self.status = "degraded"
+            time.sleep(backoff)
+            backoff = min(backoff * 2, STARTUP_RETRY_MAX_BACKOFF)
+            failed = self._run_steps(failed)
+        print(f"[INFO] Warm-up complete after {time.perf_counter() - started:.2f}s")
+        self._mark_ready()
+
+        backoff = self.retry_backoff
+        for _ in range(self.optional_attempts - 1):
+            if not failed_optional:
+                break
+            self.status = "degraded"
+            time.sleep(backoff)
+            backoff = min(backoff * 2, STARTUP_RETRY_MAX_BACKOFF)
+            failed_optional = self._run_steps(failed_optional)
+        if failed_optional:
+            self.status = "degraded"
+            print(f"[WARN] Giving up on optional warm-up steps: {', '.join(name for name, _ in failed_optional)}")
+        else:
+            self.status = "ready"
+
+    def _run_steps(self, steps: List[Tuple[str, Callable[[], Any]]]) -> List[Tuple[str, Callable[[], Any]]]:
+        """Run steps in order; returns the ones that failed (their errors are kept in warmup_errors)"""
+        failed = []
+        for name, step in steps:
+            step_started = time.perf_counter()
+            try:
+                step()
+            except Exception as e:
+                print(f"[WARN] Warm-up step {name} failed: {e}")
+                self.warmup_errors[name] = str(e)
+                failed.append((name, step))
+            else:
+                self.warmup_errors.pop(name, None)
+            self.warmup_seconds[name] = round(time.perf_counter() - step_started, 4)
+        return failed
+
+    def _mark_ready(self):
+        self.status = "ready"
+        self._ready.set()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "warmup_enabled": self.warmup_enabled,
+            "import_seconds": dict(self.import_seconds),
+            "warmup_seconds": dict(self.warmup_seconds),
+            "warmup_errors": dict(self.warmup_errors)
+        }
+
+
+# Global instance
+startup_state = StartupState()
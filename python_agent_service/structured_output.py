@@ -0,0 +1,210 @@
+"""
+Structured LLM Output
+Shared JSON extraction and schema validation for every call site that asks the
+LLM for JSON: an incremental balanced-brace extractor (string/escape aware, so
+prose, code fences and trailing text around the JSON don't break parsing),
+pydantic validation, and per-call-site parse-failure rates
+"""
+
+import ast
+import json
+import re
+import threading
+from typing import Dict, Any, List, Optional, Type, Iterator
+from pydantic import BaseModel
+
+_CLOSERS = {"{": "}", "[": "]"}
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+class StructuredOutputError(ValueError):
+    """LLM reply did not contain JSON matching the expected schema"""
+
+    def __init__(self, site: str, stage: str, detail: str, text: str = ""):
+        super().__init__(f"{site}: {stage} failed - {detail}")
+        self.site = site
+        self.stage = stage
+        self.text = text
+
+
+class IncrementalJSONExtractor:
+    """
+    Find complete top-level JSON objects/arrays in text fed chunk by chunk
+
+    Brackets inside JSON strings are ignored; a candidate whose brackets don't
+    match is abandoned and scanning resumes just after its opening bracket.
+    """
+
+    def __init__(self, openers: str = "{["):
+        self.openers = openers
+        self._buffer = ""
+        self._reset()
+
+    def _reset(self):
+        self._start = None
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> List[str]:
+        """Add text; returns the candidates completed by this chunk, in order"""
+        found = []
+        pos = len(self._buffer)
+        self._buffer += chunk
+        while pos < len(self._buffer):
+            ch = self._buffer[pos]
+            if self._start is None:
+                if ch in self.openers:
+                    self._start = pos
+                    self._stack = [_CLOSERS[ch]]
+                pos += 1
+                continue
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in _CLOSERS:
+                self._stack.append(_CLOSERS[ch])
+            elif ch in "}]":
+                if ch != self._stack[-1]:
+                    pos = self._start + 1
+                    self._reset()
+                    continue
+                self._stack.pop()
+                if not self._stack:
+                    found.append(self._buffer[self._start:pos + 1])
+                    self._buffer = self._buffer[pos + 1:]
+                    pos = 0
+                    self._reset()
+                    continue
+            pos += 1
+        if self._start is None:
+            self._buffer = ""
+        return found
+
+
+def iter_json_candidates(text: str, openers: str = "{[") -> Iterator[str]:
+    """Balanced JSON-looking substrings of text, in order of appearance"""
+    yield from IncrementalJSONExtractor(openers).feed(text or "")
+
+
+def _loads_lenient(candidate: str) -> Any:
+    """json.loads, then with trailing commas removed, then as a Python literal (single quotes)"""
+    try:
+        return json.loads(candidate)
+    except json.JSONDecodeError:
+        pass
+    try:
+        return json.loads(_TRAILING_COMMA.sub(r"\1", candidate))
+    except json.JSONDecodeError:
+        pass
+    try:
+        return ast.literal_eval(candidate)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        raise ValueError("not valid JSON")
+
+
+def extract_json(text: str, expect: Optional[type] = None) -> Any:
+    """
+    Extract the first JSON value from an LLM reply
+
+    Args:
+        text: Raw LLM reply
+        expect: dict or list to only accept that top-level type
+
+    Returns:
+        The decoded value
+
+    Raises:
+        ValueError: If no (matching) JSON value is found
+    """
+    stripped = (text or "").strip()
+    try:
+        data = json.loads(stripped)
+        if expect is None or isinstance(data, expect):
+            return data
+    except json.JSONDecodeError:
+        pass
+
+    openers = {dict: "{", list: "["}.get(expect, "{[")
+    for candidate in iter_json_candidates(stripped, openers):
+        try:
+            data = _loads_lenient(candidate)
+        except ValueError:
+            continue
+        if expect is None or isinstance(data, expect):
+            return data
+    raise ValueError("no JSON value found in reply")
+
+
+class StructuredOutputStats:
+    """Per-call-site counts of extraction/validation failures"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sites: Dict[str, Dict[str, int]] = {}
+
+    def record(self, site: str, stage: Optional[str] = None, native: bool = False):
+        with self._lock:
+            stats = self._sites.setdefault(site, {
+                "calls": 0, "ok": 0, "extract_failures": 0, "validation_failures": 0, "native_json_mode": 0
+            })
+            stats["calls"] += 1
+            if native:
+                stats["native_json_mode"] += 1
+            if stage is None:
+                stats["ok"] += 1
+            else:
+                stats[f"{stage}_failures"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sites = {site: dict(values) for site, values in self._sites.items()}
+        for values in sites.values():
+            failed = values["extract_failures"] + values["validation_failures"]
+            values["failure_rate"] = round(failed / values["calls"], 4) if values["calls"] else 0.0
+        return sites
+
+
+def parse_structured(site: str, text: str, schema: Optional[Type[BaseModel]] = None,
+                     many: bool = False, native: bool = False) -> Any:
+    """
+    Extract and validate structured output from an LLM reply
+
+    Args:
+        site: Call-site name for failure accounting
+        text: Raw LLM reply
+        schema: Pydantic model to validate against (None returns the decoded JSON)
+        many: Expect a JSON array (of schema items when schema is given)
+        native: Reply was produced in provider JSON mode (for stats)
+
+    Returns:
+        A schema instance, a list of them (many=True), or plain decoded JSON
+
+    Raises:
+        StructuredOutputError: If extraction or validation fails
+    """
+    try:
+        data = extract_json(text, list if many else dict)
+    except ValueError as e:
+        structured_output_stats.record(site, "extract", native)
+        raise StructuredOutputError(site, "extract", str(e), text)
+
+    if schema is not None:
+        try:
+            data = [schema(**item) for item in data] if many else schema(**data)
+        except Exception as e:
+            structured_output_stats.record(site, "validation", native)
+            raise StructuredOutputError(site, "validation", str(e), text)
+
+    structured_output_stats.record(site, native=native)
+    return data
+
+
+# Global instance
+structured_output_stats = StructuredOutputStats()
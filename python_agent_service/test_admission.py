@@ -0,0 +1,123 @@
+"""
+Tests for per-route-class admission control (admission.py)
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from admission import AdmissionController, AdmissionControl, AdmissionRejected
+
+
+def _controller(**overrides):
+    settings = {"max_concurrent": 1, "max_queue": 10, "max_per_user": 5, "queue_timeout": 5.0}
+    settings.update(overrides)
+    return AdmissionController("workflow", **settings)
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_waiting_users_are_served_round_robin():
+    controller = _controller()
+    admitted = []
+
+    async def request(user, label):
+        await controller.acquire(user)
+        admitted.append((user, label))
+
+    async def scenario():
+        await controller.acquire("holder")
+        tasks = [asyncio.ensure_future(request(user, label))
+                 for user, label in [("a", 1), ("a", 2), ("a", 3), ("b", 1), ("b", 2)]]
+        await _settle()
+        assert controller.stats()["queued"] == 5
+
+        current = "holder"
+        for _ in tasks:
+            controller.release(current)
+            await _settle()
+            current = admitted[-1][0]
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    assert admitted == [("a", 1), ("b", 1), ("a", 2), ("b", 2), ("a", 3)]
+
+
+def test_per_user_cap_counts_active_and_queued_requests():
+    controller = _controller(max_per_user=2)
+
+    async def scenario():
+        await controller.acquire("a")
+        queued = asyncio.ensure_future(controller.acquire("a"))
+        await _settle()
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire("a")
+        assert rejected.value.reason == "user_share"
+
+        # Another user can still queue
+        other = asyncio.ensure_future(controller.acquire("b"))
+        await _settle()
+        assert controller.stats()["queued"] == 2
+        for task in (queued, other):
+            task.cancel()
+        await asyncio.gather(queued, other, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert controller.stats()["rejected_user_share"] == 1
+    assert controller.stats()["queued"] == 0
+
+
+def test_full_queue_rejects_with_retry_after():
+    controller = _controller(max_queue=1)
+
+    async def scenario():
+        await controller.acquire("a")
+        queued = asyncio.ensure_future(controller.acquire("b"))
+        await _settle()
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire("c")
+        assert rejected.value.reason == "queue_full"
+        assert rejected.value.retry_after >= 1
+        controller.release("a")
+        await queued
+
+    asyncio.run(scenario())
+    assert controller.stats()["active"] == 1
+
+
+def test_queue_timeout_rejects_and_drops_the_waiter():
+    controller = _controller(queue_timeout=0.05)
+
+    async def scenario():
+        await controller.acquire("a")
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire("b")
+        assert rejected.value.reason == "queue_timeout"
+        assert controller.stats()["queued"] == 0
+
+        # The freed slot goes to the next live request, not the timed-out one
+        controller.release("a")
+        await controller.acquire("c")
+
+    asyncio.run(scenario())
+    stats = controller.stats()
+    assert (stats["active"], stats["users_active"], stats["rejected_queue_timeout"]) == (1, 1, 1)
+
+
+def test_disabled_admission_control_is_a_no_op():
+    control = AdmissionControl(enabled=False)
+
+    async def scenario():
+        async with control.slot("workflow", "a"):
+            async with control.slot("workflow", "a"):
+                pass
+
+    asyncio.run(scenario())
+    assert control.stats()["workflow"]["admitted"] == 0
@@ -0,0 +1,66 @@
+"""
+Tests for coach routing in main.py: analysis routes without their input fall back to the chat reply
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import main
+from fastapi.testclient import TestClient
+
+pytestmark = pytest.mark.skipif(not main.career_agent_imported, reason="career agent not importable")
+
+FALLBACK_MESSAGES = [
+    ("resume_analysis", "Please analyze my resume"),
+    ("github_analysis", "Can you analyze my github profile?"),
+]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def fake_acall_llm(prompt, **kwargs):
+        return "chat reply"
+
+    async def fake_astream_llm(prompt, **kwargs):
+        for chunk in ("chat ", "reply"):
+            yield chunk
+
+    monkeypatch.setattr(main, "acall_llm", fake_acall_llm)
+    monkeypatch.setattr(main, "astream_llm", fake_astream_llm)
+    return TestClient(main.app)
+
+
+def _sse_events(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.mark.parametrize("route,message", FALLBACK_MESSAGES)
+def test_analysis_without_input_falls_back_to_chat(client, route, message):
+    assert main.classify_coach_message(message) == route
+
+    response = client.post("/api/agent/coach", json={"message": message, "user": {"name": "Ada"}})
+
+    assert response.status_code == 200
+    assert response.json() is not None
+    assert response.json()["reply"] == "chat reply"
+
+
+@pytest.mark.parametrize("route,message", FALLBACK_MESSAGES)
+def test_streamed_analysis_without_input_falls_back_to_chat(client, route, message):
+    response = client.post("/api/agent/coach/stream", json={"message": message, "user": {"name": "Ada"}})
+
+    events = _sse_events(response.text)
+    assert events[0] == ("route", {"type": route})
+    assert [data["text"] for event, data in events if event == "token"] == ["chat ", "reply"]
+    event, body = events[-1]
+    assert event == "done"
+    assert body == client.post("/api/agent/coach", json={"message": message, "user": {"name": "Ada"}}).json()
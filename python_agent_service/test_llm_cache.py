@@ -0,0 +1,71 @@
+"""
+Tests for the LLM response cache (llm_cache.py): the async API keeps SQLite off the event loop
+"""
+
+import sys
+import asyncio
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from llm_cache import LLMResponseCache
+
+
+def _cache(tmp_path, **overrides):
+    settings = {"db_path": str(tmp_path / "llm_cache.sqlite"), "enabled": True}
+    settings.update(overrides)
+    return LLMResponseCache(**settings)
+
+
+def _record_disk_threads(cache, monkeypatch):
+    threads = []
+    disk_get, disk_set = cache._disk_get, cache._disk_set
+
+    def recording_get(*args):
+        threads.append(threading.current_thread())
+        return disk_get(*args)
+
+    def recording_set(*args):
+        threads.append(threading.current_thread())
+        return disk_set(*args)
+
+    monkeypatch.setattr(cache, "_disk_get", recording_get)
+    monkeypatch.setattr(cache, "_disk_set", recording_set)
+    return threads
+
+
+def test_async_sqlite_reads_and_writes_run_off_the_event_loop(tmp_path, monkeypatch):
+    cache = _cache(tmp_path)
+    threads = _record_disk_threads(cache, monkeypatch)
+
+    async def round_trip():
+        loop_thread = threading.current_thread()
+        assert await cache.aget("gemini", "m", "prompt") is None
+        await cache.aset("gemini", "m", "prompt", "reply")
+        return loop_thread
+
+    loop_thread = asyncio.run(round_trip())
+
+    assert len(threads) == 2
+    assert loop_thread not in threads
+
+
+def test_async_memory_hit_skips_the_sqlite_tier(tmp_path, monkeypatch):
+    cache = _cache(tmp_path)
+    cache.set("gemini", "m", "prompt", "reply")
+    threads = _record_disk_threads(cache, monkeypatch)
+
+    assert asyncio.run(cache.aget("gemini", "m", "prompt")) == "reply"
+    assert threads == []
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_async_disk_hit_is_promoted_to_memory(tmp_path):
+    _cache(tmp_path).set("gemini", "m", "prompt", "reply")
+    cache = _cache(tmp_path)
+
+    assert asyncio.run(cache.aget("gemini", "m", "prompt")) == "reply"
+    assert asyncio.run(cache.aget("gemini", "m", "prompt")) == "reply"
+    stats = cache.stats()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 0)
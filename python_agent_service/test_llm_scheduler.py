@@ -0,0 +1,106 @@
+"""
+Tests for the LLM admission scheduler (llm_scheduler.py)
+"""
+
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from llm_scheduler import TokenBucket, LLMScheduler, llm_priority, current_priority
+
+
+def test_token_bucket_starts_full_and_refills():
+    bucket = TokenBucket(rate_per_second=2, burst=3)
+    now = bucket.updated
+
+    assert [bucket.try_take(now) for _ in range(4)] == [True, True, True, False]
+    assert bucket.seconds_until_token(now) == pytest.approx(0.5)
+    assert bucket.try_take(now + 0.5)
+    # Refill never exceeds the burst capacity
+    bucket.seconds_until_token(now + 60)
+    assert bucket.tokens == 3
+
+
+def test_llm_priority_sets_lane_for_block():
+    assert current_priority() == "batch"
+    with llm_priority("interactive"):
+        assert current_priority() == "interactive"
+    assert current_priority() == "batch"
+    with pytest.raises(ValueError):
+        with llm_priority("urgent"):
+            pass
+
+
+def _queue_waiter(scheduler, priority, admitted):
+    def run():
+        with scheduler.slot("mock", "mock", priority=priority):
+            admitted.append(priority)
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def _wait_for_depth(scheduler, depth):
+    deadline = time.monotonic() + 2
+    while scheduler.stats()["queue_depth"] < depth:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_interactive_lane_admitted_before_earlier_background_and_batch():
+    scheduler = LLMScheduler(max_in_flight=1)
+    admitted = []
+
+    with scheduler.slot("mock", "mock", priority="batch"):
+        threads = []
+        for depth, priority in enumerate(["background", "batch", "interactive"], start=1):
+            threads.append(_queue_waiter(scheduler, priority, admitted))
+            _wait_for_depth(scheduler, depth)
+        lanes = scheduler.stats()["lanes"]
+        assert {name: lane["queue_depth"] for name, lane in lanes.items()} == {
+            "interactive": 1, "batch": 1, "background": 1
+        }
+    for thread in threads:
+        thread.join(timeout=2)
+
+    assert admitted == ["interactive", "batch", "background"]
+    assert scheduler.stats()["in_flight"] == 0
+
+
+def test_rate_limited_call_is_admitted_when_bucket_refills(monkeypatch):
+    monkeypatch.setenv("LLM_RATE_LIMIT_RPM_GEMINI", "1200")  # one token every 50ms
+    scheduler = LLMScheduler(max_in_flight=4, burst=1)
+
+    started = time.monotonic()
+    with scheduler.slot("gemini", "model"):
+        pass
+    with scheduler.slot("gemini", "model"):
+        pass
+
+    assert time.monotonic() - started >= 0.04
+    assert scheduler.stats()["rate_limits_rpm"] == {"gemini:model": 1200}
+
+
+def test_cancelled_async_waiter_leaves_queue():
+    scheduler = LLMScheduler(max_in_flight=1)
+
+    async def scenario():
+        async with scheduler.aslot("mock", "mock"):
+            waiter = asyncio.ensure_future(scheduler.aslot("mock", "mock").__aenter__())
+            await asyncio.sleep(0.01)
+            assert scheduler.stats()["queue_depth"] == 1
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        assert scheduler.stats()["queue_depth"] == 0
+        async with scheduler.aslot("mock", "mock"):
+            assert scheduler.stats()["in_flight"] == 1
+
+    asyncio.run(scenario())
+    assert scheduler.stats()["in_flight"] == 0
@@ -0,0 +1,43 @@
+"""
+Tests for prompt budget accounting (prompt_budget.py): savings are attributed to the traced request
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import prompt_budget
+from prompt_budget import PromptBudgetStats, fit_sections
+from tracing import request_scope
+
+
+def test_savings_are_totalled_per_request(monkeypatch):
+    stats = PromptBudgetStats()
+    monkeypatch.setattr(prompt_budget, "prompt_budget_stats", stats)
+
+    with request_scope("req-a"):
+        fit_sections("coach_chat", [("text", "x" * 400)], budget=50)
+        fit_sections("coach_resume", [("text", "y" * 40)], budget=50)
+    with request_scope("req-b"):
+        fit_sections("coach_chat", [("text", "z" * 40)], budget=50)
+    fit_sections("coach_chat", [("text", "w" * 400)], budget=50)
+
+    totals = stats.for_request("req-a")
+    assert (totals["calls"], totals["truncated_calls"], totals["tokens_before"]) == (2, 1, 110)
+    assert totals["tokens_saved"] == 110 - totals["tokens_after"] > 0
+    assert stats.for_request("req-b")["tokens_saved"] == 0
+    assert stats.for_request("req-c") is None
+    assert set(stats.stats()["requests"]) == {"req-a", "req-b"}
+    assert [entry["request_id"] for entry in stats.stats()["recent"]] == ["req-a", "req-a", "req-b", None]
+    assert stats.stats()["sites"]["coach_chat"]["calls"] == 3
+
+
+def test_only_the_latest_requests_are_kept():
+    stats = PromptBudgetStats(max_requests=2)
+    for request_id in ("r1", "r2", "r3"):
+        with request_scope(request_id):
+            stats.record("coach_chat", 10, 5)
+
+    assert stats.for_request("r1") is None
+    assert list(stats.stats()["requests"]) == ["r2", "r3"]
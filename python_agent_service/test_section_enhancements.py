@@ -0,0 +1,77 @@
+"""
+Tests for the bounded resume section fan-out (career_agent/common.py)
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from startup import load_module_as
+from executors import executor_stats
+
+career_common = load_module_as("career_common", str(Path(__file__).parent / "career_agent" / "common.py"))
+
+RESUME = {
+    "contact_info": {"name": "Test"},
+    "skills": ["Python"],
+    "experience": [{"title": "Engineer"}],
+    "education": [{"degree": "BSc"}],
+    "projects": [{"name": "Demo"}],
+    "achievements": ["Award"],
+}
+
+
+def _sleeping_section(delay):
+    def analyze(section_name, section_data, target_role):
+        time.sleep(delay)
+        return career_common.SectionEnhancement(section_name=section_name, current_score=70, improvements=[])
+    return analyze
+
+
+def _timed_out(enhancement):
+    return bool(enhancement.improvements) and "timed out" in enhancement.improvements[0]
+
+
+def test_every_slow_section_times_out(monkeypatch):
+    monkeypatch.setattr(career_common, "_analyze_section", _sleeping_section(0.3))
+
+    started = time.monotonic()
+    results = career_common.generate_section_enhancements(RESUME, section_timeout=0.2, max_concurrency=4)
+
+    assert [e.section_name for e in results] == [name for name, _ in career_common._resume_sections(RESUME)]
+    assert all(_timed_out(e) for e in results)
+    # Two waves of 0.2s deadlines, not one 0.2s wait per section
+    assert time.monotonic() - started < 0.8
+
+
+def test_sections_within_timeout_succeed_in_order(monkeypatch):
+    monkeypatch.setattr(career_common, "_analyze_section", _sleeping_section(0.05))
+
+    results = career_common.generate_section_enhancements(RESUME, section_timeout=1, max_concurrency=2)
+
+    assert [e.section_name for e in results] == [name for name, _ in career_common._resume_sections(RESUME)]
+    assert all(e.current_score == 70 for e in results)
+
+
+def test_failed_section_gets_error_entry(monkeypatch):
+    def analyze(section_name, section_data, target_role):
+        if section_name == "Skills":
+            raise ValueError("bad reply")
+        return None
+
+    monkeypatch.setattr(career_common, "_analyze_section", analyze)
+
+    results = career_common.generate_section_enhancements(RESUME, section_timeout=1)
+
+    assert [(e.section_name, e.improvements) for e in results] == [("Skills", ["Analysis error: bad reply"])]
+
+
+def test_fan_out_runs_on_fanout_executor(monkeypatch):
+    monkeypatch.setattr(career_common, "_analyze_section", _sleeping_section(0))
+    submitted = executor_stats()["fanout"]["submitted"]
+
+    career_common.generate_section_enhancements(RESUME, section_timeout=1)
+
+    assert executor_stats()["fanout"]["submitted"] - submitted == len(career_common._resume_sections(RESUME))
@@ -0,0 +1,109 @@
+"""
+Tests for single-flight coalescing (singleflight.py)
+"""
+
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from singleflight import SingleFlight, flight_key, normalize_text
+
+
+def _wait_until(condition):
+    deadline = time.monotonic() + 2
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_flight_key_ignores_whitespace_differences():
+    assert flight_key(normalize_text("  Senior   Python\n dev ")) == flight_key(normalize_text("Senior Python dev"))
+    assert flight_key("a", "b") != flight_key("b", "a")
+
+
+def test_run_coalesces_concurrent_callers():
+    flights = SingleFlight(enabled=True)
+    release = threading.Event()
+    calls = []
+
+    def analyze():
+        calls.append(1)
+        release.wait(timeout=2)
+        return {"score": 90}
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(flights.run, "resume", "k", analyze) for _ in range(5)]
+        _wait_until(lambda: flights.stats()["kinds"].get("resume", {}).get("coalesced", 0) == 4)
+        release.set()
+        results = [future.result(timeout=2) for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    stats = flights.stats()
+    assert stats["in_flight"] == 0
+    assert stats["kinds"]["resume"]["executions"] == 1
+    assert stats["kinds"]["resume"]["coalesced_ratio"] == 0.8
+
+
+def test_run_failure_reaches_every_waiter_and_is_not_cached():
+    flights = SingleFlight(enabled=True)
+    release = threading.Event()
+
+    def fail():
+        release.wait(timeout=2)
+        raise ValueError("provider down")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(flights.run, "github", "k", fail) for _ in range(3)]
+        _wait_until(lambda: flights.stats()["kinds"].get("github", {}).get("coalesced", 0) == 2)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(timeout=2)
+
+    assert flights.stats()["kinds"]["github"]["failed"] == 1
+    assert flights.run("github", "k", lambda: "ok") == "ok"
+
+
+def test_arun_coalesces_and_survives_a_cancelled_waiter():
+    flights = SingleFlight(enabled=True)
+    calls = []
+
+    async def analyze():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "report"
+
+    async def scenario():
+        waiters = [asyncio.ensure_future(flights.arun("resume", "k", analyze)) for _ in range(4)]
+        await asyncio.sleep(0.01)
+        # The leader's caller going away must not cancel the shared computation
+        waiters[0].cancel()
+        return await asyncio.gather(*waiters[1:])
+
+    assert asyncio.run(scenario()) == ["report"] * 3
+    assert len(calls) == 1
+    assert flights.stats()["in_flight"] == 0
+
+
+def test_disabled_runs_every_call():
+    flights = SingleFlight(enabled=False)
+    calls = []
+
+    async def analyze():
+        calls.append(1)
+        return len(calls)
+
+    async def scenario():
+        return await asyncio.gather(*(flights.arun("resume", "k", analyze) for _ in range(3)))
+
+    assert sorted(asyncio.run(scenario())) == [1, 2, 3]
+    assert flights.run("resume", "k", lambda: "direct") == "direct"
+    assert flights.stats()["kinds"] == {}
@@ -0,0 +1,88 @@
+"""
+Tests for startup readiness and lazy subsystem loading (startup.py)
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from startup import StartupState
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_ready_after_all_steps_succeed():
+    state = StartupState(warmup_enabled=True)
+    state.start_warmup([("a", lambda: None), ("b", lambda: None)])
+
+    assert _wait_for(lambda: state.ready)
+    assert state.status == "ready"
+    assert state.warmup_errors == {}
+
+
+def test_failed_step_keeps_service_degraded_until_retry_succeeds():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("graph did not compile")
+
+    state = StartupState(warmup_enabled=True, retry_backoff=0.05)
+    state.start_warmup([("ok", lambda: None), ("flaky", flaky)])
+
+    assert _wait_for(lambda: state.status == "degraded")
+    assert not state.ready
+    assert "flaky" in state.stats()["warmup_errors"]
+
+    assert _wait_for(lambda: state.ready)
+    assert len(attempts) == 3
+    assert state.warmup_errors == {}
+
+
+def test_lazy_failure_is_retried_after_backoff():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        if len(calls) == 1:
+            raise ImportError("missing dependency")
+        return "loaded"
+
+    state = StartupState(lazy_retry_after=0.05)
+    for _ in range(2):
+        try:
+            state.lazy("matcher", loader)
+        except ImportError:
+            pass
+    assert len(calls) == 1  # second call inside the backoff re-raises the cached error
+
+    time.sleep(0.06)
+    assert state.lazy("matcher", loader) == "loaded"
+    assert state.lazy("matcher", loader) == "loaded"
+    assert len(calls) == 2
+
+
+def test_failing_optional_step_does_not_block_readiness():
+    attempts = []
+
+    def broken():
+        attempts.append(1)
+        raise RuntimeError("'strategy_plan' is already being used as a state attribute")
+
+    state = StartupState(warmup_enabled=True, retry_backoff=0.01, optional_attempts=3)
+    state.start_warmup([("career_graph", lambda: None)], [("hackathon_graph", broken)])
+
+    assert _wait_for(lambda: state.ready)
+    assert _wait_for(lambda: len(attempts) == 3)
+    time.sleep(0.05)
+    assert len(attempts) == 3
+    assert state.status == "degraded"
+    assert "hackathon_graph" in state.stats()["warmup_errors"]
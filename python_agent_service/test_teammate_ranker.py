@@ -0,0 +1,76 @@
+"""
+Tests for streaming top-k teammate ranking (tools.TeammateRanker)
+"""
+
+import sys
+import random
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tools import TeammateRanker
+
+SKILLS = ["Python", "React", "Node.js", "MongoDB", "Docker", "AWS", "Go", "Figma"]
+
+
+def _sorted_ranking(candidates, required_skills, user_skills, k):
+    """The scoring find_teammates used before TeammateRanker: score everything, stable sort, slice"""
+    teammates = []
+    for candidate in candidates:
+        candidate_skills = set(candidate.get("skills", []))
+        required_set = set(required_skills)
+        user_set = set(user_skills)
+        complement_skills = list(required_set - user_set & candidate_skills)
+        match_score = len(complement_skills) / len(required_set) if required_set else 0
+        if match_score > 0:
+            teammates.append({
+                **candidate,
+                "match_score": round(match_score * 10, 2),
+                "complement_skills": complement_skills
+            })
+    teammates.sort(key=lambda x: x["match_score"], reverse=True)
+    return teammates[:k]
+
+
+def _ranked(candidates, required_skills, user_skills, k, page_size=7):
+    ranker = TeammateRanker(required_skills, user_skills, k)
+    for start in range(0, len(candidates), page_size):
+        ranker.add(candidates[start:start + page_size])
+    return ranker.results()
+
+
+def _summary(teammates):
+    return [(t["id"], t["match_score"], sorted(t["complement_skills"])) for t in teammates]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_sorted_ranking_including_tie_order(seed):
+    rng = random.Random(seed)
+    candidates = [
+        {"id": f"user-{n}", "skills": rng.sample(SKILLS, rng.randint(0, 4))}
+        for n in range(rng.randint(0, 120))
+    ]
+    required_skills = rng.sample(SKILLS, rng.randint(1, 5))
+    user_skills = rng.sample(SKILLS, rng.randint(0, 3))
+    k = rng.choice([1, 3, 10, 50])
+
+    assert _summary(_ranked(candidates, required_skills, user_skills, k)) == \
+        _summary(_sorted_ranking(candidates, required_skills, user_skills, k))
+
+
+def test_equal_scores_keep_stream_order_across_pages():
+    candidates = [{"id": f"user-{n}", "skills": ["React"]} for n in range(30)]
+
+    results = _ranked(candidates, ["React", "Go"], [], k=5, page_size=4)
+
+    assert [t["id"] for t in results] == ["user-0", "user-1", "user-2", "user-3", "user-4"]
+    assert all(t["match_score"] == 5.0 for t in results)
+
+
+def test_nothing_to_complement_returns_no_candidates():
+    candidates = [{"id": "user-0", "skills": ["Python"]}]
+
+    assert _ranked(candidates, ["Python"], ["Python"], k=10) == []
+    assert _ranked(candidates, ["Python"], [], k=0) == []
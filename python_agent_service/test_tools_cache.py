@@ -0,0 +1,153 @@
+"""
+Tests for the per-user Node API cache (tools_cache.py) and AgentTools' read-through
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import tools
+import tools_cache
+from tools_cache import AgentToolsCache, FRESH, STALE
+
+
+class FakeClock:
+    """Stands in for the time module with a settable time(); everything else is the real module"""
+
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self):
+        return self.now
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(tools_cache, "time", clock)
+    monkeypatch.setattr(tools, "time", clock)
+    return clock
+
+
+def _cache(**overrides):
+    settings = {"enabled": True, "max_bytes": 1024 * 1024, "stale_ttl": 60}
+    settings.update(overrides)
+    cache = AgentToolsCache(**settings)
+    cache.ttls["profile"] = 10
+    return cache
+
+
+def test_entry_is_fresh_then_stale_then_expired(clock):
+    cache = _cache()
+    cache.put("profile", "u1", {"name": "Ada"}, clock.now)
+
+    clock.now += 10
+    assert cache.get("profile", "u1") == (FRESH, {"name": "Ada"})
+    clock.now += 30
+    assert cache.get("profile", "u1") == (STALE, {"name": "Ada"})
+    clock.now += 31
+    assert cache.get("profile", "u1") == (None, None)
+    assert cache.stats()["entries"] == 0
+    counters = cache.stats()["resources"]["profile"]
+    assert (counters["hits"], counters["stale_hits"], counters["misses"]) == (1, 1, 1)
+
+
+def test_lru_eviction_keeps_recently_read_entries(clock):
+    payload = {"bio": "x" * 100}
+    cache = _cache(max_bytes=350)
+    for user_id in ("u1", "u2", "u3"):
+        cache.put("profile", user_id, payload, clock.now)
+    cache.get("profile", "u1")
+
+    cache.put("profile", "u4", payload, clock.now)
+
+    assert cache.get("profile", "u2") == (None, None)
+    assert all(cache.get("profile", user_id)[0] == FRESH for user_id in ("u1", "u3", "u4"))
+    assert cache.stats()["resources"]["profile"]["evictions"] == 1
+    assert cache.stats()["bytes"] <= 350
+
+
+def test_payload_larger_than_cap_is_not_stored(clock):
+    cache = _cache(max_bytes=50)
+    cache.put("profile", "u1", {"bio": "x" * 100}, clock.now)
+    assert cache.get("profile", "u1") == (None, None)
+
+
+def test_load_started_before_invalidation_is_not_stored(clock):
+    cache = _cache()
+    load_started = clock.now
+    clock.now += 1
+    cache.invalidate("u1")
+    clock.now += 1
+
+    cache.put("profile", "u1", {"name": "old"}, load_started)
+    assert cache.get("profile", "u1") == (None, None)
+
+    cache.put("profile", "u1", {"name": "new"}, clock.now)
+    assert cache.get("profile", "u1") == (FRESH, {"name": "new"})
+
+
+def test_invalidation_only_blocks_the_named_resources(clock):
+    cache = _cache()
+    load_started = clock.now
+    clock.now += 1
+    cache.invalidate("u1", ["skills"])
+
+    cache.put("profile", "u1", {"name": "Ada"}, load_started)
+    cache.put("skills", "u1", ["Python"], load_started)
+    cache.put("skills", "u2", ["Go"], load_started)
+
+    assert cache.get("profile", "u1")[0] == FRESH
+    assert cache.get("skills", "u1") == (None, None)
+    assert cache.get("skills", "u2")[0] == FRESH
+
+
+def test_invalidate_everyone_drops_entries_and_in_flight_loads(clock):
+    cache = _cache()
+    cache.put("profile", "u1", {}, clock.now)
+    cache.put("skills", "u2", [], clock.now)
+    load_started = clock.now
+    clock.now += 1
+
+    assert cache.invalidate() == 2
+    cache.put("projects", "u3", [], load_started)
+    assert cache.stats()["entries"] == 0
+
+
+def test_read_through_does_not_cache_a_load_invalidated_midway(clock, monkeypatch):
+    cache = _cache()
+    monkeypatch.setattr(tools, "agent_tools_cache", cache)
+    agent_tools = tools.AgentTools(node_api_url="http://node.invalid")
+
+    def load():
+        # The backend updates the user while this response is in flight
+        clock.now += 1
+        cache.invalidate("u1", ["profile"])
+        clock.now += 1
+        return {"name": "before update"}
+
+    assert agent_tools._read_through("profile", "u1", load) == {"name": "before update"}
+    assert cache.get("profile", "u1") == (None, None)
+
+    assert agent_tools._read_through("profile", "u1", lambda: {"name": "after update"}) == {"name": "after update"}
+    assert cache.get("profile", "u1") == (FRESH, {"name": "after update"})
+
+
+def test_stale_entry_gets_one_background_refresh(clock):
+    cache = _cache()
+    cache.put("profile", "u1", {}, clock.now)
+    clock.now += 20
+
+    assert cache.get("profile", "u1")[0] == STALE
+    assert cache.begin_refresh("profile", "u1")
+    assert not cache.begin_refresh("profile", "u1")
+    cache.end_refresh("profile", "u1")
+    assert cache.begin_refresh("profile", "u1")
+    assert cache.stats()["resources"]["profile"]["refreshes"] == 2
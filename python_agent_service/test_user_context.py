@@ -0,0 +1,66 @@
+"""
+Tests for AsyncAgentTools.fetch_user_context: failed or late parts are reported as missing
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import tools
+import loadtest
+from tools_cache import AgentToolsCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(tools, "agent_tools_cache", AgentToolsCache(enabled=True))
+
+
+@pytest.fixture
+def node_api():
+    dataset = loadtest.Dataset(20)
+    server, url = loadtest.start_stand_in(loadtest.NodeAPIHandler, dataset, 0)
+    yield dataset, url
+    server.shutdown()
+
+
+def test_complete_context_has_nothing_missing(node_api):
+    dataset, url = node_api
+    agent_tools = tools.AsyncAgentTools(node_api_url=url)
+
+    context = asyncio.run(agent_tools.fetch_user_context(dataset.users[0]["id"]))
+
+    assert context["missing"] == []
+    assert context["profile"]["id"] == dataset.users[0]["id"]
+
+
+def test_unreachable_backend_lists_every_part_as_missing():
+    agent_tools = tools.AsyncAgentTools(node_api_url="http://127.0.0.1:9", get_retries=0)
+
+    context = asyncio.run(agent_tools.fetch_user_context("u1", deadline=5))
+
+    assert context["missing"] == ["profile", "projects", "hackathons", "connections"]
+    assert (context["profile"], context["projects"]) == ({}, [])
+
+
+def test_failed_part_is_missing_and_others_are_kept(node_api, monkeypatch):
+    dataset, url = node_api
+    agent_tools = tools.AsyncAgentTools(node_api_url=url, get_retries=0)
+    load = agent_tools._load
+
+    async def load_without_hackathons(method, endpoint, *args, **kwargs):
+        if endpoint.startswith("/hackathons"):
+            raise tools.NodeAPIError("HTTP 500")
+        return await load(method, endpoint, *args, **kwargs)
+
+    monkeypatch.setattr(agent_tools, "_load", load_without_hackathons)
+
+    context = asyncio.run(agent_tools.fetch_user_context(dataset.users[0]["id"]))
+
+    assert context["missing"] == ["hackathons"]
+    assert context["hackathons"] == []
+    assert context["profile"]["id"] == dataset.users[0]["id"]
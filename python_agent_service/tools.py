@@ -4,18 +4,364 @@ These functions call the Node.js backend to get real MongoDB data
 """
 
 import requests
+import httpx
 import os
-from typing import Dict, Any, List, Optional
+import time
+import random
+import asyncio
+import threading
+import contextvars
+import heapq
+from collections import deque
+from concurrent.futures import wait as wait_futures, FIRST_COMPLETED
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Iterable, Iterator, AsyncIterator
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from executors import io_executor, fanout_executor, ExecutorSaturatedError
+from metrics import agent_tools_request_seconds
+from tracing import span
+from tools_cache import agent_tools_cache, FRESH, STALE
 
 # Node.js backend URL
 NODE_API_URL = os.getenv("NODE_API_URL", "http://localhost:5000")
 
+# Overall deadline (seconds) for the concurrent user-context fetch
+USER_CONTEXT_DEADLINE = float(os.getenv("USER_CONTEXT_DEADLINE", "3"))
+
+# Pooled keep-alive transport: connections kept per host (sized to the io executor)
+AGENT_TOOLS_POOL_SIZE = int(os.getenv("AGENT_TOOLS_POOL_SIZE", "32"))
+AGENT_TOOLS_CONNECT_TIMEOUT = float(os.getenv("AGENT_TOOLS_CONNECT_TIMEOUT", "2"))
+AGENT_TOOLS_READ_TIMEOUT = float(os.getenv("AGENT_TOOLS_READ_TIMEOUT", "10"))
+# Extra attempts for GETs after a connection error or 502/503/504, with full-jitter backoff
+AGENT_TOOLS_GET_RETRIES = int(os.getenv("AGENT_TOOLS_GET_RETRIES", "2"))
+AGENT_TOOLS_RETRY_BACKOFF = float(os.getenv("AGENT_TOOLS_RETRY_BACKOFF", "0.1"))
+
+RETRYABLE_STATUSES = (502, 503, 504)
+
+# find_teammates: teammates returned, search-users page size and how many candidates are scored at most
+TEAMMATES_TOP_K = int(os.getenv("TEAMMATES_TOP_K", "10"))
+TEAMMATES_PAGE_SIZE = int(os.getenv("TEAMMATES_PAGE_SIZE", "100"))
+TEAMMATES_MAX_CANDIDATES = int(os.getenv("TEAMMATES_MAX_CANDIDATES", "1000"))
+
+# Batch lookups (get_users_by_ids, ...): ids per bulk request (the backend accepts up to 200)
+# and bulk requests in flight per call
+AGENT_TOOLS_BATCH_SIZE = int(os.getenv("AGENT_TOOLS_BATCH_SIZE", "100"))
+AGENT_TOOLS_BATCH_CONCURRENCY = int(os.getenv("AGENT_TOOLS_BATCH_CONCURRENCY", "4"))
+# A bulk route that answered 404/405 (older backend) is not tried again for this long
+BULK_ROUTE_RETRY_AFTER = 300.0
+
+class NodeAPIError(Exception):
+    """Non-200 response from the Node API (never cached)"""
+
+
+# Endpoint template of the request in flight, so new TCP connections are attributed to it
+_current_endpoint: contextvars.ContextVar[str] = contextvars.ContextVar("agent_tools_endpoint", default="unknown")
+
+
+class AgentToolsStats:
+    """Per-endpoint request, retry, connection-reuse and latency counters"""
+
+    def __init__(self, window: int = 256):
+        self._lock = threading.Lock()
+        self._window = window
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def _entry(self, endpoint: str) -> Dict[str, Any]:
+        entry = self._endpoints.get(endpoint)
+        if entry is None:
+            entry = self._endpoints[endpoint] = {
+                "requests": 0, "errors": 0, "retries": 0, "connects": 0,
+                "total_ms": 0.0, "max_ms": 0.0, "recent_ms": deque(maxlen=self._window)
+            }
+        return entry
+
+    def record_request(self, endpoint: str, elapsed_ms: float, error: bool):
+        with self._lock:
+            entry = self._entry(endpoint)
+            entry["requests"] += 1
+            entry["errors"] += int(error)
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["recent_ms"].append(elapsed_ms)
+
+    def record_retry(self, endpoint: str):
+        with self._lock:
+            self._entry(endpoint)["retries"] += 1
+
+    def record_connect(self, endpoint: str):
+        with self._lock:
+            self._entry(endpoint)["connects"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            snapshot = {endpoint: dict(entry, recent_ms=sorted(entry["recent_ms"]))
+                        for endpoint, entry in self._endpoints.items()}
+        endpoints = {}
+        for endpoint, entry in snapshot.items():
+            recent, requests_made = entry["recent_ms"], entry["requests"]
+            endpoints[endpoint] = {
+                "requests": requests_made,
+                "errors": entry["errors"],
+                "retries": entry["retries"],
+                "new_connections": entry["connects"],
+                "connection_reuse_ratio": round(1 - min(entry["connects"], requests_made) / requests_made, 3) if requests_made else None,
+                "avg_ms": round(entry["total_ms"] / requests_made, 1) if requests_made else None,
+                "p50_ms": round(recent[len(recent) // 2], 1) if recent else None,
+                "p95_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 1) if recent else None,
+                "max_ms": round(entry["max_ms"], 1)
+            }
+        return endpoints
+
+
+class _CountingHTTPConnection(HTTPConnection):
+    def connect(self):
+        agent_tools_stats.record_connect(_current_endpoint.get())
+        super().connect()
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        agent_tools_stats.record_connect(_current_endpoint.get())
+        super().connect()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools count every TCP connect (a request without one reused a kept-alive connection)"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool
+        }
+
+
+def create_session(pool_size: int = AGENT_TOOLS_POOL_SIZE) -> requests.Session:
+    """Keep-alive session; connections beyond pool_size are opened on demand and closed after use"""
+    session = requests.Session()
+    adapter = PooledAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=False)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class TeammateRanker:
+    """
+    Streaming top-k teammate scoring
+
+    The skill sets are built once per search; each candidate then costs one set
+    intersection, and only candidates beating the current k-th best enter a
+    bounded min-heap, so memory stays O(k) however many candidates are fed in.
+    """
+
+    def __init__(self, required_skills: List[str], user_skills: List[str], k: int = TEAMMATES_TOP_K):
+        self.required_count = len(set(required_skills))
+        # Skills the user still needs; a candidate's complement is its overlap with these
+        self.needed = set(required_skills) - set(user_skills)
+        self.k = max(0, k)
+        self.scored = 0
+        # (match_score, -position, candidate, complement) -- the root is the weakest kept entry;
+        # on equal scores the later candidate loses, matching a stable sort of the full list
+        self._heap: List[tuple] = []
+
+    def add(self, candidates: Iterable[Dict[str, Any]]):
+        if not self.needed or not self.k:
+            return
+        heap, k, needed, required_count = self._heap, self.k, self.needed, self.required_count
+        for candidate in candidates:
+            position = self.scored
+            self.scored += 1
+            complement = needed.intersection(candidate.get("skills", ()))
+            if not complement:
+                continue
+            match_score = round(len(complement) / required_count * 10, 2)  # Scale to 0-10
+            if len(heap) < k:
+                heapq.heappush(heap, (match_score, -position, candidate, complement))
+            elif match_score > heap[0][0]:
+                heapq.heapreplace(heap, (match_score, -position, candidate, complement))
+
+    def results(self) -> List[Dict[str, Any]]:
+        """Best k candidates by match_score (ties in stream order) with match_score and complement_skills"""
+        return [
+            {
+                **candidate,
+                "match_score": match_score,
+                "complement_skills": list(complement)
+            }
+            for match_score, _, candidate, complement in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        ]
+
+
+def chunked(items: List[Any], size: int) -> List[List[Any]]:
+    return [items[start:start + size] for start in range(0, len(items), max(1, size))]
+
+
+# Bulk route -> monotonic time before which it is treated as missing
+_bulk_unavailable_until: Dict[str, float] = {}
+
+
+def bulk_route_available(endpoint: str) -> bool:
+    return _bulk_unavailable_until.get(endpoint, 0.0) <= time.monotonic()
+
+
+def mark_bulk_route_unavailable(endpoint: str, status_code: int):
+    if bulk_route_available(endpoint):
+        print(f"[WARN] Bulk route {endpoint} returned {status_code}, falling back to single gets")
+    _bulk_unavailable_until[endpoint] = time.monotonic() + BULK_ROUTE_RETRY_AFTER
+
+
+def collect_user_context(calls: Dict[str, tuple], done: Dict[str, Any], started: float) -> Dict[str, Any]:
+    """Assemble AsyncAgentTools.fetch_user_context's result; parts not in done get their default and are listed as missing"""
+    context = {"missing": [], "elapsed_ms": round((time.monotonic() - started) * 1000, 1)}
+    for part, (_, default) in calls.items():
+        if part in done:
+            context[part] = done[part]
+        else:
+            context[part] = default
+            context["missing"].append(part)
+    if context["missing"]:
+        print(f"[WARN] User context incomplete after {context['elapsed_ms']}ms, missing: {context['missing']}")
+    return context
+
+
 class AgentTools:
     """Tools for AI agents to access real database data via Node.js API"""
     
-    def __init__(self, node_api_url: str = NODE_API_URL):
+    def __init__(self, node_api_url: str = NODE_API_URL, pool_size: int = AGENT_TOOLS_POOL_SIZE,
+                 connect_timeout: float = AGENT_TOOLS_CONNECT_TIMEOUT,
+                 read_timeout: float = AGENT_TOOLS_READ_TIMEOUT,
+                 get_retries: int = AGENT_TOOLS_GET_RETRIES,
+                 retry_backoff: float = AGENT_TOOLS_RETRY_BACKOFF,
+                 batch_size: int = AGENT_TOOLS_BATCH_SIZE,
+                 batch_concurrency: int = AGENT_TOOLS_BATCH_CONCURRENCY):
         self.node_api_url = node_api_url
         self.base_url = f"{node_api_url}/api/agent-tools"
+        self.pool_size = pool_size
+        self.session = create_session(pool_size)
+        self.timeout = (connect_timeout, read_timeout)
+        self.get_retries = max(0, get_retries)
+        self.retry_backoff = retry_backoff
+        self.batch_size = max(1, batch_size)
+        self.batch_concurrency = max(1, batch_concurrency)
+
+    def _request(self, method: str, endpoint: str, path: str, **kwargs) -> requests.Response:
+        """
+        Call the Node API on the pooled session and record its latency under the
+        endpoint template (e.g. "/user/{user_id}")
+
+        GETs are retried after connection errors and 502/503/504 with full-jitter
+        exponential backoff; read timeouts are not retried (the backend is slow, not gone).
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        attempts = 1 + (self.get_retries if method == "GET" else 0)
+        token = _current_endpoint.set(endpoint)
+        try:
+            for attempt in range(attempts):
+                last_attempt = attempt == attempts - 1
+                started = time.perf_counter()
+                try:
+                    with agent_tools_request_seconds.time(method=method, endpoint=endpoint, status="error") as labels, \
+                            span(endpoint, "agent_tools", method=method, attempt=attempt) as http_span:
+                        response = self.session.request(method, f"{self.base_url}{path}", **kwargs)
+                        labels["status"] = response.status_code
+                        http_span.set(status=response.status_code)
+                except requests.ConnectionError:
+                    agent_tools_stats.record_request(endpoint, (time.perf_counter() - started) * 1000, error=True)
+                    if last_attempt:
+                        raise
+                except requests.RequestException:
+                    agent_tools_stats.record_request(endpoint, (time.perf_counter() - started) * 1000, error=True)
+                    raise
+                else:
+                    agent_tools_stats.record_request(
+                        endpoint, (time.perf_counter() - started) * 1000, error=response.status_code >= 500
+                    )
+                    if last_attempt or response.status_code not in RETRYABLE_STATUSES:
+                        return response
+                    response.close()
+                agent_tools_stats.record_retry(endpoint)
+                time.sleep(random.uniform(0, self.retry_backoff * (2 ** attempt)))
+        finally:
+            _current_endpoint.reset(token)
+
+    def _user_resource(self, name: str, resource: str, endpoint: str, user_id: str, key: str,
+                       default: Callable[[], Any]) -> Any:
+        """
+        Cached GET of a per-user resource
+
+        Args:
+            name: Public method name (for the error log)
+            resource: Cache resource type ("profile", "skills", ...)
+            endpoint: Endpoint template, e.g. "/skills/{user_id}"
+            user_id: MongoDB user ID
+            key: Response field holding the payload
+            default: Factory for the value returned when the call fails
+
+        Returns:
+            The payload; failures are logged and return default() without being cached
+        """
+        def load():
+            response = self._request("GET", endpoint, endpoint.format(user_id=user_id))
+            if response.status_code != 200:
+                raise NodeAPIError(f"HTTP {response.status_code}")
+            return response.json().get(key, default())
+
+        try:
+            return self._read_through(resource, user_id, load)
+        except Exception as e:
+            print(f"Error calling {name}: {e}")
+            return default()
+
+    def _read_through(self, resource: str, user_id: str, load: Callable[[], Any]) -> Any:
+        """Serve from agent_tools_cache; a stale entry is returned while the io pool refreshes it"""
+        state, value = agent_tools_cache.get(resource, user_id)
+        if state == FRESH:
+            return value
+        if state == STALE:
+            if agent_tools_cache.begin_refresh(resource, user_id):
+                try:
+                    io_executor.submit(self._refresh, resource, user_id, load)
+                except ExecutorSaturatedError:
+                    agent_tools_cache.end_refresh(resource, user_id, failed=True)
+            return value
+        started = time.time()
+        value = load()
+        agent_tools_cache.put(resource, user_id, value, started)
+        return value
+
+    def _refresh(self, resource: str, user_id: str, load: Callable[[], Any]):
+        started = time.time()
+        try:
+            agent_tools_cache.put(resource, user_id, load(), started)
+        except Exception as e:
+            print(f"[WARN] Background refresh of {resource} for user {user_id} failed: {e}")
+            agent_tools_cache.end_refresh(resource, user_id, failed=True)
+        else:
+            agent_tools_cache.end_refresh(resource, user_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pool_size": self.pool_size,
+            "connect_timeout": self.timeout[0],
+            "read_timeout": self.timeout[1],
+            "get_retries": self.get_retries,
+            "batch_size": self.batch_size,
+            "batch_concurrency": self.batch_concurrency,
+            "endpoints": agent_tools_stats.stats()
+        }
+
+    def close(self):
+        self.session.close()
     
     def get_user_profile(self, user_id: str) -> Dict[str, Any]:
         """
@@ -27,21 +373,7 @@ class AgentTools:
         Returns:
             User profile data
         """
-        try:
-            response = requests.get(
-                f"{self.base_url}/user/{user_id}",
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("user", {})
-            else:
-                print(f"Error getting user profile: {response.status_code}")
-                return {}
-        except Exception as e:
-            print(f"Error calling get_user_profile: {e}")
-            return {}
+        return self._user_resource("get_user_profile", "profile", "/user/{user_id}", user_id, "user", dict)
     
     def get_user_connections(self, user_id: str) -> List[Dict[str, Any]]:
         """
@@ -53,21 +385,7 @@ class AgentTools:
         Returns:
             List of connected users
         """
-        try:
-            response = requests.get(
-                f"{self.base_url}/connections/{user_id}",
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("connections", [])
-            else:
-                print(f"Error getting connections: {response.status_code}")
-                return []
-        except Exception as e:
-            print(f"Error calling get_user_connections: {e}")
-            return []
+        return self._user_resource("get_user_connections", "connections", "/connections/{user_id}", user_id, "connections", list)
     
     def get_user_projects(self, user_id: str) -> List[Dict[str, Any]]:
         """
@@ -79,21 +397,7 @@ class AgentTools:
         Returns:
             List of user projects
         """
-        try:
-            response = requests.get(
-                f"{self.base_url}/projects/{user_id}",
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("projects", [])
-            else:
-                print(f"Error getting projects: {response.status_code}")
-                return []
-        except Exception as e:
-            print(f"Error calling get_user_projects: {e}")
-            return []
+        return self._user_resource("get_user_projects", "projects", "/projects/{user_id}", user_id, "projects", list)
     
     def get_user_hackathons(self, user_id: str) -> List[Dict[str, Any]]:
         """
@@ -105,21 +409,7 @@ class AgentTools:
         Returns:
             List of hackathons user participated in
         """
-        try:
-            response = requests.get(
-                f"{self.base_url}/hackathons/{user_id}",
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("hackathons", [])
-            else:
-                print(f"Error getting hackathons: {response.status_code}")
-                return []
-        except Exception as e:
-            print(f"Error calling get_user_hackathons: {e}")
-            return []
+        return self._user_resource("get_user_hackathons", "hackathons", "/hackathons/{user_id}", user_id, "hackathons", list)
     
     def get_user_skills(self, user_id: str) -> List[str]:
         """
@@ -131,21 +421,131 @@ class AgentTools:
         Returns:
             List of user skills
         """
-        try:
-            response = requests.get(
-                f"{self.base_url}/skills/{user_id}",
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("skills", [])
+        return self._user_resource("get_user_skills", "skills", "/skills/{user_id}", user_id, "skills", list)
+    
+    def _map_capped(self, fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """
+        fn over items on the fan-out pool with at most batch_concurrency in flight; results in items order
+
+        Callers usually already hold an io worker, so waiting on io pool futures here could starve
+        that pool. Already on a fan-out worker (or with its queue full) items run on this thread.
+        """
+        if fanout_executor.in_worker():
+            return [fn(item) for item in items]
+        results: List[Any] = [None] * len(items)
+        in_flight = {}
+        for index, item in enumerate(items):
+            if len(in_flight) >= self.batch_concurrency:
+                done, _ = wait_futures(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[in_flight.pop(future)] = future.result()
+            try:
+                in_flight[fanout_executor.submit(fn, item)] = index
+            except ExecutorSaturatedError:
+                results[index] = fn(item)
+        for future, index in in_flight.items():
+            results[index] = future.result()
+        return results
+
+    def _by_ids(self, name: str, resource: str, endpoint: str, user_ids: List[str], key: str,
+                default: Callable[[], Any], single: Callable[[str], Any]) -> List[Any]:
+        """
+        Batch lookup of a per-user resource
+
+        Fresh cache entries are served as is; the other ids go to the bulk route in
+        chunks of batch_size, batch_concurrency chunks at a time, and the results are
+        cached. If the bulk route is missing (older backend) those ids fall back to
+        single gets run with the same concurrency cap.
+
+        Args:
+            name: Public method name (for the error log)
+            resource: Cache resource type ("profile", "skills", "projects")
+            endpoint: Bulk route, e.g. "/skills/batch"
+            user_ids: MongoDB user IDs (duplicates allowed)
+            key: Response field holding the {user_id: value} map
+            default: Factory for ids the backend doesn't know or that failed
+            single: Per-id getter used when the bulk route is unavailable
+
+        Returns:
+            One value per entry of user_ids, in the same order
+        """
+        found: Dict[str, Any] = {}
+        pending = []
+        for user_id in dict.fromkeys(user_ids):
+            state, value = agent_tools_cache.get(resource, user_id)
+            if state == FRESH:
+                found[user_id] = value
             else:
-                print(f"Error getting skills: {response.status_code}")
-                return []
-        except Exception as e:
-            print(f"Error calling get_user_skills: {e}")
-            return []
+                pending.append(user_id)
+
+        def load_chunk(chunk: List[str]) -> Optional[Dict[str, Any]]:
+            """{user_id: value} for a chunk, or None when the bulk route is unavailable"""
+            if not bulk_route_available(endpoint):
+                return None
+            started = time.time()
+            try:
+                response = self._request("POST", endpoint, endpoint, json={"userIds": chunk})
+                if response.status_code in (404, 405):
+                    mark_bulk_route_unavailable(endpoint, response.status_code)
+                    return None
+                if response.status_code != 200:
+                    raise NodeAPIError(f"HTTP {response.status_code}")
+                values = response.json().get(key, {})
+            except Exception as e:
+                print(f"Error calling {name}: {e}")
+                return {}
+            for user_id, value in values.items():
+                agent_tools_cache.put(resource, user_id, value, started)
+            return values
+
+        chunks = chunked(pending, self.batch_size)
+        fallback = []
+        for chunk, values in zip(chunks, self._map_capped(load_chunk, chunks)):
+            if values is None:
+                fallback.extend(chunk)
+            else:
+                found.update(values)
+        found.update(zip(fallback, self._map_capped(single, fallback)))
+        return [found[user_id] if user_id in found else default() for user_id in user_ids]
+
+    def get_users_by_ids(self, user_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get many user profiles in ceil(N / batch_size) requests
+
+        Args:
+            user_ids: MongoDB user IDs
+
+        Returns:
+            Profiles in user_ids order ({} for unknown users)
+        """
+        return self._by_ids("get_users_by_ids", "profile", "/users/batch", user_ids, "users", dict,
+                            self.get_user_profile)
+
+    def get_skills_by_ids(self, user_ids: List[str]) -> List[List[str]]:
+        """
+        Get many users' skills in ceil(N / batch_size) requests
+
+        Args:
+            user_ids: MongoDB user IDs
+
+        Returns:
+            Skill lists in user_ids order ([] for unknown users)
+        """
+        return self._by_ids("get_skills_by_ids", "skills", "/skills/batch", user_ids, "skills", list,
+                            self.get_user_skills)
+
+    def get_projects_by_ids(self, user_ids: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Get many users' projects in ceil(N / batch_size) requests
+
+        Args:
+            user_ids: MongoDB user IDs
+
+        Returns:
+            Project lists in user_ids order
+        """
+        return self._by_ids("get_projects_by_ids", "projects", "/projects/batch", user_ids, "projects", list,
+                            self.get_user_projects)
     
     def get_all_users(self, skills: Optional[List[str]] = None, 
                      interests: Optional[List[str]] = None,
@@ -170,10 +570,9 @@ class AgentTools:
             if exclude_id:
                 params["excludeId"] = exclude_id
             
-            response = requests.get(
-                f"{self.base_url}/users",
-                params=params,
-                timeout=10
+            response = self._request(
+                "GET", "/users", "/users",
+                params=params
             )
             
             if response.status_code == 200:
@@ -189,7 +588,8 @@ class AgentTools:
     def search_users(self, skills: Optional[List[str]] = None,
                     interests: Optional[List[str]] = None,
                     exclude_id: Optional[str] = None,
-                    limit: int = 20) -> List[Dict[str, Any]]:
+                    limit: int = 20,
+                    offset: int = 0) -> List[Dict[str, Any]]:
         """
         Search users by skills or interests
         
@@ -198,6 +598,7 @@ class AgentTools:
             interests: Interests to search for
             exclude_id: Exclude specific user ID
             limit: Maximum number of results
+            offset: Number of matching users to skip (results are ordered by id)
             
         Returns:
             List of matching users
@@ -207,13 +608,13 @@ class AgentTools:
                 "skills": skills or [],
                 "interests": interests or [],
                 "excludeId": exclude_id,
-                "limit": limit
+                "limit": limit,
+                "offset": offset
             }
             
-            response = requests.post(
-                f"{self.base_url}/search-users",
-                json=payload,
-                timeout=10
+            response = self._request(
+                "POST", "/search-users", "/search-users",
+                json=payload
             )
             
             if response.status_code == 200:
@@ -226,56 +627,410 @@ class AgentTools:
             print(f"Error calling search_users: {e}")
             return []
     
-    def find_teammates(self, user_id: str, required_skills: List[str]) -> List[Dict[str, Any]]:
+    def iter_search_pages(self, skills: Optional[List[str]] = None,
+                          interests: Optional[List[str]] = None,
+                          exclude_id: Optional[str] = None,
+                          page_size: int = TEAMMATES_PAGE_SIZE,
+                          max_candidates: int = TEAMMATES_MAX_CANDIDATES) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream search_users results one page at a time
+
+        Stops after a short or failed page, after max_candidates users, or when a page
+        starts with the same user as the previous one (a backend without offset support).
+        """
+        offset, previous_first = 0, None
+        while offset < max_candidates:
+            limit = min(page_size, max_candidates - offset)
+            page = self.search_users(skills=skills, interests=interests, exclude_id=exclude_id,
+                                     limit=limit, offset=offset)
+            if not page or (offset and page[0].get("id") == previous_first):
+                return
+            yield page
+            if len(page) < limit:
+                return
+            offset += len(page)
+            previous_first = page[0].get("id")
+
+    def find_teammates(self, user_id: str, required_skills: List[str],
+                       user_skills: Optional[List[str]] = None,
+                       top_k: int = TEAMMATES_TOP_K,
+                       max_candidates: int = TEAMMATES_MAX_CANDIDATES,
+                       page_size: int = TEAMMATES_PAGE_SIZE) -> List[Dict[str, Any]]:
         """
         Find potential teammates based on required skills
         
         Args:
             user_id: Current user ID
             required_skills: Skills needed in teammates
+            user_skills: Current user's skills when the caller already has them (skips the lookup)
+            top_k: Number of teammates to return
+            max_candidates: Upper bound on candidates scored
+            page_size: Candidates fetched per search request
             
         Returns:
             List of potential teammates with match scores
         """
         try:
             # Get current user's skills
-            user_skills = self.get_user_skills(user_id)
-            
-            # Search for users with complementary skills
-            candidates = self.search_users(
-                skills=required_skills,
-                exclude_id=user_id,
-                limit=20
-            )
+            if user_skills is None:
+                user_skills = self.get_user_skills(user_id)
             
-            # Calculate match scores
-            teammates = []
-            for candidate in candidates:
-                candidate_skills = set(candidate.get("skills", []))
-                required_set = set(required_skills)
-                user_set = set(user_skills)
-                
-                # Skills that candidate has that user needs
-                complement_skills = list(required_set - user_set & candidate_skills)
-                
-                # Match score based on complementary skills
-                match_score = len(complement_skills) / len(required_set) if required_set else 0
-                
-                if match_score > 0:
-                    teammates.append({
-                        **candidate,
-                        "match_score": round(match_score * 10, 2),  # Scale to 0-10
-                        "complement_skills": complement_skills
-                    })
-            
-            # Sort by match score
-            teammates.sort(key=lambda x: x["match_score"], reverse=True)
-            
-            return teammates[:10]  # Return top 10
+            # Score users with complementary skills as their pages arrive
+            ranker = TeammateRanker(required_skills, user_skills, top_k)
+            for page in self.iter_search_pages(skills=required_skills, exclude_id=user_id,
+                                               page_size=page_size, max_candidates=max_candidates):
+                ranker.add(page)
+            return ranker.results()
             
         except Exception as e:
             print(f"Error finding teammates: {e}")
             return []
 
+
+class AsyncAgentTools:
+    """
+    asyncio-native AgentTools for the async FastAPI handlers: same methods and
+    return shapes, no thread hop, safe to asyncio.gather
+
+    Requests share one pooled httpx.AsyncClient per event loop; transport,
+    retry and stats behaviour match AgentTools (stats land in the same
+    per-endpoint table) and per-user resources use the same cache.
+    """
+
+    def __init__(self, node_api_url: str = NODE_API_URL, pool_size: int = AGENT_TOOLS_POOL_SIZE,
+                 connect_timeout: float = AGENT_TOOLS_CONNECT_TIMEOUT,
+                 read_timeout: float = AGENT_TOOLS_READ_TIMEOUT,
+                 get_retries: int = AGENT_TOOLS_GET_RETRIES,
+                 retry_backoff: float = AGENT_TOOLS_RETRY_BACKOFF,
+                 batch_size: int = AGENT_TOOLS_BATCH_SIZE,
+                 batch_concurrency: int = AGENT_TOOLS_BATCH_CONCURRENCY):
+        self.node_api_url = node_api_url
+        self.base_url = f"{node_api_url}/api/agent-tools"
+        self.pool_size = pool_size
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.get_retries = max(0, get_retries)
+        self.retry_backoff = retry_backoff
+        self.batch_size = max(1, batch_size)
+        self.batch_concurrency = max(1, batch_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refresh_tasks = set()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # An AsyncClient is bound to the loop it first ran on; rebuild if the service loop changed (tests)
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=None, max_keepalive_connections=self.pool_size)
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def _request(self, method: str, endpoint: str, path: str, **kwargs) -> httpx.Response:
+        """Async AgentTools._request: GETs retried after connection errors and 502/503/504"""
+        async def trace(event_name: str, info: Dict[str, Any]):
+            if event_name == "connection.connect_tcp.complete":
+                agent_tools_stats.record_connect(endpoint)
+
+        client = self._get_client()
+        attempts = 1 + (self.get_retries if method == "GET" else 0)
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            started = time.perf_counter()
+            try:
+                with agent_tools_request_seconds.time(method=method, endpoint=endpoint, status="error") as labels, \
+                        span(endpoint, "agent_tools", method=method, attempt=attempt) as http_span:
+                    response = await client.request(
+                        method, f"{self.base_url}{path}", extensions={"trace": trace}, **kwargs
+                    )
+                    labels["status"] = response.status_code
+                    http_span.set(status=response.status_code)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError):
+                agent_tools_stats.record_request(endpoint, (time.perf_counter() - started) * 1000, error=True)
+                if last_attempt:
+                    raise
+            except httpx.HTTPError:
+                agent_tools_stats.record_request(endpoint, (time.perf_counter() - started) * 1000, error=True)
+                raise
+            else:
+                agent_tools_stats.record_request(
+                    endpoint, (time.perf_counter() - started) * 1000, error=response.status_code >= 500
+                )
+                if last_attempt or response.status_code not in RETRYABLE_STATUSES:
+                    return response
+            agent_tools_stats.record_retry(endpoint)
+            await asyncio.sleep(random.uniform(0, self.retry_backoff * (2 ** attempt)))
+
+    async def _load(self, method: str, endpoint: str, path: str, key: str,
+                    default: Callable[[], Any], **kwargs) -> Any:
+        """Request and unwrap data[key]; raises NodeAPIError on a non-200 response"""
+        response = await self._request(method, endpoint, path, **kwargs)
+        if response.status_code != 200:
+            raise NodeAPIError(f"HTTP {response.status_code}")
+        return response.json().get(key, default())
+
+    async def _fetch(self, name: str, method: str, endpoint: str, path: str, key: str,
+                     default: Callable[[], Any], **kwargs) -> Any:
+        """_load with AgentTools error semantics: failures are logged and return default()"""
+        try:
+            return await self._load(method, endpoint, path, key, default, **kwargs)
+        except Exception as e:
+            print(f"Error calling {name}: {e}")
+            return default()
+
+    async def _user_resource(self, name: str, resource: str, endpoint: str, user_id: str, key: str,
+                             default: Callable[[], Any]) -> Any:
+        """Async AgentTools._user_resource (same cache)"""
+        try:
+            return await self._load_user_resource(resource, endpoint, user_id, key, default)
+        except Exception as e:
+            print(f"Error calling {name}: {e}")
+            return default()
+
+    async def _load_user_resource(self, resource: str, endpoint: str, user_id: str, key: str,
+                                  default: Callable[[], Any]) -> Any:
+        """Cached GET of a per-user resource; unlike _user_resource, failures raise"""
+        def load():
+            return self._load("GET", endpoint, endpoint.format(user_id=user_id), key, default)
+
+        return await self._read_through(resource, user_id, load)
+
+    async def _read_through(self, resource: str, user_id: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Serve from agent_tools_cache; a stale entry is returned while a background task refreshes it"""
+        state, value = agent_tools_cache.get(resource, user_id)
+        if state == FRESH:
+            return value
+        if state == STALE:
+            if agent_tools_cache.begin_refresh(resource, user_id):
+                task = asyncio.ensure_future(self._refresh(resource, user_id, load))
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+            return value
+        started = time.time()
+        value = await load()
+        agent_tools_cache.put(resource, user_id, value, started)
+        return value
+
+    async def _refresh(self, resource: str, user_id: str, load: Callable[[], Awaitable[Any]]):
+        started = time.time()
+        try:
+            agent_tools_cache.put(resource, user_id, await load(), started)
+        except Exception as e:
+            print(f"[WARN] Background refresh of {resource} for user {user_id} failed: {e}")
+            agent_tools_cache.end_refresh(resource, user_id, failed=True)
+        else:
+            agent_tools_cache.end_refresh(resource, user_id)
+
+    async def get_user_profile(self, user_id: str) -> Dict[str, Any]:
+        return await self._user_resource("get_user_profile", "profile", "/user/{user_id}", user_id, "user", dict)
+
+    async def get_user_connections(self, user_id: str) -> List[Dict[str, Any]]:
+        return await self._user_resource("get_user_connections", "connections", "/connections/{user_id}",
+                                         user_id, "connections", list)
+
+    async def get_user_projects(self, user_id: str) -> List[Dict[str, Any]]:
+        return await self._user_resource("get_user_projects", "projects", "/projects/{user_id}",
+                                         user_id, "projects", list)
+
+    async def get_user_hackathons(self, user_id: str) -> List[Dict[str, Any]]:
+        return await self._user_resource("get_user_hackathons", "hackathons", "/hackathons/{user_id}",
+                                         user_id, "hackathons", list)
+
+    async def get_user_skills(self, user_id: str) -> List[str]:
+        return await self._user_resource("get_user_skills", "skills", "/skills/{user_id}", user_id, "skills", list)
+
+    async def _by_ids(self, name: str, resource: str, endpoint: str, user_ids: List[str], key: str,
+                      default: Callable[[], Any], single: Callable[[str], Awaitable[Any]]) -> List[Any]:
+        """AgentTools._by_ids with the chunks (or fallback single gets) gathered under a semaphore"""
+        found: Dict[str, Any] = {}
+        pending = []
+        for user_id in dict.fromkeys(user_ids):
+            state, value = agent_tools_cache.get(resource, user_id)
+            if state == FRESH:
+                found[user_id] = value
+            else:
+                pending.append(user_id)
+
+        limit = asyncio.Semaphore(self.batch_concurrency)
+
+        async def load_chunk(chunk: List[str]) -> Optional[Dict[str, Any]]:
+            async with limit:
+                if not bulk_route_available(endpoint):
+                    return None
+                started = time.time()
+                try:
+                    response = await self._request("POST", endpoint, endpoint, json={"userIds": chunk})
+                    if response.status_code in (404, 405):
+                        mark_bulk_route_unavailable(endpoint, response.status_code)
+                        return None
+                    if response.status_code != 200:
+                        raise NodeAPIError(f"HTTP {response.status_code}")
+                    values = response.json().get(key, {})
+                except Exception as e:
+                    print(f"Error calling {name}: {e}")
+                    return {}
+            for user_id, value in values.items():
+                agent_tools_cache.put(resource, user_id, value, started)
+            return values
+
+        async def load_single(user_id: str) -> Any:
+            async with limit:
+                return await single(user_id)
+
+        chunks = chunked(pending, self.batch_size)
+        fallback = []
+        for chunk, values in zip(chunks, await asyncio.gather(*(load_chunk(chunk) for chunk in chunks))):
+            if values is None:
+                fallback.extend(chunk)
+            else:
+                found.update(values)
+        found.update(zip(fallback, await asyncio.gather(*(load_single(user_id) for user_id in fallback))))
+        return [found[user_id] if user_id in found else default() for user_id in user_ids]
+
+    async def get_users_by_ids(self, user_ids: List[str]) -> List[Dict[str, Any]]:
+        return await self._by_ids("get_users_by_ids", "profile", "/users/batch", user_ids, "users", dict,
+                                  self.get_user_profile)
+
+    async def get_skills_by_ids(self, user_ids: List[str]) -> List[List[str]]:
+        return await self._by_ids("get_skills_by_ids", "skills", "/skills/batch", user_ids, "skills", list,
+                                  self.get_user_skills)
+
+    async def get_projects_by_ids(self, user_ids: List[str]) -> List[List[Dict[str, Any]]]:
+        return await self._by_ids("get_projects_by_ids", "projects", "/projects/batch", user_ids, "projects", list,
+                                  self.get_user_projects)
+
+    async def get_all_users(self, skills: Optional[List[str]] = None,
+                            interests: Optional[List[str]] = None,
+                            exclude_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        params = {}
+        if skills:
+            params["skills"] = ",".join(skills)
+        if interests:
+            params["interests"] = ",".join(interests)
+        if exclude_id:
+            params["excludeId"] = exclude_id
+        return await self._fetch("get_all_users", "GET", "/users", "/users", "users", list, params=params)
+
+    async def search_users(self, skills: Optional[List[str]] = None,
+                           interests: Optional[List[str]] = None,
+                           exclude_id: Optional[str] = None,
+                           limit: int = 20,
+                           offset: int = 0) -> List[Dict[str, Any]]:
+        payload = {
+            "skills": skills or [],
+            "interests": interests or [],
+            "excludeId": exclude_id,
+            "limit": limit,
+            "offset": offset
+        }
+        return await self._fetch("search_users", "POST", "/search-users", "/search-users", "users", list, json=payload)
+
+    async def iter_search_pages(self, skills: Optional[List[str]] = None,
+                                interests: Optional[List[str]] = None,
+                                exclude_id: Optional[str] = None,
+                                page_size: int = TEAMMATES_PAGE_SIZE,
+                                max_candidates: int = TEAMMATES_MAX_CANDIDATES) -> AsyncIterator[List[Dict[str, Any]]]:
+        """AgentTools.iter_search_pages as an async generator"""
+        offset, previous_first = 0, None
+        while offset < max_candidates:
+            limit = min(page_size, max_candidates - offset)
+            page = await self.search_users(skills=skills, interests=interests, exclude_id=exclude_id,
+                                           limit=limit, offset=offset)
+            if not page or (offset and page[0].get("id") == previous_first):
+                return
+            yield page
+            if len(page) < limit:
+                return
+            offset += len(page)
+            previous_first = page[0].get("id")
+
+    async def find_teammates(self, user_id: str, required_skills: List[str],
+                             user_skills: Optional[List[str]] = None,
+                             top_k: int = TEAMMATES_TOP_K,
+                             max_candidates: int = TEAMMATES_MAX_CANDIDATES,
+                             page_size: int = TEAMMATES_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """AgentTools.find_teammates; without user_skills the lookup overlaps the first search page"""
+        skills_task = None if user_skills is not None else asyncio.ensure_future(self.get_user_skills(user_id))
+        try:
+            ranker = None
+            async for page in self.iter_search_pages(skills=required_skills, exclude_id=user_id,
+                                                     page_size=page_size, max_candidates=max_candidates):
+                if ranker is None:
+                    if skills_task is not None:
+                        user_skills = await skills_task
+                    ranker = TeammateRanker(required_skills, user_skills, top_k)
+                ranker.add(page)
+            return ranker.results() if ranker is not None else []
+        except Exception as e:
+            print(f"Error finding teammates: {e}")
+            return []
+        finally:
+            if skills_task is not None and not skills_task.done():
+                skills_task.cancel()
+
+    def _user_context_calls(self) -> Dict[str, tuple]:
+        """
+        part name -> (fetch coroutine function, value used when the part is missing)
+
+        The fetches raise on failure (instead of returning the default like the
+        public getters) so fetch_user_context can list failed parts as missing.
+        """
+        def part(resource: str, endpoint: str, key: str, default: Callable[[], Any]):
+            return lambda user_id: self._load_user_resource(resource, endpoint, user_id, key, default)
+
+        return {
+            "profile": (part("profile", "/user/{user_id}", "user", dict), {}),
+            "projects": (part("projects", "/projects/{user_id}", "projects", list), []),
+            "hackathons": (part("hackathons", "/hackathons/{user_id}", "hackathons", list), []),
+            "connections": (part("connections", "/connections/{user_id}", "connections", list), []),
+        }
+
+    async def fetch_user_context(self, user_id: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Fetch profile, projects, hackathons and connections concurrently under one deadline
+
+        Args:
+            user_id: MongoDB user ID
+            deadline: Overall time budget in seconds (default USER_CONTEXT_DEADLINE)
+
+        Returns:
+            {"profile", "projects", "hackathons", "connections", "missing", "elapsed_ms"};
+            parts that failed or didn't arrive in time are empty and listed in "missing"
+        """
+        deadline = USER_CONTEXT_DEADLINE if deadline is None else deadline
+        started = time.monotonic()
+        calls = self._user_context_calls()
+        tasks = {part: asyncio.ensure_future(fn(user_id)) for part, (fn, _) in calls.items()}
+        await asyncio.wait(tasks.values(), timeout=deadline)
+
+        done = {}
+        for part, task in tasks.items():
+            if task.done() and not task.cancelled() and task.exception() is None:
+                done[part] = task.result()
+            elif task.done() and not task.cancelled():
+                print(f"Error fetching user context {part}: {task.exception()}")
+            else:
+                task.cancel()
+        return collect_user_context(calls, done, started)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pool_size": self.pool_size,
+            "connect_timeout": self.timeout.connect,
+            "read_timeout": self.timeout.read,
+            "get_retries": self.get_retries,
+            "batch_size": self.batch_size,
+            "batch_concurrency": self.batch_concurrency,
+            "client_open": self._client is not None and not self._client.is_closed
+        }
+
+    async def aclose(self):
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+
 # Global instance
+agent_tools_stats = AgentToolsStats()
 agent_tools = AgentTools()
+async_agent_tools = AsyncAgentTools()
@@ -0,0 +1,186 @@
+"""
+Agent Tools Cache
+Per-user read-through cache for the Node API resources that change rarely
+(profile, skills, projects, hackathons, connections): TTL per resource type,
+stale-while-revalidate, LRU eviction under a memory cap, and explicit
+invalidation for when the Node backend updates a user
+"""
+
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Iterable
+from dotenv import load_dotenv
+
+load_dotenv()
+
+AGENT_TOOLS_CACHE_ENABLED = os.getenv("AGENT_TOOLS_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+# Memory cap over the cached JSON payloads; least recently used entries are evicted past it
+AGENT_TOOLS_CACHE_MAX_BYTES = int(os.getenv("AGENT_TOOLS_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+# After its TTL an entry is still served for this long while one background refresh replaces it
+AGENT_TOOLS_CACHE_STALE_TTL = float(os.getenv("AGENT_TOOLS_CACHE_STALE_TTL", "600"))
+# Shared secret the Node backend sends in X-Agent-Service-Token when invalidating;
+# while unset the invalidation endpoint rejects every call
+AGENT_SERVICE_TOKEN = os.getenv("AGENT_SERVICE_TOKEN", "")
+
+# Resource -> default TTL seconds (AGENT_TOOLS_CACHE_TTL_<RESOURCE> overrides)
+RESOURCE_TTL_DEFAULTS = {
+    "profile": 300,
+    "skills": 300,
+    "projects": 600,
+    "hackathons": 600,
+    "connections": 120,
+}
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+class AgentToolsCache:
+    """Thread-safe LRU of serialized Node API payloads keyed by (resource, user id)"""
+
+    def __init__(self, enabled: bool = AGENT_TOOLS_CACHE_ENABLED, max_bytes: int = AGENT_TOOLS_CACHE_MAX_BYTES,
+                 stale_ttl: float = AGENT_TOOLS_CACHE_STALE_TTL):
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl
+        self.ttls = {
+            resource: float(os.getenv(f"AGENT_TOOLS_CACHE_TTL_{resource.upper()}", str(ttl)))
+            for resource, ttl in RESOURCE_TTL_DEFAULTS.items()
+        }
+        self._lock = threading.Lock()
+        # (resource, user_id) -> (stored_at, payload)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._refreshing = set()
+        # (resource, user id or "*" = everyone) -> last invalidation time; loads of that
+        # resource started before it are not stored
+        self._invalidated: Dict[Tuple[str, str], float] = {}
+        self._counters = {
+            resource: {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0,
+                       "evictions": 0, "invalidations": 0}
+            for resource in RESOURCE_TTL_DEFAULTS
+        }
+
+    def _drop(self, key: Tuple[str, str]):
+        _, payload = self._entries.pop(key)
+        self._bytes -= len(payload)
+
+    def get(self, resource: str, user_id: str) -> Tuple[Optional[str], Any]:
+        """
+        Look up a cached resource
+
+        Returns:
+            (FRESH, value), (STALE, value) when past its TTL but inside the stale window
+            (caller should refresh), or (None, None) on a miss
+        """
+        if not self.enabled:
+            return None, None
+        key = (resource, user_id)
+        now = time.time()
+        with self._lock:
+            counters = self._counters[resource]
+            entry = self._entries.get(key)
+            if entry is None:
+                counters["misses"] += 1
+                return None, None
+            stored_at, payload = entry
+            age = now - stored_at
+            ttl = self.ttls[resource]
+            if age > ttl + self.stale_ttl:
+                self._drop(key)
+                counters["misses"] += 1
+                return None, None
+            self._entries.move_to_end(key)
+            state = FRESH if age <= ttl else STALE
+            counters["hits" if state == FRESH else "stale_hits"] += 1
+        return state, json.loads(payload)
+
+    def put(self, resource: str, user_id: str, value: Any, load_started: float):
+        """Store a loaded value unless the user was invalidated after the load began"""
+        if not self.enabled:
+            return
+        payload = json.dumps(value, default=str, separators=(",", ":")).encode("utf-8")
+        key = (resource, user_id)
+        with self._lock:
+            invalidated = max(self._invalidated.get(key, 0.0), self._invalidated.get((resource, "*"), 0.0))
+            if load_started <= invalidated or len(payload) > self.max_bytes:
+                return
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.time(), payload)
+            self._bytes += len(payload)
+            while self._bytes > self.max_bytes:
+                evicted = next(iter(self._entries))
+                self._drop(evicted)
+                self._counters[evicted[0]]["evictions"] += 1
+
+    def begin_refresh(self, resource: str, user_id: str) -> bool:
+        """Claim the background refresh for a stale entry; False if one is already running"""
+        key = (resource, user_id)
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._counters[resource]["refreshes"] += 1
+            return True
+
+    def end_refresh(self, resource: str, user_id: str, failed: bool = False):
+        with self._lock:
+            self._refreshing.discard((resource, user_id))
+            if failed:
+                self._counters[resource]["refresh_errors"] += 1
+
+    def invalidate(self, user_id: Optional[str] = None, resources: Optional[Iterable[str]] = None) -> int:
+        """
+        Drop cached resources
+
+        Args:
+            user_id: User whose entries to drop (None = every user)
+            resources: Resource types to drop (None = all)
+
+        Returns:
+            Number of entries removed
+        """
+        wanted = set(resources) if resources else set(RESOURCE_TTL_DEFAULTS)
+        now = time.time()
+        with self._lock:
+            keys = [key for key in self._entries
+                    if key[0] in wanted and (user_id is None or key[1] == user_id)]
+            for key in keys:
+                self._drop(key)
+                self._counters[key[0]]["invalidations"] += 1
+            for resource in wanted:
+                self._invalidated[(resource, user_id or "*")] = now
+            if len(self._invalidated) > 10000:
+                # Only loads still in flight care about old invalidations
+                cutoff = now - 300
+                self._invalidated = {marker: at for marker, at in self._invalidated.items() if at >= cutoff}
+        return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = {resource: dict(values) for resource, values in self._counters.items()}
+            entries, size = len(self._entries), self._bytes
+        resources = {}
+        for resource, values in counters.items():
+            lookups = values["hits"] + values["stale_hits"] + values["misses"]
+            resources[resource] = {
+                "ttl": self.ttls[resource],
+                "hit_ratio": round((values["hits"] + values["stale_hits"]) / lookups, 4) if lookups else None,
+                **values
+            }
+        return {
+            "enabled": self.enabled,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "stale_ttl": self.stale_ttl,
+            "resources": resources
+        }
+
+
+# Global instance
+agent_tools_cache = AgentToolsCache()
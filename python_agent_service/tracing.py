@@ -0,0 +1,227 @@
+"""
+Request Tracing
+Request-scoped timing spans (endpoint, graph node, LLM call, Node API and
+GitHub HTTP calls) linked by a request id and exported through a non-blocking
+queue to a local file in Chrome trace-event format (chrome://tracing, Perfetto)
+
+The file is a JSON array written one event per line ("[" first, then
+"{...},"); the trace viewers accept the unterminated array, and each line
+minus its trailing comma is a standalone JSON object.
+"""
+
+import os
+import json
+import time
+import uuid
+import queue
+import threading
+import itertools
+import contextvars
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Iterator
+from dotenv import load_dotenv
+
+load_dotenv()
+
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() in ("1", "true", "yes")
+TRACE_FILE = os.getenv("TRACE_FILE", str(Path(__file__).parent / "traces.jsonl"))
+# Spans waiting for the writer thread; further spans are dropped (and counted) when full
+TRACE_QUEUE_SIZE = int(os.getenv("TRACE_QUEUE_SIZE", "10000"))
+
+_request_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("trace_request_id", default=None)
+_parent_span: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("trace_parent_span", default=None)
+
+_PID = os.getpid()
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def current_request_id() -> Optional[str]:
+    return _request_id.get()
+
+
+class Span:
+    """Open span; args added while it runs are exported with it"""
+
+    __slots__ = ("name", "cat", "span_id", "parent_id", "request_id", "args", "start_us")
+
+    def __init__(self, name: str, cat: str, request_id: Optional[str], parent_id: Optional[str],
+                 args: Dict[str, Any]):
+        self.name = name
+        self.cat = cat
+        self.span_id = uuid.uuid4().hex[:12]
+        self.parent_id = parent_id
+        self.request_id = request_id
+        self.args = args
+        self.start_us = time.time_ns() // 1000
+
+    def set(self, **args):
+        self.args.update(args)
+
+
+class TraceExporter:
+    """Queue spans from any thread; a daemon thread appends them to the trace file"""
+
+    def __init__(self, path: Optional[str] = TRACE_FILE, enabled: bool = TRACING_ENABLED,
+                 max_queue: int = TRACE_QUEUE_SIZE):
+        self.path = path or None
+        self.enabled = enabled and self.path is not None
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max(1, max_queue))
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # One viewer row per (request, thread) so concurrent requests don't overlap on a row
+        self._lanes: Dict[Tuple[Optional[str], int], int] = {}
+        self._lane_ids = itertools.count(1)
+        self._counters = {"exported": 0, "dropped": 0, "write_errors": 0}
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write_loop, name="trace-exporter", daemon=True)
+                self._thread.start()
+
+    def _lane(self, request_id: Optional[str]) -> Tuple[int, bool]:
+        key = (request_id, threading.get_ident())
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is not None:
+                return lane, False
+            if len(self._lanes) > 10000:
+                self._lanes.clear()
+            lane = self._lanes[key] = next(self._lane_ids)
+            return lane, True
+
+    def _put(self, event: Dict[str, Any]):
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            with self._lock:
+                self._counters["dropped"] += 1
+
+    def emit(self, span: Span, duration_us: int):
+        """Queue a finished span as a Chrome "complete" event; never blocks the caller"""
+        if not self.enabled:
+            return
+        self._start()
+        lane, is_new = self._lane(span.request_id)
+        if is_new:
+            self._put({
+                "name": "thread_name", "ph": "M", "pid": _PID, "tid": lane,
+                "args": {"name": f"req {span.request_id or '-'} / {threading.current_thread().name}"}
+            })
+        self._put({
+            "name": span.name,
+            "cat": span.cat,
+            "ph": "X",
+            "ts": span.start_us,
+            "dur": duration_us,
+            "pid": _PID,
+            "tid": lane,
+            "args": {
+                "request_id": span.request_id,
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                **span.args
+            }
+        })
+
+    def _write_loop(self):
+        path = Path(self.path)
+        while True:
+            event = self._queue.get()
+            if event is None:
+                return
+            batch = [event]
+            while len(batch) < 500:
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if event is None:
+                    self._write(path, batch)
+                    return
+                batch.append(event)
+            self._write(path, batch)
+
+    def _write(self, path: Path, batch):
+        try:
+            fresh = not path.exists() or path.stat().st_size == 0
+            with open(path, "a", encoding="utf-8") as f:
+                if fresh:
+                    f.write("[\n")
+                for event in batch:
+                    f.write(json.dumps(event, default=str) + ",\n")
+            with self._lock:
+                self._counters["exported"] += len(batch)
+        except OSError as e:
+            print(f"[WARN] Trace export failed: {e}")
+            with self._lock:
+                self._counters["write_errors"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "path": self.path,
+                "queued": self._queue.qsize(),
+                **self._counters
+            }
+
+    def close(self, timeout: float = 2.0):
+        """Flush queued spans and stop the writer thread"""
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+
+@contextmanager
+def request_scope(request_id: Optional[str] = None) -> Iterator[str]:
+    """Bind a request id for every span opened inside the block (spans nest under it)"""
+    request_id = request_id or new_request_id()
+    token = _request_id.set(request_id)
+    parent = _parent_span.set(None)
+    try:
+        yield request_id
+    finally:
+        _parent_span.reset(parent)
+        _request_id.reset(token)
+
+
+@contextmanager
+def span(name: str, cat: str, **args) -> Iterator[Span]:
+    """
+    Time a block as a child of the current span
+
+    Args:
+        name: Span name (route, node, LLM call site, HTTP endpoint)
+        cat: Category ("http", "graph", "llm", "agent_tools", "github")
+        **args: Extra attributes exported with the span
+    """
+    current = Span(name, cat, _request_id.get(), _parent_span.get(), args)
+    if not trace_exporter.enabled:
+        yield current
+        return
+    token = _parent_span.set(current.span_id)
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.args["error"] = type(e).__name__
+        raise
+    finally:
+        try:
+            _parent_span.reset(token)
+        except ValueError:
+            pass  # generator closed from another context
+        trace_exporter.emit(current, int((time.perf_counter() - started) * 1_000_000))
+
+
+# Global instance
+trace_exporter = TraceExporter()